@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Generate engines.md (mesh vs BREP hydrostatics tolerance report) from the
+engine comparison JSON files written by `python -m src.physics compare`
+
+Usage:
+    python3 docs/generate_engines_report.py docs/engines.md /tmp/physics-test/rp*.engines.json
+"""
+
+import os
+import sys
+import json
+
+
+def percent(value):
+    return f"{value * 100:.3f}%"
+
+
+def boat_section(report):
+    """Markdown section of one design: summary against tolerances, then every pose"""
+    summary = report['summary']
+    tolerances = report['tolerances']
+    status = 'within tolerance' if summary['within_tolerance'] else '**OUT OF TOLERANCE**'
+
+    lines = [
+        f"## {os.path.basename(report['design'])}",
+        "",
+        f"Mesh tolerance {report['mesh_tolerance_mm']} mm, {summary['poses']} poses: {status}.",
+        f"BREP {summary['brep_seconds']:.2f} s, mesh {summary['mesh_seconds']:.2f} s "
+        f"(+{summary['tessellation_seconds']:.2f} s tessellation), "
+        f"speedup {summary['speedup']}x.",
+        "",
+        "| | Max error | Tolerance |",
+        "|---|---|---|",
+        f"| Submerged volume | {percent(summary['max_volume_rel_error'])} | "
+        f"{percent(tolerances['volume_rel_error'])} |",
+        f"| Waterplane area | {percent(summary['max_waterplane_rel_error'])} | "
+        f"{percent(tolerances['waterplane_rel_error'])} |",
+        f"| CoB position | {summary['max_cob_error_mm']:.2f} mm | "
+        f"{tolerances['cob_error_mm']:.2f} mm |",
+        "",
+        "| z (mm) | Pitch (°) | Roll (°) | BREP volume (L) | Volume error | "
+        "BREP waterplane (m²) | Waterplane error | CoB error (mm) |",
+        "|---|---|---|---|---|---|---|---|",
+    ]
+    for pose in report['poses']:
+        lines.append(
+            f"| {pose['z_mm']:.1f} | {pose['pitch_deg']} | {pose['roll_deg']} | "
+            f"{pose['brep_liters']:.2f} | {percent(pose['volume_rel_error'])} | "
+            f"{pose['brep_waterplane_m2']:.4f} | {percent(pose['waterplane_rel_error'])} | "
+            f"{pose['cob_error_mm']:.2f} |")
+    lines.append("")
+    return lines
+
+
+def generate_engines_report(report_paths, output_path):
+    """Write the markdown report of all comparison files"""
+    lines = [
+        "---",
+        "layout: default",
+        "title: Mesh Hydrostatics Engine Accuracy",
+        "---",
+        "",
+        "# Mesh Hydrostatics Engine Accuracy",
+        "",
+        "Errors of the mesh engine (`ENGINE=mesh`) against the exact BREP engine at the",
+        "default tessellation tolerance. Generated by `scripts/test_physics.sh engines`.",
+        "",
+        "[← Back to Technical Details]({{ '/technical.html' | relative_url }})",
+        "",
+    ]
+    for path in report_paths:
+        with open(path) as f:
+            lines += boat_section(json.load(f))
+
+    with open(output_path, 'w') as f:
+        f.write('\n'.join(lines))
+    print(f"✓ Generated {output_path}")
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 3:
+        print(__doc__)
+        sys.exit(1)
+    generate_engines_report(sys.argv[2:], sys.argv[1])
@@ -5,7 +5,12 @@
 # Usage:
 #   ./scripts/test_physics.sh cog       # Test center of gravity
 #   ./scripts/test_physics.sh cob       # Test center of buoyancy
+#   ./scripts/test_physics.sh engines   # Mesh vs BREP tolerance check and docs/engines.md (rp1-rp3)
 #   ./scripts/test_physics.sh buoyancy  # Test buoyancy equilibrium solver
+#   ./scripts/test_physics.sh jacobian  # Analytic Jacobian must match central differences
+#   ./scripts/test_physics.sh broyden   # Broyden and Newton must find the same equilibrium
+#   ./scripts/test_physics.sh gz        # Serial and parallel GZ curves must be identical
+#   ./scripts/test_physics.sh mirror    # MIRROR=geometry and MIRROR=placement must agree
 #   ./scripts/test_physics.sh all       # Run all tests
 
 set -e
@@ -16,6 +21,22 @@ CONFIG="beaching"
 DESIGN="artifact/${BOAT}.${CONFIG}.design.FCStd"
 MATERIALS="constant/material/proa.json"
 MASS_ARTIFACT="artifact/${BOAT}.${CONFIG}.mass.json"
+BUOYANCY_ARTIFACT="artifact/${BOAT}.${CONFIG}.buoyancy.json"
+
+# Largest relative difference per Jacobian column (z, pitch, roll) between
+# the analytic Jacobian and central differences at the equilibrium
+JACOBIAN_TOLERANCE=0.05
+
+# Largest difference between the Broyden and Newton equilibria; both stop
+# at a residual norm of 1e-3 (0.1 % of the weight, 1 mm CoB/CoG offset)
+EQUILIBRIUM_Z_TOLERANCE_MM=1.0
+EQUILIBRIUM_ANGLE_TOLERANCE_DEG=0.1
+
+# Largest difference in mass and CoG between the two mirror modes; both
+# build the same mirror image, so only rounding (0.01 kg) and surface
+# approximation should differ
+MIRROR_MASS_TOLERANCE_KG=0.05
+MIRROR_COG_TOLERANCE_MM=0.5
 
 # Output to tmp to avoid polluting artifact/
 OUTPUT_DIR="/tmp/physics-test"
@@ -90,6 +111,37 @@ test_cob() {
     echo ""
 }
 
+test_engines() {
+    echo "=== Testing Mesh Engine Against BREP Engine ==="
+    echo ""
+
+    # Tolerance report for rp1-rp3; every boat is checked before failing
+    reports=""
+    failed=""
+    for boat in rp1 rp2 rp3; do
+        design="artifact/${boat}.${CONFIG}.design.FCStd"
+        if [[ ! -f "$design" ]]; then
+            echo "Design not found: $design"
+            echo "Run 'make design BOAT=$boat CONFIGURATION=$CONFIG' first"
+            exit 1
+        fi
+        $FREECAD_PYTHON -m src.physics compare \
+            --design "$design" \
+            --output "$OUTPUT_DIR/${boat}.engines.json" \
+            --check || failed="$failed $boat"
+        reports="$reports $OUTPUT_DIR/${boat}.engines.json"
+        echo ""
+    done
+
+    python3 docs/generate_engines_report.py docs/engines.md $reports
+
+    if [[ -n "$failed" ]]; then
+        echo "Mesh engine out of tolerance for:$failed"
+        exit 1
+    fi
+    echo ""
+}
+
 test_buoyancy() {
     echo "=== Testing Buoyancy Equilibrium Solver ==="
     echo ""
@@ -113,6 +165,186 @@ test_buoyancy() {
     echo ""
 }
 
+test_jacobian() {
+    echo "=== Testing Analytic Jacobian Against Central Differences ==="
+    echo ""
+
+    if [[ ! -f "$MASS_ARTIFACT" ]]; then
+        echo "Mass artifact not found: $MASS_ARTIFACT"
+        echo "Run 'make mass BOAT=$BOAT CONFIGURATION=$CONFIG' first"
+        exit 1
+    fi
+
+    echo "Solving equilibrium with the numeric Jacobian..."
+    $FREECAD_PYTHON -m src.buoyancy \
+        --design "$DESIGN" \
+        --mass "$MASS_ARTIFACT" \
+        --materials "$MATERIALS" \
+        --jacobian numeric --quiet \
+        --output "$OUTPUT_DIR/buoyancy_numeric.json"
+
+    # Both Jacobians at the equilibrium, compared column by column
+    $FREECAD_PYTHON -c "
+import json, sys
+import numpy as np
+from src.physics.center_of_buoyancy import HullModel
+from src.physics.center_of_mass import compute_cog_from_mass_artifact
+from src.buoyancy.__main__ import compute_jacobian, compute_analytic_jacobian
+eq = json.load(open('$OUTPUT_DIR/buoyancy_numeric.json'))['equilibrium']
+pose = (eq['z_offset_mm'], eq['pitch_deg'], eq['roll_deg'])
+cog = compute_cog_from_mass_artifact('$MASS_ARTIFACT', '$DESIGN')
+hull = HullModel('$DESIGN')
+numeric = compute_jacobian(hull, cog, *pose)
+analytic = compute_analytic_jacobian(cog, hull.center_of_buoyancy(*pose), *pose)
+print('  Numeric Jacobian:');  print(numeric)
+print('  Analytic Jacobian:'); print(analytic)
+errors = np.linalg.norm(analytic - numeric, axis=0) / np.linalg.norm(numeric, axis=0)
+for name, error in zip(('z', 'pitch', 'roll'), errors):
+    print(f'  {name} column: {error * 100:.2f}% relative difference')
+if max(errors) > $JACOBIAN_TOLERANCE:
+    sys.exit('Analytic Jacobian differs from central differences by more than $JACOBIAN_TOLERANCE')
+print('  Analytic Jacobian within tolerance')
+"
+    echo ""
+}
+
+test_broyden() {
+    echo "=== Testing Broyden Against Newton Equilibrium ==="
+    echo ""
+
+    if [[ ! -f "$MASS_ARTIFACT" ]]; then
+        echo "Mass artifact not found: $MASS_ARTIFACT"
+        echo "Run 'make mass BOAT=$BOAT CONFIGURATION=$CONFIG' first"
+        exit 1
+    fi
+
+    for method in newton broyden; do
+        echo "Solving equilibrium with $method..."
+        $FREECAD_PYTHON -m src.buoyancy \
+            --design "$DESIGN" \
+            --mass "$MASS_ARTIFACT" \
+            --materials "$MATERIALS" \
+            --method $method --quiet \
+            --output "$OUTPUT_DIR/buoyancy_${method}.json"
+    done
+
+    python3 -c "
+import json, sys
+newton = json.load(open('$OUTPUT_DIR/buoyancy_newton.json'))
+broyden = json.load(open('$OUTPUT_DIR/buoyancy_broyden.json'))
+if not (newton['converged'] and broyden['converged']):
+    sys.exit(f'Not converged: newton {newton[\"converged\"]}, broyden {broyden[\"converged\"]}')
+print(f'  Iterations: newton {newton[\"iterations\"]}, broyden {broyden[\"iterations\"]}')
+failed = False
+for key, tolerance in (('z_offset_mm', $EQUILIBRIUM_Z_TOLERANCE_MM),
+                       ('pitch_deg', $EQUILIBRIUM_ANGLE_TOLERANCE_DEG),
+                       ('roll_deg', $EQUILIBRIUM_ANGLE_TOLERANCE_DEG)):
+    difference = abs(newton['equilibrium'][key] - broyden['equilibrium'][key])
+    print(f'  {key}: newton {newton[\"equilibrium\"][key]}, broyden {broyden[\"equilibrium\"][key]} '
+          f'(difference {difference:.4f}, tolerance {tolerance})')
+    failed = failed or difference > tolerance
+if failed:
+    sys.exit('Broyden and Newton equilibria differ')
+print('  Broyden and Newton equilibria agree')
+"
+    echo ""
+}
+
+test_gz() {
+    echo "=== Testing Serial Against Parallel GZ Curve ==="
+    echo ""
+
+    if [[ ! -f "$BUOYANCY_ARTIFACT" ]]; then
+        echo "Buoyancy artifact not found: $BUOYANCY_ARTIFACT"
+        echo "Run 'make buoyancy BOAT=$BOAT CONFIGURATION=$CONFIG' first"
+        exit 1
+    fi
+
+    # No caches, so that both runs solve every heel angle themselves
+    echo "Serial run..."
+    $FREECAD_PYTHON -m src.gz \
+        --design "$DESIGN" \
+        --buoyancy "$BUOYANCY_ARTIFACT" \
+        --jobs 1 --quiet \
+        --output "$OUTPUT_DIR/gz_serial.json"
+
+    echo "Parallel run..."
+    $FREECAD_PYTHON -m src.gz \
+        --design "$DESIGN" \
+        --buoyancy "$BUOYANCY_ARTIFACT" \
+        --jobs 4 --quiet \
+        --output "$OUTPUT_DIR/gz_parallel.json"
+
+    # Both runs search every heel angle from the same start, so every point
+    # must be identical, not just close
+    python3 -c "
+import json, sys
+serial = json.load(open('$OUTPUT_DIR/gz_serial.json'))
+parallel = json.load(open('$OUTPUT_DIR/gz_parallel.json'))
+differences = [k for k in sorted(set(serial['summary']) | set(parallel['summary']))
+               if serial['summary'].get(k) != parallel['summary'].get(k)]
+for k in differences:
+    print(f'  summary {k}: serial {serial[\"summary\"].get(k)}, parallel {parallel[\"summary\"].get(k)}')
+for s, p in zip(serial['gz_curve'], parallel['gz_curve']):
+    if s != p:
+        differences.append(s['heel_deg'])
+        print(f'  heel {s[\"heel_deg\"]}: serial {s}, parallel {p}')
+if differences:
+    sys.exit('Serial and parallel GZ curves differ')
+print('  Serial and parallel GZ curves are identical')
+"
+    echo ""
+}
+
+test_mirror() {
+    echo "=== Testing MIRROR=geometry Against MIRROR=placement ==="
+    echo ""
+
+    # Each mode builds into its own artifact directory, since make does not
+    # rebuild the base when only MIRROR changes
+    for mode in geometry placement; do
+        echo "Building $BOAT.$CONFIG with MIRROR=$mode..."
+        make --no-print-directory buoyancy BOAT=$BOAT CONFIGURATION=$CONFIG \
+            MIRROR=$mode ARTIFACT_DIR="$OUTPUT_DIR/mirror-$mode" > "$OUTPUT_DIR/mirror-$mode.log" 2>&1 || {
+            tail -20 "$OUTPUT_DIR/mirror-$mode.log"
+            exit 1
+        }
+    done
+
+    python3 -c "
+import os, json, sys
+def load(mode, stage):
+    return json.load(open(f'$OUTPUT_DIR/mirror-{mode}/$BOAT.$CONFIG.{stage}.json'))
+print('  File sizes:')
+for name in ('$BOAT.base.FCStd', '$BOAT.$CONFIG.design.FCStd'):
+    sizes = {mode: os.path.getsize(f'$OUTPUT_DIR/mirror-{mode}/{name}') for mode in ('geometry', 'placement')}
+    print(f'    {name}: geometry {sizes["geometry"] / 1e6:.2f} MB, placement {sizes["placement"] / 1e6:.2f} MB '
+          f'({(sizes["placement"] - sizes["geometry"]) / sizes["geometry"]:+.1%})')
+failed = False
+def check(name, geometry, placement, tolerance):
+    global failed
+    difference = abs(geometry - placement)
+    print(f'  {name}: geometry {geometry}, placement {placement} '
+          f'(difference {difference:.4f}, tolerance {tolerance})')
+    failed = failed or difference > tolerance
+geometry, placement = load('geometry', 'mass'), load('placement', 'mass')
+check('total_mass_kg', geometry['total_mass_kg'], placement['total_mass_kg'], $MIRROR_MASS_TOLERANCE_KG)
+for axis in 'xyz':
+    check(f'CoG {axis} (mm)', geometry['CoG'][axis], placement['CoG'][axis], $MIRROR_COG_TOLERANCE_MM)
+geometry, placement = load('geometry', 'buoyancy'), load('placement', 'buoyancy')
+if not (geometry['converged'] and placement['converged']):
+    sys.exit(f'Not converged: geometry {geometry["converged"]}, placement {placement["converged"]}')
+for key, tolerance in (('z_offset_mm', $EQUILIBRIUM_Z_TOLERANCE_MM),
+                       ('pitch_deg', $EQUILIBRIUM_ANGLE_TOLERANCE_DEG),
+                       ('roll_deg', $EQUILIBRIUM_ANGLE_TOLERANCE_DEG)):
+    check(key, geometry['equilibrium'][key], placement['equilibrium'][key], tolerance)
+if failed:
+    sys.exit('MIRROR=geometry and MIRROR=placement differ')
+print('  MIRROR=geometry and MIRROR=placement agree')
+"
+    echo ""
+}
+
 case "${1:-all}" in
     cog)
         test_cog
@@ -120,16 +352,36 @@ case "${1:-all}" in
     cob)
         test_cob
         ;;
+    engines)
+        test_engines
+        ;;
     buoyancy)
         test_buoyancy
         ;;
+    jacobian)
+        test_jacobian
+        ;;
+    broyden)
+        test_broyden
+        ;;
+    gz)
+        test_gz
+        ;;
+    mirror)
+        test_mirror
+        ;;
     all)
         test_cog
         test_cob
+        test_engines
         test_buoyancy
+        test_jacobian
+        test_broyden
+        test_gz
+        test_mirror
         ;;
     *)
-        echo "Usage: $0 {cog|cob|buoyancy|all}"
+        echo "Usage: $0 {cog|cob|engines|buoyancy|jacobian|broyden|gz|mirror|all}"
         exit 1
         ;;
 esac
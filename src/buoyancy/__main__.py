@@ -6,6 +6,29 @@ Uses Newton-Raphson iteration to find the pose (z, pitch, roll) where:
 1. Force equilibrium: buoyancy force = weight
 2. Moment equilibrium: CoB is directly below CoG (no pitch/roll moments)
 
+The Jacobian is computed from central differences (--jacobian numeric,
+the default, six extra CoB evaluations) or in closed form from the
+waterplane quantities returned with each CoB evaluation (--jacobian
+analytic; scripts/test_physics.sh jacobian compares the two).
+With --method broyden, that Jacobian is only computed for the first
+iteration and whenever progress stalls; in between it is corrected with
+rank-one secant (Broyden) updates from the steps already taken.
+
+With --table, the solver first converges on a precomputed hydrostatic lookup
+table (see src/lookup) and then polishes that pose on the exact hull, which
+usually takes only one or two exact Newton iterations.
+
+With --seed, the solver starts from the equilibrium of an existing
+buoyancy artifact (a previous build, or another configuration of the same
+boat) instead of bisecting for z at level trim. Among several seeds the
+converged one with the closest total mass is used; the --output file itself
+is never a seed, so a rebuild does not start from its own stale result.
+Since the solver stops within --tolerance of the equilibrium, a seeded
+result depends slightly on the seed: the Makefile only seeds with SEED=yes.
+Without a seed, --curves
+(hydrostatics artifact, see src/hydrostatics) gives the level-trim z by
+interpolation instead of bisection.
+
 Usage:
     python -m src.buoyancy \
         --design artifact/boat.design.FCStd \
@@ -30,8 +53,17 @@ except ImportError as e:
     print("This script must be run with FreeCAD's Python", file=sys.stderr)
     sys.exit(1)
 
-from src.physics.center_of_buoyancy import compute_center_of_buoyancy
+from src.physics.center_of_buoyancy import HullModel, ENGINES, select_pose
+from src.physics.mesh_hydrostatics import DEFAULT_MESH_TOLERANCE
 from src.physics.center_of_mass import compute_center_of_gravity
+from src.physics.lookup_table import HydrostaticTable
+from src.physics.hydrostatic_curves import HydrostaticCurves
+from src.physics.cache import DEFAULT_CACHE_SIZE
+from src.physics.disk_cache import DiskCache, DEFAULT_DISK_CACHE_SIZE_MB
+from src.physics.hydrostatic_derivatives import (
+    compute_hydrostatic_derivatives,
+    point_derivatives,
+)
 
 
 def extract_hull_breakdown(cob_result: dict) -> dict:
@@ -86,6 +118,9 @@ DEFAULT_MAX_ITERATIONS = 50
 DEFAULT_TOLERANCE = 1e-3  # Convergence tolerance for residuals
 DEFAULT_Z_STEP = 10.0     # mm, for numerical Jacobian
 DEFAULT_ANGLE_STEP = 0.1  # degrees, for numerical Jacobian
+JACOBIAN_METHODS = ('analytic', 'numeric')
+SOLVER_METHODS = ('newton', 'broyden')
+BROYDEN_STALL_RATIO = 0.9  # Refresh the Jacobian unless |r| shrinks at least this much
 
 
 def transform_point(point: dict, z_displacement: float, pitch_deg: float,
@@ -165,7 +200,7 @@ def compute_residuals(cog_result: dict, cob_result: dict,
     return np.array([force_residual, pitch_moment, roll_moment])
 
 
-def compute_jacobian(fcstd_path: str, cog_result: dict,
+def compute_jacobian(hull: HullModel, cog_result: dict,
                      z: float, pitch: float, roll: float,
                      z_step: float = DEFAULT_Z_STEP,
                      angle_step: float = DEFAULT_ANGLE_STEP) -> np.ndarray:
@@ -177,46 +212,92 @@ def compute_jacobian(fcstd_path: str, cog_result: dict,
     State = [z, pitch, roll]
     Residuals = [force, pitch_moment, roll_moment]
     """
+    # All six stencil poses are evaluated in one batch
+    steps = (z_step, angle_step, angle_step)
+    poses = []
+    for j, step in enumerate(steps):
+        for sign in (1, -1):
+            pose = [z, pitch, roll]
+            pose[j] += sign * step
+            poses.append(pose)
+    batch = hull.center_of_buoyancy_batch(poses)
+
     J = np.zeros((3, 3))
+    for j, step in enumerate(steps):
+        plus, minus = 2 * j, 2 * j + 1
+        r_plus = compute_residuals(cog_result, select_pose(batch, plus), *poses[plus])
+        r_minus = compute_residuals(cog_result, select_pose(batch, minus), *poses[minus])
+        J[:, j] = (r_plus - r_minus) / (2 * step)
+
+    return J
+
+
+def compute_analytic_jacobian(cog_result: dict, cob_result: dict,
+                              z: float, pitch: float, roll: float) -> np.ndarray:
+    """
+    Compute Jacobian matrix in closed form from waterplane quantities.
+
+    Uses the derivatives of buoyancy force and CoB with respect to the pose
+    (see src/physics/hydrostatic_derivatives.py) and the rigid-body motion
+    of the CoG. Needs no CoB evaluations beyond the one at the current pose.
 
-    # Compute derivatives with respect to z
-    cob_plus = compute_center_of_buoyancy(fcstd_path, z + z_step, pitch, roll)
-    cob_minus = compute_center_of_buoyancy(fcstd_path, z - z_step, pitch, roll)
-    r_plus = compute_residuals(cog_result, cob_plus, z + z_step, pitch, roll)
-    r_minus = compute_residuals(cog_result, cob_minus, z - z_step, pitch, roll)
-    J[:, 0] = (r_plus - r_minus) / (2 * z_step)
-
-    # Compute derivatives with respect to pitch
-    cob_plus = compute_center_of_buoyancy(fcstd_path, z, pitch + angle_step, roll)
-    cob_minus = compute_center_of_buoyancy(fcstd_path, z, pitch - angle_step, roll)
-    r_plus = compute_residuals(cog_result, cob_plus, z, pitch + angle_step, roll)
-    r_minus = compute_residuals(cog_result, cob_minus, z, pitch - angle_step, roll)
-    J[:, 1] = (r_plus - r_minus) / (2 * angle_step)
-
-    # Compute derivatives with respect to roll
-    cob_plus = compute_center_of_buoyancy(fcstd_path, z, pitch, roll + angle_step)
-    cob_minus = compute_center_of_buoyancy(fcstd_path, z, pitch, roll - angle_step)
-    r_plus = compute_residuals(cog_result, cob_plus, z, pitch, roll + angle_step)
-    r_minus = compute_residuals(cog_result, cob_minus, z, pitch, roll - angle_step)
-    J[:, 2] = (r_plus - r_minus) / (2 * angle_step)
+    J[i,j] = d(residual_i) / d(state_j)
+
+    State = [z, pitch, roll]
+    Residuals = [force, pitch_moment, roll_moment]
+    """
+    derivatives = compute_hydrostatic_derivatives(cob_result)
+
+    weight_N = cog_result['weight_N']
+    rotation_center = cob_result['pose'].get('rotation_center', cog_result['CoG'])
+    cog_world = transform_point(cog_result['CoG'], z, pitch, roll, rotation_center)
+    cog_derivatives = point_derivatives(cog_world, cob_result)
+
+    J = np.zeros((3, 3))
+    if weight_N > 0:
+        J[0, :] = np.array(derivatives['buoyancy_force_N']) / weight_N
+    J[1, :] = (np.array(derivatives['CoB']['y']) - np.array(cog_derivatives['y'])) / 1000.0
+    J[2, :] = (np.array(derivatives['CoB']['x']) - np.array(cog_derivatives['x'])) / 1000.0
 
     return J
 
 
-def estimate_initial_z(cog_result: dict, fcstd_path: str) -> float:
+def broyden_update(J: np.ndarray, step: np.ndarray,
+                   residual_change: np.ndarray) -> np.ndarray:
+    """
+    Rank-one secant correction of a Jacobian (Broyden's "good" update).
+
+    Returns J + (dr - J s) s^T / (s^T s), the closest matrix to J (in the
+    Frobenius norm) that maps the last step s onto the observed residual
+    change dr.
+    """
+    step_norm_sq = float(step @ step)
+    if step_norm_sq < 1e-18:
+        return J
+    return J + np.outer(residual_change - J @ step, step) / step_norm_sq
+
+
+def estimate_initial_z(cog_result: dict, hull: HullModel, curves=None) -> float:
     """
     Estimate initial z displacement to get buoyancy roughly equal to weight.
 
-    Uses a simple search to find z where buoyancy is close to weight.
+    Interpolates the hydrostatic curves if given (and the weight is within
+    them); otherwise uses a simple search to find z where buoyancy is close
+    to weight.
     """
     weight_N = cog_result['weight_N']
 
+    if curves is not None:
+        z = curves.z_for_weight(weight_N)
+        if z is not None:
+            return z
+
     # Binary search for z
     z_min, z_max = -5000.0, 0.0  # Search range in mm
 
     for _ in range(20):  # Binary search iterations
         z_mid = (z_min + z_max) / 2
-        cob = compute_center_of_buoyancy(fcstd_path, z_mid, 0, 0)
+        cob = hull.center_of_buoyancy(z_mid, 0, 0)
         buoyancy_N = cob['buoyancy_force_N']
 
         if buoyancy_N < weight_N:
@@ -231,29 +312,85 @@ def estimate_initial_z(cog_result: dict, fcstd_path: str) -> float:
     return z_mid
 
 
-def solve_equilibrium(fcstd_path: str, cog_result: dict,
+def load_seed_pose(paths: list, total_mass_kg: float):
+    """
+    Pick a starting pose from existing buoyancy artifacts.
+
+    Args:
+        paths: Candidate *.buoyancy.json paths (missing or unreadable files,
+               other artifacts and unconverged solutions are skipped)
+        total_mass_kg: Mass of the boat being solved
+
+    Returns:
+        Tuple ((z, pitch, roll), path) of the converged artifact whose total
+        mass is closest to total_mass_kg, or None if there is none
+    """
+    best = None
+    for path in paths:
+        try:
+            with open(path) as f:
+                artifact = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            continue
+        if artifact.get('validator') != 'buoyancy' or not artifact.get('converged'):
+            continue
+
+        eq = artifact['equilibrium']
+        pose = (eq['z_offset_mm'], eq['pitch_deg'], eq['roll_deg'])
+        mass_difference = abs(artifact.get('total_mass_kg', 0.0) - total_mass_kg)
+        if best is None or mass_difference < best[0]:
+            best = (mass_difference, pose, path)
+
+    if best is None:
+        return None
+    return best[1], best[2]
+
+
+def solve_equilibrium(hull: HullModel, cog_result: dict,
                       max_iterations: int = DEFAULT_MAX_ITERATIONS,
                       tolerance: float = DEFAULT_TOLERANCE,
+                      jacobian: str = 'numeric',
+                      initial_pose: tuple = None,
+                      method: str = 'newton',
+                      curves=None,
                       verbose: bool = True) -> dict:
     """
     Find equilibrium pose using Newton-Raphson iteration.
 
+    With method='broyden', the Jacobian is computed (analytic or numeric)
+    only for the first iteration and when the residual norm stalls or the
+    line search fails; other iterations apply a Broyden update and cost a
+    single CoB evaluation. iteration_history records under 'jacobian' which
+    Jacobian each step used ('analytic', 'numeric' or 'broyden').
+
     Args:
-        fcstd_path: Path to FreeCAD design file
+        hull: Hull geometry loaded from the FreeCAD design file (or any
+              object with the same center_of_buoyancy interface, such as a
+              HydrostaticTable)
         cog_result: Result from compute_center_of_gravity
         max_iterations: Maximum Newton-Raphson iterations
         tolerance: Convergence tolerance for residuals
+        jacobian: 'numeric' (central differences) or 'analytic' (closed
+                  form from waterplane quantities)
+        initial_pose: Optional (z, pitch, roll) starting point; by default z
+                      is estimated by bisection at level trim
+        method: 'newton' (fresh Jacobian every iteration) or 'broyden'
+                (secant updates between Jacobian refreshes)
+        curves: Optional HydrostaticCurves for the initial z estimate
         verbose: Print progress information
 
     Returns:
         Dictionary with equilibrium results
     """
     # Initial guess
-    if verbose:
-        print("  Estimating initial z displacement...")
-    z = estimate_initial_z(cog_result, fcstd_path)
-    pitch = 0.0
-    roll = 0.0
+    if initial_pose is not None:
+        z, pitch, roll = initial_pose
+    else:
+        if verbose:
+            print("  Estimating initial z displacement...")
+        z = estimate_initial_z(cog_result, hull, curves)
+        pitch = 0.0
+        roll = 0.0
 
     if verbose:
         print(f"  Initial guess: z={z:.1f}mm, pitch={pitch:.2f}°, roll={roll:.2f}°")
@@ -261,9 +398,15 @@ def solve_equilibrium(fcstd_path: str, cog_result: dict,
     iteration_history = []
     converged = False
 
+    # Broyden state: last Jacobian, state and residuals it was used at
+    J = None
+    previous_state = None
+    previous_residuals = None
+    refresh_jacobian = True
+
     for iteration in range(max_iterations):
         # Compute CoB at current pose
-        cob_result = compute_center_of_buoyancy(fcstd_path, z, pitch, roll)
+        cob_result = hull.center_of_buoyancy(z, pitch, roll)
 
         # Compute residuals (CoG is transformed to world frame internally)
         residuals = compute_residuals(cog_result, cob_result, z, pitch, roll)
@@ -304,8 +447,29 @@ def solve_equilibrium(fcstd_path: str, cog_result: dict,
                 print(f"  Converged after {iteration + 1} iterations")
             break
 
-        # Compute Jacobian
-        J = compute_jacobian(fcstd_path, cog_result, z, pitch, roll)
+        state = np.array([z, pitch, roll])
+        if method == 'broyden' and J is not None:
+            # Stalled progress means the secant model has drifted too far
+            previous_norm = np.linalg.norm(previous_residuals)
+            if residual_norm > BROYDEN_STALL_RATIO * previous_norm:
+                refresh_jacobian = True
+
+        if method == 'broyden' and not refresh_jacobian:
+            J = broyden_update(J, state - previous_state, residuals - previous_residuals)
+            iteration_history[-1]['jacobian'] = 'broyden'
+        else:
+            # Compute Jacobian (closed form needs a waterplane to work with)
+            waterplane_area = cob_result.get('waterplane', {}).get('area_mm2', 0.0)
+            if jacobian == 'analytic' and waterplane_area > 0:
+                J = compute_analytic_jacobian(cog_result, cob_result, z, pitch, roll)
+                iteration_history[-1]['jacobian'] = 'analytic'
+            else:
+                J = compute_jacobian(hull, cog_result, z, pitch, roll)
+                iteration_history[-1]['jacobian'] = 'numeric'
+            refresh_jacobian = False
+
+        previous_state = state
+        previous_residuals = residuals
 
         # Check if Jacobian is singular
         det = np.linalg.det(J)
@@ -357,7 +521,7 @@ def solve_equilibrium(fcstd_path: str, cog_result: dict,
             roll_new = roll + alpha * delta[2]
 
             # Evaluate residual at new point
-            cob_new = compute_center_of_buoyancy(fcstd_path, z_new, pitch_new, roll_new)
+            cob_new = hull.center_of_buoyancy(z_new, pitch_new, roll_new)
             residuals_new = compute_residuals(cog_result, cob_new, z_new, pitch_new, roll_new)
             new_norm = np.linalg.norm(residuals_new)
 
@@ -379,6 +543,8 @@ def solve_equilibrium(fcstd_path: str, cog_result: dict,
                 if verbose:
                     print(f"    Line search failed: no improvement found, taking small step")
                 alpha = min_alpha  # Take minimal step to avoid getting stuck
+                # The search direction was useless; don't trust J any longer
+                refresh_jacobian = True
             else:
                 if verbose:
                     print(f"    Line search: using best α={alpha:.3f}")
@@ -389,7 +555,7 @@ def solve_equilibrium(fcstd_path: str, cog_result: dict,
         roll += alpha * delta[2]
 
     # Final CoB computation
-    final_cob = compute_center_of_buoyancy(fcstd_path, z, pitch, roll)
+    final_cob = hull.center_of_buoyancy(z, pitch, roll)
     final_residuals = compute_residuals(cog_result, final_cob, z, pitch, roll)
 
     # Transform CoG to world frame for output
@@ -401,6 +567,7 @@ def solve_equilibrium(fcstd_path: str, cog_result: dict,
 
     return {
         'converged': converged,
+        'method': method,
         'iterations': len(iteration_history),
         'equilibrium': {
             'z_offset_mm': round(z, 2),
@@ -458,6 +625,33 @@ def main():
                         help=f'Maximum iterations (default: {DEFAULT_MAX_ITERATIONS})')
     parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
                         help=f'Convergence tolerance (default: {DEFAULT_TOLERANCE})')
+    parser.add_argument('--jacobian', choices=JACOBIAN_METHODS, default='numeric',
+                        help='Jacobian: central differences or closed form from '
+                             'waterplane quantities (default: numeric)')
+    parser.add_argument('--method', choices=SOLVER_METHODS, default='newton',
+                        help='Newton (Jacobian every iteration) or Broyden (secant updates, '
+                             'Jacobian refreshed only when progress stalls) (default: newton)')
+    parser.add_argument('--seed', nargs='*', default=[],
+                        help='Existing buoyancy.json artifacts to warm-start from (optional); '
+                             'the converged one with the closest mass is used, '
+                             'the --output file is ignored')
+    parser.add_argument('--curves',
+                        help='Path to hydrostatics.json artifact for the initial draft (optional)')
+    parser.add_argument('--table',
+                        help='Path to lookup.npz artifact: solve on the table first, '
+                             'then polish on the exact hull (optional, faster)')
+    parser.add_argument('--engine', choices=ENGINES, default='brep',
+                        help='Hydrostatics engine: exact OCC booleans or tessellated mesh (default: brep)')
+    parser.add_argument('--mesh-tolerance', type=float, default=DEFAULT_MESH_TOLERANCE,
+                        help=f'Tessellation tolerance in mm for the mesh engine (default: {DEFAULT_MESH_TOLERANCE})')
+    parser.add_argument('--fuse', action='store_true',
+                        help='Fuse the components of each hull (ama, vaka) into one solid at load time')
+    parser.add_argument('--cache-size', type=int, default=DEFAULT_CACHE_SIZE,
+                        help=f'Number of memoized pose evaluations, 0 to disable (default: {DEFAULT_CACHE_SIZE})')
+    parser.add_argument('--disk-cache',
+                        help='Directory of the persistent CoB cache (optional)')
+    parser.add_argument('--disk-cache-size-mb', type=float, default=DEFAULT_DISK_CACHE_SIZE_MB,
+                        help=f'Size cap of the persistent CoB cache (default: {DEFAULT_DISK_CACHE_SIZE_MB:.0f} MB)')
     parser.add_argument('--quiet', action='store_true',
                         help='Suppress progress output')
 
@@ -488,20 +682,92 @@ def main():
         print(f"  Total mass: {cog_result['total_mass_kg']:.2f} kg")
         print(f"  Weight: {cog_result['weight_N']:.2f} N")
 
+    # Load hull geometry once for all pose evaluations
+    if verbose:
+        print("  Loading hull geometry...")
+    disk_cache = DiskCache(args.disk_cache, args.disk_cache_size_mb) if args.disk_cache else None
+    hull = HullModel(args.design, engine=args.engine,
+                     mesh_tolerance=args.mesh_tolerance,
+                     cache_size=args.cache_size,
+                     disk_cache=disk_cache,
+                     fuse=args.fuse)
+
+    curves = HydrostaticCurves(args.curves) if args.curves and os.path.exists(args.curves) else None
+
+    # Warm start from a previous solution, if available
+    initial_pose = None
+    seed_paths = [path for path in args.seed
+                  if os.path.abspath(path) != os.path.abspath(args.output)]
+    seed = load_seed_pose(seed_paths, cog_result['total_mass_kg'])
+    if seed is not None:
+        initial_pose, seed_path = seed
+        if verbose:
+            print(f"  Seeding from {seed_path}")
+
+    # Coarse solve on the lookup table, if available
+    if args.table and os.path.exists(args.table):
+        if verbose:
+            print(f"  Running Newton-Raphson solver on lookup table {args.table}...")
+        table_result = solve_equilibrium(
+            HydrostaticTable(args.table),
+            cog_result,
+            max_iterations=args.max_iterations,
+            tolerance=args.tolerance,
+            initial_pose=initial_pose,
+            curves=curves,
+            verbose=verbose
+        )
+        if table_result['converged']:
+            eq = table_result['equilibrium']
+            initial_pose = (eq['z_offset_mm'], eq['pitch_deg'], eq['roll_deg'])
+        elif seed is None and verbose:
+            print("  Lookup table solve did not converge, starting from scratch")
+
     # Solve equilibrium
     if verbose:
         print("  Running Newton-Raphson solver...")
 
     result = solve_equilibrium(
-        args.design,
+        hull,
         cog_result,
         max_iterations=args.max_iterations,
         tolerance=args.tolerance,
+        jacobian=args.jacobian,
+        initial_pose=initial_pose,
+        method=args.method,
+        curves=curves,
         verbose=verbose
     )
 
-    # Add validator field
+    # A seed from a very different boat can lead Newton astray; retry cold
+    if not result['converged'] and seed is not None:
+        if verbose:
+            print("  Seeded solve did not converge, starting from scratch")
+        result = solve_equilibrium(
+            hull,
+            cog_result,
+            max_iterations=args.max_iterations,
+            tolerance=args.tolerance,
+            jacobian=args.jacobian,
+            method=args.method,
+            curves=curves,
+            verbose=verbose
+        )
+        seed = None
+
+    if seed is not None:
+        result['seed'] = {
+            'path': seed[1],
+            'z_offset_mm': seed[0][0],
+            'pitch_deg': seed[0][1],
+            'roll_deg': seed[0][2]
+        }
+
+    # Add validator field and pose cache statistics
     result['validator'] = 'buoyancy'
+    result['cache'] = hull.cache.stats()
+    if disk_cache is not None:
+        result['disk_cache'] = disk_cache.stats()
 
     # Write output
     os.makedirs(os.path.dirname(args.output) or '.', exist_ok=True)
@@ -525,6 +791,12 @@ def main():
         print(f"    Ama: {ama['submerged_volume_liters']:.1f}L / {ama['total_volume_liters']:.1f}L ({ama['submerged_percent']:.1f}%) @ z={ama['z_world_mm']:.0f}mm")
         print(f"    Vaka: {vaka['submerged_volume_liters']:.1f}L / {vaka['total_volume_liters']:.1f}L ({vaka['submerged_percent']:.1f}%) @ z={vaka['z_world_mm']:.0f}mm")
         print(f"  Buoyancy force: {result['buoyancy_force_N']:.2f} N")
+        cache = result['cache']
+        print(f"  Pose cache: {cache['hits']} hits, {cache['misses']} misses")
+        if 'disk_cache' in result:
+            disk = result['disk_cache']
+            print(f"  Disk cache: {disk['hits']} hits, {disk['misses']} misses, "
+                  f"{disk['size_mb']:.1f} MB")
         print(f"  Output: {args.output}")
 
     # Exit with error if not converged
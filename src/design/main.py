@@ -7,6 +7,7 @@ This wraps the existing SolarProa.FCMacro with JSON-based parameter loading.
 import sys
 import os
 import json
+import time
 
 # Add paths for imports
 sys.path.insert(0, os.path.dirname(__file__))
@@ -14,6 +15,22 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
 
 params_path = sys.argv[3]
 output_path = sys.argv[4]
+# kuning side: "geometry" (mirrored BREP copies) or "placement" (shared
+# mirrored shapes, see mirror_objects in mirror.py); an environment
+# variable, since FreeCAD tries to open extra command line arguments
+mirror_mode = os.environ.get('MIRROR_MODE', 'geometry')
+# configuration-invariant geometry (hull, akas, deck, panels, amas) is
+# built once per boat: DESIGN_PART=base builds only that part, and a
+# design with DESIGN_BASE=<base.FCStd> opens it and adds rig and rudders
+design_part = os.environ.get('DESIGN_PART', 'full')
+base_path = os.environ.get('DESIGN_BASE')
+if design_part not in ('full', 'base'):
+    print(f"ERROR: Unknown DESIGN_PART '{design_part}', expected full or base")
+    sys.exit(1)
+if design_part == 'base' and base_path:
+    print("ERROR: DESIGN_BASE cannot be used to build a base design")
+    sys.exit(1)
+design_start = time.time()
 
 print(f"Loading parameters: {params_path}")
 print(f"Output design: {output_path}")
@@ -105,7 +122,8 @@ for doc_name in App.listDocuments():
 print(f"\nGenerating design...")
 print(f"Output will be saved to: {output_path}")
 
-doc_name = f"Solar Proa {boat} {configuration}"
+doc_name = (f"Solar Proa {boat} base" if design_part == 'base'
+            else f"Solar Proa {boat} {configuration}")
 
 # Close all open documents first
 for d in FreeCAD.listDocuments().values():
@@ -113,8 +131,13 @@ for d in FreeCAD.listDocuments().values():
 
 # Create new document
 try:
-    doc = FreeCAD.newDocument(doc_name)
-    print(f"Created document, doc = {doc}")
+    if base_path:
+        doc = FreeCAD.openDocument(base_path)
+        doc.Label = doc_name
+        print(f"Opened base design {base_path}, doc = {doc}")
+    else:
+        doc = FreeCAD.newDocument(doc_name)
+        print(f"Created document, doc = {doc}")
     print(f"Document name: {doc.Name}")
     
     FreeCAD.setActiveDocument(doc.Name)  # Use actual doc name, not the label
@@ -132,89 +155,88 @@ except Exception as e:
 # mirrored parts: Biru (blue) side is on the right as seen
 # standing on the vaka facing the ama
 
-biru = doc.addObject("App::Part", "Mirrored Biru")
-mirror(biru, params)
-
-kuning = doc.addObject("App::Part", "Mirrored Kuning")
-for obj in biru.Group:
-    mirrored_obj = kuning.newObject("Part::Feature", obj.Name)
-    
-    # Get the shape with its placement applied
-    shape = obj.Shape.copy()
-    
-    # Mirror the shape across the XZ plane (Y=0)
-    mirror_matrix = Base.Matrix()
-    mirror_matrix.scale(Base.Vector(1, -1, 1))  # Negate Y
-    shape = shape.transformGeometry(mirror_matrix)
-    
-    mirrored_obj.Shape = shape
-    mirrored_obj.Placement = obj.Placement  # Copy the placement too
-    
-# rig: each rig (biru and kuning) is
-# constructed at origin in rotating.py,
-# then rotated, then translated in x and y-direction
-
-# rig_biru with specified rotation and camber
-
-rig_biru = doc.addObject("App::Part", "Rig Biru")
-rig(rig_biru, params, sail_angle=params['sail_angle_biru'],
-    sail_camber=params['sail_camber_biru'],
-    reefing_percentage=params['reefing_percentage_biru'])
-rig_biru.Placement = FreeCAD.Placement(
-    Base.Vector(params['vaka_x_offset'],
-                params['mast_distance_from_center'],
-                params['sole_thickness']),
-    FreeCAD.Rotation(Base.Vector(0, 0, 1),
-                     params['rig_rotation_biru']))
-
-# rig_kuning with specified rotation and camber
-rig_kuning = doc.addObject("App::Part", "Rig Kuning")
-rig(rig_kuning, params, sail_angle=params['sail_angle_kuning'],
-    sail_camber=params['sail_camber_kuning'],
-    reefing_percentage=params['reefing_percentage_kuning'])
-rig_kuning.Placement = FreeCAD.Placement(
-    Base.Vector(params['vaka_x_offset'], - params['mast_distance_from_center'], params['sole_thickness']),
-    FreeCAD.Rotation(Base.Vector(0, 0, 1), params['rig_rotation_kuning']))
-
-# rudder: each rudder (biru and kuning) is
-# constructed at origin in rotating.py,
-# then rotated, then translated in x and y-direction
-
-# rudder_biru with rudder_rotation_biru
-
-# Calculate last aka Y position for rudder placement
-last_panel_index = params['panels_longitudinal'] // 2 - 1
-last_aka_index = params['akas_per_panel'] - 1
-last_aka_y = aka_y_position(params, last_panel_index, last_aka_index)
-
-rudder_biru = doc.addObject("App::Part", "Rudder Biru")
-rudder(rudder_biru, params, params['rudder_raised_biru'])
-rudder_biru.Placement = FreeCAD.Placement(
-    Base.Vector(params['vaka_x_offset'] - params['vaka_width'] / 2
-                - params['rudder_distance_from_vaka'],
-                last_aka_y,
-                0),
-    FreeCAD.Rotation(Base.Vector(0, 0, 1), params['rudder_rotation_biru']))
-
-# rudder_kuning with rudder_rotation_kuning
-
-rudder_kuning = doc.addObject("App::Part", "Rudder Kuning")
-rudder(rudder_kuning, params, params['rudder_raised_kuning'])
-rudder_kuning.Placement = FreeCAD.Placement(
-    Base.Vector(params['vaka_x_offset'] - params['vaka_width'] / 2
-                - params['rudder_distance_from_vaka'],
-                - last_aka_y,
-                0),
-    FreeCAD.Rotation(Base.Vector(0, 0, 1), params['rudder_rotation_kuning']))
+if not base_path:
+    biru = doc.addObject("App::Part", "Mirrored Biru")
+    mirror(biru, params)
+
+    kuning = doc.addObject("App::Part", "Mirrored Kuning")
+    mirror_start = time.time()
+    mirrored_count = mirror_objects(biru, kuning, mirror_mode)
+    mirror_time = time.time() - mirror_start
+    print(f"Mirrored {len(biru.Group)} objects ({mirrored_count} shapes, "
+          f"{mirror_mode} mode) in {mirror_time:.2f} s")
+
+if design_part != 'base':
+    # rig: each rig (biru and kuning) is
+    # constructed at origin in rotating.py,
+    # then rotated, then translated in x and y-direction
+
+    # rig_biru with specified rotation and camber
+
+    rig_biru = doc.addObject("App::Part", "Rig Biru")
+    rig(rig_biru, params, sail_angle=params['sail_angle_biru'],
+        sail_camber=params['sail_camber_biru'],
+        reefing_percentage=params['reefing_percentage_biru'])
+    rig_biru.Placement = FreeCAD.Placement(
+        Base.Vector(params['vaka_x_offset'],
+                    params['mast_distance_from_center'],
+                    params['sole_thickness']),
+        FreeCAD.Rotation(Base.Vector(0, 0, 1),
+                         params['rig_rotation_biru']))
+
+    # rig_kuning with specified rotation and camber
+    rig_kuning = doc.addObject("App::Part", "Rig Kuning")
+    rig(rig_kuning, params, sail_angle=params['sail_angle_kuning'],
+        sail_camber=params['sail_camber_kuning'],
+        reefing_percentage=params['reefing_percentage_kuning'])
+    rig_kuning.Placement = FreeCAD.Placement(
+        Base.Vector(params['vaka_x_offset'], - params['mast_distance_from_center'], params['sole_thickness']),
+        FreeCAD.Rotation(Base.Vector(0, 0, 1), params['rig_rotation_kuning']))
+
+    # rudder: each rudder (biru and kuning) is
+    # constructed at origin in rotating.py,
+    # then rotated, then translated in x and y-direction
+
+    # rudder_biru with rudder_rotation_biru
+
+    # Calculate last aka Y position for rudder placement
+    last_panel_index = params['panels_longitudinal'] // 2 - 1
+    last_aka_index = params['akas_per_panel'] - 1
+    last_aka_y = aka_y_position(params, last_panel_index, last_aka_index)
+
+    rudder_biru = doc.addObject("App::Part", "Rudder Biru")
+    rudder(rudder_biru, params, params['rudder_raised_biru'])
+    rudder_biru.Placement = FreeCAD.Placement(
+        Base.Vector(params['vaka_x_offset'] - params['vaka_width'] / 2
+                    - params['rudder_distance_from_vaka'],
+                    last_aka_y,
+                    0),
+        FreeCAD.Rotation(Base.Vector(0, 0, 1), params['rudder_rotation_biru']))
+
+    # rudder_kuning with rudder_rotation_kuning
+
+    rudder_kuning = doc.addObject("App::Part", "Rudder Kuning")
+    rudder(rudder_kuning, params, params['rudder_raised_kuning'])
+    rudder_kuning.Placement = FreeCAD.Placement(
+        Base.Vector(params['vaka_x_offset'] - params['vaka_width'] / 2
+                    - params['rudder_distance_from_vaka'],
+                    - last_aka_y,
+                    0),
+        FreeCAD.Rotation(Base.Vector(0, 0, 1), params['rudder_rotation_kuning']))
 
 # boat: central unmirrored components: hull, sole, etc
 
-vessel = doc.addObject("App::Part", "Vessel Central")
-central(vessel, params)
+if not base_path:
+    vessel = doc.addObject("App::Part", "Vessel Central")
+    central(vessel, params)
 
 # recompute before stats and rendering
 doc.recompute()
 
+cache_info = shape_cache_info()
+print(f"Shape cache: {cache_info['misses']} shapes built, "
+      f"{cache_info['hits']} reused")
+
 # Set visibility for all objects (works because GUI was initialized early)
 if platform.system() == 'Linux':
     print("Setting object visibility...")
@@ -241,8 +263,35 @@ if platform.system() == 'Linux':
         print(f"Warning: Could not set visibility: {e}")
 
 # Save the document
+save_start = time.time()
 doc.saveAs(output_path)
-print(f"Saved document to {output_path}")
+save_time = time.time() - save_start
+design_time = time.time() - design_start
+file_size = os.path.getsize(output_path)
+print(f"Saved document to {output_path} ({file_size / 1e6:.1f} MB in {save_time:.2f} s, "
+      f"{design_time:.1f} s total)")
+
+# Per-object properties sidecar, so that property-only stages (mass, CoG)
+# do not have to reopen the document (not needed for a base design)
+if design_part != 'base':
+    from src.physics.geometry_index import build_geometry_index, save_geometry_index, index_path_for
+    index_path = index_path_for(output_path)
+    records = build_geometry_index(doc)
+    if base_path:
+        design_stats = {'base_design': base_path}
+    else:
+        design_stats = {
+            'mirror_mode': mirror_mode,
+            'mirrored_shapes': mirrored_count,
+            'mirror_time_s': mirror_time
+        }
+    design_stats.update({
+        'save_time_s': save_time,
+        'design_time_s': design_time,
+        'file_size_bytes': file_size
+    })
+    save_geometry_index(records, index_path, output_path, design_stats)
+    print(f"Saved geometry index ({len(records)} objects) to {index_path}")
 if platform.system() == 'Darwin':
     print("Note: Visibility will be fixed by post-processing on macOS")
 elif platform.system() == 'Linux':
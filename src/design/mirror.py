@@ -602,3 +602,69 @@ def mirror(side, params):
                     params['ama_diameter'] / 2),
         FreeCAD.Rotation(Base.Vector(1, 0, 0), 270))
     
+
+# mirror the biru side into the kuning side (about the XZ plane, Y=0)
+
+MIRROR_MODES = ('geometry', 'placement')
+
+def mirror_placement(placement):
+    """Placement P' with M * P = P' * M for the Y-mirror M.
+
+    M R M is the rotation about the mirrored axis (-x, y, -z) by the same
+    angle, so the quaternion keeps its y and w components.
+    """
+    x, y, z, w = placement.Rotation.Q
+    return FreeCAD.Placement(
+        Base.Vector(placement.Base.x, - placement.Base.y, placement.Base.z),
+        FreeCAD.Rotation(- x, y, - z, w))
+
+def mirror_objects(source, target, mode='geometry'):
+    """Create the mirror image of every object of source in target.
+
+    geometry: each shape (with its placement) is mirrored by
+    transformGeometry, which converts it to B-splines.
+    placement: each distinct local shape is mirrored exactly once and
+    shared by all objects built from it (the cached primitives of
+    shapes.py); the objects differ only by their mirrored placement.
+
+    Returns the number of shapes mirrored.
+    """
+    if mode not in MIRROR_MODES:
+        raise ValueError(f"unknown mirror mode '{mode}', expected one of {MIRROR_MODES}")
+
+    mirrored_count = 0
+    # hashCode of the local shape -> [(local shape, mirrored local shape)]
+    mirrored_shapes = {}
+
+    for obj in source.Group:
+        mirrored_obj = target.newObject("Part::Feature", obj.Name)
+
+        if mode == 'geometry':
+            # Get the shape with its placement applied
+            shape = obj.Shape.copy()
+
+            # Mirror the shape across the XZ plane (Y=0)
+            mirror_matrix = Base.Matrix()
+            mirror_matrix.scale(Base.Vector(1, -1, 1))  # Negate Y
+            shape = shape.transformGeometry(mirror_matrix)
+
+            mirrored_obj.Shape = shape
+            mirrored_obj.Placement = obj.Placement  # Copy the placement too
+            mirrored_count += 1
+            continue
+
+        # the shape without its placement, sharing topology with the object
+        local = obj.Shape
+        local.Placement = FreeCAD.Placement()
+
+        candidates = mirrored_shapes.setdefault(local.hashCode(), [])
+        mirrored = next((m for s, m in candidates if s.isPartner(local)), None)
+        if mirrored is None:
+            mirrored = local.mirror(Base.Vector(0, 0, 0), Base.Vector(0, 1, 0))
+            candidates.append((local, mirrored))
+            mirrored_count += 1
+
+        mirrored_obj.Shape = mirrored.moved(FreeCAD.Placement())
+        mirrored_obj.Placement = mirror_placement(obj.Placement)
+
+    return mirrored_count
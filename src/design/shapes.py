@@ -1,11 +1,49 @@
 import Part
 from FreeCAD import Base
 import math
+import functools
 
 # maker functions for common shapes
 
+# shape cache: the builders below are called many times with the same
+# parameters (akas, stanchions, pillars and braces in the loops of
+# mirror()); each distinct set of parameters is built once and every
+# call gets the cached shape under a new (identity) location, so callers
+# can still move or rotate what they get, and objects built from the
+# same parameters share one shape (see mirror_objects in mirror.py)
+
+_shape_cache = {}
+_shape_cache_stats = {'hits': 0, 'misses': 0}
+
+def cached_shape(builder):
+    """Memoize a shape builder on its (hashable) arguments"""
+    @functools.wraps(builder)
+    def wrapper(*args):
+        key = (builder.__name__,) + args
+        shape = _shape_cache.get(key)
+        if shape is None:
+            _shape_cache_stats['misses'] += 1
+            shape = builder(*args)
+            _shape_cache[key] = shape
+        else:
+            _shape_cache_stats['hits'] += 1
+        # same topology and geometry, own location
+        return shape.moved(Base.Placement())
+    return wrapper
+
+def shape_cache_info():
+    """Number of cache hits, misses and cached shapes"""
+    return dict(_shape_cache_stats, size=len(_shape_cache))
+
+def clear_shape_cache():
+    """Drop all cached shapes and reset the counters"""
+    _shape_cache.clear()
+    _shape_cache_stats['hits'] = 0
+    _shape_cache_stats['misses'] = 0
+
 # SHS: square hollow section: pipe with square profile
 
+@cached_shape
 def shs(outer, wall, length):
     # Create outer square
     outer_square = Part.makePolygon([
@@ -36,6 +74,7 @@ def shs(outer, wall, length):
 
 # SHS: square hollow section: pipe with square profile
 
+@cached_shape
 def shs_capped(outer, wall, length, cap_diameter, cap_thickness):
     # Create outer square
     outer_square = Part.makePolygon([
@@ -73,6 +112,7 @@ def shs_capped(outer, wall, length, cap_diameter, cap_thickness):
 
 # Rectangular tube with caps
 
+@cached_shape
 def rectangular_tube_capped(outer1, outer2, wall, length, cap_diameter, cap_thickness):
     # Create outer square
     outer_square = Part.makePolygon([
@@ -111,6 +151,7 @@ def rectangular_tube_capped(outer1, outer2, wall, length, cap_diameter, cap_thic
 
 # circular pipe
 
+@cached_shape
 def pipe(diameter, thickness, length):
     """Create a hollow cylinder (pipe)"""
     outer_radius = diameter / 2
@@ -129,6 +170,7 @@ def pipe(diameter, thickness, length):
 
 # circular cone
 
+@cached_shape
 def hollow_cone(diameter, thickness, length):
     radius_outer = diameter / 2
     radius_inner = radius_outer - thickness
@@ -160,6 +202,7 @@ def elliptical_cylinder(major_diameter, minor_diameter, length):
 
 # hollow elliptical cylinder
 
+@cached_shape
 def elliptical_pipe(major_diameter, minor_diameter, thickness, length):
     """Create a hollow elliptical cylinder"""
     major_radius_outer = major_diameter / 2
@@ -193,6 +236,7 @@ def elliptical_pipe(major_diameter, minor_diameter, thickness, length):
 
 # ellipsoid
 
+@cached_shape
 def ellipsoid(x_diameter, y_diameter, z_diameter):
     """Create an ellipsoid (3D ellipse)"""
     # Create a sphere and then scale it to make an ellipsoid
@@ -12,12 +12,47 @@ For a proa with outrigger (ama), the stability is asymmetric:
 - Positive roll (towards ama): high stability due to ama leverage
 - Negative roll (away from ama): lower stability, similar to monohull
 
+With --table, the equilibrium z at each heel angle is first found on a
+precomputed hydrostatic lookup table (see src/lookup); the exact hull then
+only has to search a narrow window around it. --curves (hydrostatics
+artifact, see src/hydrostatics) gives the upright draft for the boat's
+weight as the starting point of the first search.
+
+The equilibrium z at each heel angle is found with a bracketing Brent
+search (src/physics/solvers.py) that starts from the solution at the
+neighbouring angle, so each angle usually takes a handful of CoB
+evaluations; gz_data reports the count per angle ("iterations") and the
+summary its mean and maximum over the angles solved in this run. The
+angles are solved in short continuation chains outwards from upright (see
+continuation_chains), each starting from the upright z, so the start of
+every search depends on the heel grid only.
+
+Converged points (equilibrium z and CoB at a weight and heel angle) are
+kept in the pose caches and, with --disk-cache, persist across runs under
+the hull fingerprint. Extending the heel range or changing the step, or
+moving the CoG, then only solves the angles not seen before for that
+weight ("cached_points" in the artifact).
+
+With --kn (cross curves artifact, see src/kn), GZ is interpolated from
+KN(heel, displacement) and the CoG without evaluating the hull at all, as
+long as the boat's displacement lies inside the cross curves.
+
+With --adaptive, the heel grid starts coarse (--heel-step) and intervals are
+bisected only where GZ bends more than --gz-tolerance allows, or where the
+turtle, capsize or ama engagement angle lies, down to --min-heel-step.
+
+With --jobs N, the continuation chains are spread across N worker
+processes, each of which loads the hull geometry once. Every search then
+starts from the same z as in a serial run, so the results are identical.
+
 Usage:
     python -m src.gz \
         --design artifact/boat.design.FCStd \
         --buoyancy artifact/boat.buoyancy.json \
-        --output artifact/boat.gz.json \
-        --output-png artifact/boat.gz.png
+        --output artifact/boat.gz.json
+
+The plot is made by the separate gzplot stage (src/gzplot), so this stage
+does not import matplotlib.
 """
 
 import sys
@@ -25,6 +60,7 @@ import os
 import json
 import argparse
 import math
+import multiprocessing
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
 
@@ -35,11 +71,84 @@ except ImportError as e:
     print("This script must be run with FreeCAD's Python", file=sys.stderr)
     sys.exit(1)
 
-from src.physics.center_of_buoyancy import compute_center_of_buoyancy
+from src.physics.center_of_buoyancy import HullModel, ENGINES, SALTWATER_DENSITY_KG_M3
+from src.physics.mesh_hydrostatics import DEFAULT_MESH_TOLERANCE
+from src.physics.lookup_table import HydrostaticTable
+from src.physics.hydrostatic_curves import HydrostaticCurves
+from src.physics.cross_curves import CrossCurves
+from src.physics.cache import DEFAULT_CACHE_SIZE, merge_cache_stats
+from src.physics.disk_cache import DiskCache, DEFAULT_DISK_CACHE_SIZE_MB, merge_disk_cache_stats
+from src.physics.solvers import find_root
 
 # Physical constants
 GRAVITY_M_S2 = 9.81
 
+# Full z search interval for the equilibrium at a heel angle (mm)
+DEFAULT_Z_BOUNDS = (-5000.0, 500.0)
+
+# Half-width of the exact z search window around a lookup table solution (mm)
+TABLE_POLISH_WINDOW_MM = 50.0
+
+# Equilibrium z search: first step when there is no waterplane to take a
+# Newton step from, and smallest first step (mm)
+CONTINUATION_STEP_MM = 50.0
+MIN_Z_STEP_MM = 1.0
+
+# The equilibrium z search stops once buoyancy matches the weight to this
+# fraction, or the z bracket is this narrow (mm); the latter must stay well
+# above the pose cache quantum (DEFAULT_Z_QUANTUM_MM in src/physics/cache.py),
+# or the last Brent steps hit the cache entry of the previous step
+EQUILIBRIUM_FORCE_TOLERANCE = 1e-3
+EQUILIBRIUM_XTOL_MM = 0.1
+
+# Heel angles are solved in chains of this many neighbouring angles, each
+# chain continuing outwards from the upright z (see continuation_chains)
+CONTINUATION_CHAIN_LENGTH = 4
+
+# Buoyancy force per mm³ of displaced saltwater
+FORCE_PER_MM3 = SALTWATER_DENSITY_KG_M3 * GRAVITY_M_S2 / 1e9
+
+# Converged GZ points are cached per weight and heel angle; weights closer
+# than this share an entry (N)
+GZ_POINT_WEIGHT_QUANTUM_N = 0.01
+
+# Adaptive heel sampling (--adaptive): refine until linear interpolation
+# between neighbouring points is this accurate (m), never below the
+# minimum step, with at most this many points in total
+ADAPTIVE_GZ_TOLERANCE_M = 0.005
+ADAPTIVE_MIN_STEP_DEG = 0.5
+ADAPTIVE_MAX_POINTS = 121
+
+# A jump in CoB_x of more than this per degree of heel means the ama
+# engages the water (mm/degree)
+AMA_ENGAGEMENT_COB_SLOPE = 500
+
+# For a proa: negative = away from ama, positive = towards ama
+# Use finer resolution near 0° to capture ama engagement transition
+DEFAULT_HEEL_ANGLES = (
+    list(range(-60, -5, 5)) +       # -60, -55, ... -10
+    list(range(-5, 6, 1)) +         # -5, -4, -3, -2, -1, 0, 1, 2, 3, 4, 5 (fine steps)
+    list(range(10, 65, 5))          # 10, 15, 20, ... 60
+)
+
+
+def heel_angle_grid(min_heel: float, max_heel: float, heel_step: float) -> list:
+    """
+    Heel angles from min_heel to max_heel, with fine steps near 0° to
+    capture ama engagement.
+
+    Uses 1° steps between -5° and +5°, otherwise heel_step.
+    """
+    heel_angles = []
+    angle = min_heel
+    while angle <= max_heel + 0.01:  # Small epsilon for float comparison
+        heel_angles.append(angle)
+        if -6 < angle < 5:
+            angle += 1.0
+        else:
+            angle += heel_step
+    return heel_angles
+
 
 def transform_point(point: dict, z_displacement: float, pitch_deg: float,
                     roll_deg: float, rotation_center: dict) -> dict:
@@ -71,222 +180,287 @@ def transform_point(point: dict, z_displacement: float, pitch_deg: float,
     }
 
 
-def find_equilibrium_z_at_heel(fcstd_path: str, target_weight_N: float,
+def find_equilibrium_z_at_heel(hull: HullModel, target_weight_N: float,
                                pitch_deg: float, roll_deg: float,
                                z_initial: float = -500.0,
-                               tolerance: float = 0.01,
-                               max_iterations: int = 30) -> dict:
+                               tolerance: float = EQUILIBRIUM_FORCE_TOLERANCE,
+                               xtol: float = EQUILIBRIUM_XTOL_MM,
+                               max_iterations: int = 30,
+                               z_bounds: tuple = DEFAULT_Z_BOUNDS) -> dict:
     """
     Find equilibrium z displacement at a fixed heel (roll) angle.
 
-    Uses bisection to find z where buoyancy = weight.
+    Starts at z_initial (e.g. the solution at the neighbouring heel angle),
+    takes a Newton step from the waterplane area (dF/dz = -rho g A), widens
+    it until buoyancy - weight changes sign and then refines the bracket
+    with Brent's method (see src/physics/solvers.py) until the force
+    balance is within tolerance or the bracket within xtol. From a good
+    start this needs a handful of CoB evaluations.
 
     Args:
-        fcstd_path: Path to FreeCAD design file
+        hull: Hull geometry loaded from the FreeCAD design file
         target_weight_N: Target weight (buoyancy must equal this)
         pitch_deg: Pitch angle (usually 0 for GZ curve)
         roll_deg: Roll (heel) angle
         z_initial: Initial guess for z
         tolerance: Relative tolerance for force balance
-        max_iterations: Maximum iterations
+        xtol: Width of the final z bracket in mm
+        max_iterations: Maximum CoB evaluations
+        z_bounds: (z_min, z_max) search interval in mm
 
     Returns:
-        Dictionary with equilibrium z and CoB result
+        Dictionary with equilibrium z, CoB result and the number of CoB
+        evaluations ("iterations")
     """
-    # Binary search bounds
-    z_min, z_max = -5000.0, 500.0  # mm
-
-    # First, bracket the solution
-    cob_min = compute_center_of_buoyancy(fcstd_path, z_min, pitch_deg, roll_deg)
-    cob_max = compute_center_of_buoyancy(fcstd_path, z_max, pitch_deg, roll_deg)
-
-    buoyancy_min = cob_min['buoyancy_force_N']
-    buoyancy_max = cob_max['buoyancy_force_N']
-
-    # Check if target is within range
-    if target_weight_N > buoyancy_min:
-        # Boat is too heavy even when fully submerged
-        return {
-            'converged': False,
-            'z_mm': z_min,
-            'cob_result': cob_min,
-            'error': 'Boat too heavy - cannot float'
-        }
-
-    if target_weight_N < buoyancy_max:
-        # Boat is too light even when barely touching water
-        return {
-            'converged': False,
-            'z_mm': z_max,
-            'cob_result': cob_max,
-            'error': 'Boat too light - pops out of water'
-        }
+    z_min, z_max = z_bounds
+    cob_results = {}
 
-    # Bisection search
-    for iteration in range(max_iterations):
-        z_mid = (z_min + z_max) / 2
-        cob_mid = compute_center_of_buoyancy(fcstd_path, z_mid, pitch_deg, roll_deg)
-        buoyancy_mid = cob_mid['buoyancy_force_N']
+    def force_residual(z):
+        cob_results[z] = hull.center_of_buoyancy(z, pitch_deg, roll_deg)
+        return cob_results[z]['buoyancy_force_N'] - target_weight_N
 
-        force_error = abs(buoyancy_mid - target_weight_N) / target_weight_N
+    z_start = min(max(z_initial, z_min), z_max)
+    residual_start = force_residual(z_start)
 
-        if force_error < tolerance:
-            return {
-                'converged': True,
-                'z_mm': z_mid,
-                'cob_result': cob_mid,
-                'iterations': iteration + 1
-            }
+    # Newton step; more buoyancy than weight means the boat rises (larger z)
+    area = cob_results[z_start].get('waterplane', {}).get('area_mm2', 0.0)
+    if area > 0:
+        step = residual_start / (area * FORCE_PER_MM3)
+        step = math.copysign(max(abs(step), MIN_Z_STEP_MM), residual_start)
+    else:
+        step = math.copysign(CONTINUATION_STEP_MM, residual_start)
 
-        if buoyancy_mid > target_weight_N:
-            # Too much buoyancy, rise up (less negative z)
-            z_min = z_mid
-        else:
-            # Not enough buoyancy, sink more (more negative z)
-            z_max = z_mid
+    root = find_root(force_residual, z_start, residual_start, step, z_bounds,
+                     ftol=tolerance * target_weight_N, xtol=xtol,
+                     max_evaluations=max_iterations)
 
-    # Return best result even if not fully converged
-    return {
-        'converged': False,
-        'z_mm': z_mid,
-        'cob_result': cob_mid,
-        'iterations': max_iterations,
-        'error': f'Did not converge, force error: {force_error:.4f}'
+    result = {
+        'converged': root['converged'],
+        'z_mm': root['x'],
+        'cob_result': cob_results[root['x']],
+        'iterations': root['evaluations']
     }
+    if root['converged']:
+        return result
 
+    if not root['bracketed'] and root['x'] == z_min and root['fx'] < 0:
+        # Boat is too heavy even when fully submerged
+        result['error'] = 'Boat too heavy - cannot float'
+    elif not root['bracketed'] and root['x'] == z_max and root['fx'] > 0:
+        # Boat is too light even when barely touching water
+        result['error'] = 'Boat too light - pops out of water'
+    else:
+        force_error = abs(root['fx']) / target_weight_N
+        result['error'] = f'Did not converge, force error: {force_error:.4f}'
+    return result
 
-def compute_gz_curve(fcstd_path: str, buoyancy_result: dict,
-                     heel_angles: list = None,
-                     verbose: bool = True) -> dict:
+
+def find_equilibrium_z_with_table(hull: HullModel, table, target_weight_N: float,
+                                  pitch_deg: float, roll_deg: float,
+                                  z_initial: float = -500.0) -> dict:
     """
-    Compute the GZ curve by sweeping through heel angles.
+    Find equilibrium z at a heel angle, using a lookup table to narrow the search.
 
-    For each heel angle:
-    1. Find equilibrium z (buoyancy = weight)
-    2. Transform CoG to world frame
-    3. Compute GZ = CoB_x - CoG_x (transverse separation)
+    The table solution is only a starting point: the exact hull is searched
+    from there, within TABLE_POLISH_WINDOW_MM of it. If the table has no solution (pose
+    outside the grid) or the window does not bracket the exact solution,
+    the full exact search is used.
 
     Args:
-        fcstd_path: Path to FreeCAD design file
-        buoyancy_result: Result from buoyancy equilibrium solver
-        heel_angles: List of heel angles in degrees (default: -20 to 60)
-        verbose: Print progress
+        hull: Hull geometry loaded from the FreeCAD design file
+        table: HydrostaticTable of the same design
+        target_weight_N, pitch_deg, roll_deg, z_initial: See find_equilibrium_z_at_heel
 
     Returns:
-        Dictionary with GZ curve data
+        Same as find_equilibrium_z_at_heel
     """
-    if heel_angles is None:
-        # For a proa: negative = away from ama, positive = towards ama
-        # Use finer resolution near 0° to capture ama engagement transition
-        heel_angles = (
-            list(range(-60, -5, 5)) +       # -60, -55, ... -10
-            list(range(-5, 6, 1)) +         # -5, -4, -3, -2, -1, 0, 1, 2, 3, 4, 5 (fine steps)
-            list(range(10, 65, 5))          # 10, 15, 20, ... 60
-        )
+    coarse = find_equilibrium_z_at_heel(table, target_weight_N, pitch_deg, roll_deg, z_initial)
 
-    # Extract equilibrium data
-    eq = buoyancy_result['equilibrium']
-    eq_z = eq['z_offset_mm']
-    eq_pitch = eq['pitch_deg']
+    if coarse['converged'] and math.isfinite(coarse['cob_result']['error_bound']['buoyancy_force_N']):
+        z_bounds = (coarse['z_mm'] - TABLE_POLISH_WINDOW_MM,
+                    coarse['z_mm'] + TABLE_POLISH_WINDOW_MM)
+        result = find_equilibrium_z_at_heel(hull, target_weight_N, pitch_deg, roll_deg,
+                                            coarse['z_mm'], z_bounds=z_bounds)
+        if result['converged']:
+            return result
 
-    # CoG in body frame
-    cog_body = buoyancy_result['center_of_gravity_body']
+    return find_equilibrium_z_at_heel(hull, target_weight_N, pitch_deg, roll_deg, z_initial)
 
-    # Weight/mass
-    weight_N = buoyancy_result['weight_N']
-    total_mass_kg = buoyancy_result['total_mass_kg']
 
-    # Get rotation center from the equilibrium CoB calculation
-    # We'll recompute it for each heel angle
+def gz_point_key(hull: HullModel, weight_N: float, roll_deg: float) -> tuple:
+    """Cache key of the converged equilibrium at a heel angle (level pitch)."""
+    return ('gz_point',
+            round(weight_N / GZ_POINT_WEIGHT_QUANTUM_N),
+            round(roll_deg / hull.cache.angle_quantum_deg))
 
-    gz_data = []
 
-    for roll_deg in heel_angles:
-        if verbose:
-            print(f"  Computing GZ at heel = {roll_deg:+.1f}°...", end='', flush=True)
+def compute_gz_point(hull: HullModel, buoyancy_result: dict, roll_deg: float,
+                     table=None, curves=None, z_initial: float = None) -> dict:
+    """
+    Compute one point of the GZ curve.
 
-        # Find equilibrium z at this heel angle
-        # Keep pitch at equilibrium value (or 0 for simplicity)
+    Args:
+        hull: Hull geometry loaded from the FreeCAD design file
+        buoyancy_result: Result from buoyancy equilibrium solver
+        roll_deg: Heel angle in degrees
+        table: Optional HydrostaticTable to narrow the equilibrium search
+        curves: Optional HydrostaticCurves for the starting z (upright
+                draft for the weight) when z_initial is not given
+        z_initial: Starting z of the equilibrium search, e.g. the solution
+                   at the neighbouring heel angle (default: upright draft
+                   from the curves, else the buoyancy equilibrium z)
+
+    Returns:
+        GZ curve entry for this heel angle (converged=False with an error
+        message if no equilibrium z was found)
+    """
+    cog_body = buoyancy_result['center_of_gravity_body']
+    weight_N = buoyancy_result['weight_N']
+
+    # The equilibrium at a heel angle depends on the hull and weight only;
+    # the CoG enters afterwards, so cached points serve any CoG
+    key = gz_point_key(hull, weight_N, roll_deg)
+    cached = hull.cached_solution(key)
+    if cached is not None:
+        point = gz_from_cob(roll_deg, cached['z_eq_mm'], cached['CoB'], cog_body,
+                            cached['rotation_center'], weight_N)
+        point.update({
+            'buoyancy_force_N': round(cached['buoyancy_force_N'], 2),
+            'submerged_volume_liters': round(cached['submerged_volume_liters'], 2),
+            'iterations': 0,
+            'cached': True
+        })
+        return point
+
+    if z_initial is None:
+        z_initial = buoyancy_result['equilibrium']['z_offset_mm']
+        z_upright = curves.z_for_weight(weight_N) if curves is not None else None
+        if z_upright is not None:
+            z_initial = z_upright
+
+    # Find equilibrium z at this heel angle
+    # Keep pitch at equilibrium value (or 0 for simplicity)
+    if table is not None:
+        result = find_equilibrium_z_with_table(
+            hull, table, weight_N,
+            pitch_deg=0.0,  # Assume level pitch for GZ curve
+            roll_deg=roll_deg,
+            z_initial=z_initial
+        )
+    else:
         result = find_equilibrium_z_at_heel(
-            fcstd_path, weight_N,
+            hull, weight_N,
             pitch_deg=0.0,  # Assume level pitch for GZ curve
             roll_deg=roll_deg,
-            z_initial=eq_z
+            z_initial=z_initial
         )
 
-        if not result['converged']:
-            if verbose:
-                print(f" FAILED: {result.get('error', 'unknown')}")
-            # Still record the point but mark as unconverged
-            gz_data.append({
-                'heel_deg': roll_deg,
-                'converged': False,
-                'gz_m': 0.0,
-                'righting_moment_Nm': 0.0,
-                'error': result.get('error', 'Did not converge')
-            })
-            continue
-
-        cob_result = result['cob_result']
-        z_eq = result['z_mm']
-
-        # Get rotation center
-        rotation_center = cob_result['pose'].get('rotation_center', cog_body)
-
-        # Transform CoG to world frame at this pose
-        cog_world = transform_point(cog_body, z_eq, 0.0, roll_deg, rotation_center)
-
-        # CoB is already in world frame
-        cob = cob_result['CoB']
-
-        # GZ = transverse righting arm
-        # The righting moment is M = (CoG_x - CoB_x) × Buoyancy
-        # For positive roll (heel to starboard), righting means M < 0 (roll back to port)
-        # For negative roll (heel to port), righting means M > 0 (roll back to starboard)
-        #
-        # To get GZ positive for righting in both cases:
-        # GZ = sign(roll) × (CoB_x - CoG_x)
-        #
-        # This way:
-        # - At positive heel: CoB outboard (larger x) → positive GZ → righting
-        # - At negative heel: CoB inboard (smaller x) → negative raw, but sign flip → positive GZ → righting
-        raw_gz_mm = cob['x'] - cog_world['x']
-        if abs(roll_deg) < 0.01:
-            # At near-zero heel, use raw value (sign is ambiguous)
-            gz_mm = raw_gz_mm
-        else:
-            # Apply sign correction for proper righting arm convention
-            sign = 1 if roll_deg > 0 else -1
-            gz_mm = sign * raw_gz_mm
-        gz_m = gz_mm / 1000.0
+    if not result['converged']:
+        # Still record the point but mark as unconverged
+        return {
+            'heel_deg': roll_deg,
+            'converged': False,
+            'gz_m': 0.0,
+            'righting_moment_Nm': 0.0,
+            'iterations': result.get('iterations', 0),
+            'error': result.get('error', 'Did not converge')
+        }
 
-        # Righting moment = GZ × displacement × g
-        # But we already have weight = mass × g, so RM = GZ × weight
-        righting_moment_Nm = gz_m * weight_N
+    cob_result = result['cob_result']
+    rotation_center = cob_result['pose'].get('rotation_center', cog_body)
+    hull.store_solution(key, {
+        'z_eq_mm': result['z_mm'],
+        'CoB': cob_result['CoB'],
+        'rotation_center': rotation_center,
+        'buoyancy_force_N': cob_result['buoyancy_force_N'],
+        'submerged_volume_liters': cob_result['submerged_volume_liters']
+    })
+
+    point = gz_from_cob(roll_deg, result['z_mm'], cob_result['CoB'], cog_body,
+                        rotation_center, weight_N)
+    point.update({
+        'buoyancy_force_N': round(cob_result['buoyancy_force_N'], 2),
+        'submerged_volume_liters': round(cob_result['submerged_volume_liters'], 2),
+        'iterations': result['iterations']
+    })
+    return point
+
+
+def gz_from_cob(roll_deg: float, z_eq: float, cob: dict, cog_body: dict,
+                rotation_center: dict, weight_N: float) -> dict:
+    """
+    GZ curve entry from the equilibrium z and world-frame CoB at a heel angle.
 
-        if verbose:
-            print(f" GZ = {gz_m*100:.1f} cm, RM = {righting_moment_Nm:.0f} Nm")
+    Args:
+        roll_deg: Heel angle in degrees (level pitch)
+        z_eq: Equilibrium z displacement in mm
+        cob: World-frame center of buoyancy {x, y, z}
+        cog_body: Body-frame center of gravity {x, y, z}
+        rotation_center: Rotation center of the pose (body frame)
+        weight_N: Weight of the boat
 
-        gz_data.append({
-            'heel_deg': roll_deg,
-            'converged': True,
-            'z_eq_mm': round(z_eq, 2),
-            'cob_x_mm': round(cob['x'], 2),
-            'cob_y_mm': round(cob['y'], 2),
-            'cob_z_mm': round(cob['z'], 2),
-            'cog_world_x_mm': round(cog_world['x'], 2),
-            'cog_world_y_mm': round(cog_world['y'], 2),
-            'cog_world_z_mm': round(cog_world['z'], 2),
-            'raw_gz_mm': round(raw_gz_mm, 2),  # CoB_x - CoG_x (before sign correction)
-            'gz_mm': round(gz_mm, 2),  # Sign-corrected righting arm
-            'gz_m': round(gz_m, 4),
-            'righting_moment_Nm': round(righting_moment_Nm, 2),
-            'buoyancy_force_N': round(cob_result['buoyancy_force_N'], 2),
-            'submerged_volume_liters': round(cob_result['submerged_volume_liters'], 2)
-        })
+    Returns:
+        GZ curve entry (converged) without the solver statistics
+    """
+    # Transform CoG to world frame at this pose
+    cog_world = transform_point(cog_body, z_eq, 0.0, roll_deg, rotation_center)
+
+    # GZ = transverse righting arm
+    # The righting moment is M = (CoG_x - CoB_x) × Buoyancy
+    # For positive roll (heel to starboard), righting means M < 0 (roll back to port)
+    # For negative roll (heel to port), righting means M > 0 (roll back to starboard)
+    #
+    # To get GZ positive for righting in both cases:
+    # GZ = sign(roll) × (CoB_x - CoG_x)
+    #
+    # This way:
+    # - At positive heel: CoB outboard (larger x) → positive GZ → righting
+    # - At negative heel: CoB inboard (smaller x) → negative raw, but sign flip → positive GZ → righting
+    raw_gz_mm = cob['x'] - cog_world['x']
+    if abs(roll_deg) < 0.01:
+        # At near-zero heel, use raw value (sign is ambiguous)
+        gz_mm = raw_gz_mm
+    else:
+        # Apply sign correction for proper righting arm convention
+        sign = 1 if roll_deg > 0 else -1
+        gz_mm = sign * raw_gz_mm
+    gz_m = gz_mm / 1000.0
+
+    # Righting moment = GZ × displacement × g
+    # But we already have weight = mass × g, so RM = GZ × weight
+    righting_moment_Nm = gz_m * weight_N
+
+    return {
+        'heel_deg': roll_deg,
+        'converged': True,
+        'z_eq_mm': round(z_eq, 2),
+        'cob_x_mm': round(cob['x'], 2),
+        'cob_y_mm': round(cob['y'], 2),
+        'cob_z_mm': round(cob['z'], 2),
+        'cog_world_x_mm': round(cog_world['x'], 2),
+        'cog_world_y_mm': round(cog_world['y'], 2),
+        'cog_world_z_mm': round(cog_world['z'], 2),
+        'raw_gz_mm': round(raw_gz_mm, 2),  # CoB_x - CoG_x (before sign correction)
+        'gz_mm': round(gz_mm, 2),  # Sign-corrected righting arm
+        'gz_m': round(gz_m, 4),
+        'righting_moment_Nm': round(righting_moment_Nm, 2)
+    }
 
-    # Compute summary statistics
+
+def summarize_gz_curve(gz_data: list) -> dict:
+    """
+    Compute summary statistics of a GZ curve.
+
+    Args:
+        gz_data: GZ curve entries in increasing heel angle order
+
+    Returns:
+        Dictionary with max GZ, range of positive stability, turtle, capsize
+        and ama engagement angles, point counts and the mean and maximum
+        number of CoB evaluations of the points solved in this run
+    """
     converged_points = [p for p in gz_data if p.get('converged', False)]
+    iterations = [p.get('iterations', 0) for p in gz_data if not p.get('cached')]
 
     if converged_points:
         gz_values = [p['gz_m'] for p in converged_points]
@@ -343,7 +517,7 @@ def compute_gz_curve(fcstd_path: str, buoyancy_result: dict,
             delta_cob_x = cob_x_values[i] - cob_x_values[i-1]
             delta_angle = converged_points[i]['heel_deg'] - converged_points[i-1]['heel_deg']
             # A jump of > 500mm per degree indicates ama engagement
-            if delta_angle > 0 and delta_cob_x / delta_angle > 500:
+            if delta_angle > 0 and delta_cob_x / delta_angle > AMA_ENGAGEMENT_COB_SLOPE:
                 # Ama engages somewhere between these two angles
                 ama_engagement_angle = (converged_points[i-1]['heel_deg'] +
                                         converged_points[i]['heel_deg']) / 2
@@ -371,109 +545,430 @@ def compute_gz_curve(fcstd_path: str, buoyancy_result: dict,
             'converged_points': 0
         }
 
+    summary['mean_iterations'] = round(sum(iterations) / len(iterations), 1) if iterations else 0
+    summary['max_iterations'] = max(iterations, default=0)
+    return summary
+
+
+def _format_gz_point(point: dict) -> str:
+    """One-line progress description of a GZ curve entry."""
+    if not point['converged']:
+        return f" FAILED: {point['error']}"
+    source = 'cached' if point.get('cached') else f"{point['iterations']} evaluations"
+    return (f" GZ = {point['gz_m']*100:.1f} cm, RM = {point['righting_moment_Nm']:.0f} Nm "
+            f"({source})")
+
+
+def cache_statistics(hull: HullModel) -> dict:
+    """Pose cache (and disk cache, if any) statistics of a hull for the artifact."""
+    stats = {'cache': hull.cache.stats()}
+    if hull.disk_cache is not None:
+        stats['disk_cache'] = hull.disk_cache.stats()
+    return stats
+
+
+def _gz_result(buoyancy_result: dict, gz_data: list) -> dict:
+    """Assemble the gz artifact from the buoyancy result and GZ curve entries."""
     return {
         'validator': 'gz',
-        'summary': summary,
-        'total_mass_kg': total_mass_kg,
-        'weight_N': weight_N,
-        'equilibrium_pose': eq,
-        'center_of_gravity_body': cog_body,
+        'summary': summarize_gz_curve(gz_data),
+        'total_mass_kg': buoyancy_result['total_mass_kg'],
+        'weight_N': buoyancy_result['weight_N'],
+        'equilibrium_pose': buoyancy_result['equilibrium'],
+        'center_of_gravity_body': buoyancy_result['center_of_gravity_body'],
+        'cached_points': sum(1 for p in gz_data if p.get('cached')),
         'gz_curve': gz_data
     }
 
 
-def plot_gz_curve(gz_result: dict, output_path: str):
+def compute_gz_curve(hull: HullModel, buoyancy_result: dict,
+                     heel_angles: list = None,
+                     table=None,
+                     curves=None,
+                     verbose: bool = True) -> dict:
     """
-    Generate a PNG plot of the GZ curve.
+    Compute the GZ curve by sweeping through heel angles.
+
+    For each heel angle:
+    1. Find equilibrium z (buoyancy = weight)
+    2. Transform CoG to world frame
+    3. Compute GZ = CoB_x - CoG_x (transverse separation)
+
+    The angles are solved in continuation chains outwards from upright (see
+    continuation_chains): each equilibrium search starts from the solution
+    at the previous angle of its chain, so it only has to follow a small
+    change in z.
 
     Args:
-        gz_result: Result from compute_gz_curve
-        output_path: Path for output PNG file
-    """
-    import matplotlib
-    matplotlib.use('Agg')  # Non-interactive backend
-    import matplotlib.pyplot as plt
-
-    # Extract data for plotting
-    gz_data = gz_result['gz_curve']
-    converged = [p for p in gz_data if p.get('converged', False)]
-
-    if not converged:
-        print("Warning: No converged points to plot")
-        return
-
-    angles = [p['heel_deg'] for p in converged]
-    gz_values = [p['gz_m'] * 100 for p in converged]  # Convert to cm for readability
-    rm_values = [p['righting_moment_Nm'] for p in converged]
-
-    # Get equilibrium roll angle
-    eq_roll = gz_result['equilibrium_pose']['roll_deg']
-
-    # Create figure with two y-axes
-    fig, ax1 = plt.subplots(figsize=(10, 6))
-
-    # Plot GZ curve
-    color1 = '#2563eb'
-    ax1.set_xlabel('Heel Angle (degrees)', fontsize=12)
-    ax1.set_ylabel('GZ Righting Arm (cm)', color=color1, fontsize=12)
-    line1, = ax1.plot(angles, gz_values, 'o-', color=color1, linewidth=2,
-                      markersize=4, label='GZ (cm)')
-    ax1.tick_params(axis='y', labelcolor=color1)
-    ax1.axhline(y=0, color='gray', linestyle='--', alpha=0.5)
-    ax1.axvline(x=0, color='gray', linestyle='--', alpha=0.5)
-
-    # Mark the equilibrium roll angle
-    ax1.axvline(x=eq_roll, color='green', linestyle=':', alpha=0.7, linewidth=2,
-                label=f'Equilibrium ({eq_roll:.1f}°)')
-
-    # Add grid
-    ax1.grid(True, alpha=0.3)
-
-    # Second y-axis for righting moment
-    ax2 = ax1.twinx()
-    color2 = '#dc2626'
-    ax2.set_ylabel('Righting Moment (Nm)', color=color2, fontsize=12)
-    line2, = ax2.plot(angles, rm_values, 's--', color=color2, linewidth=1.5,
-                      markersize=3, alpha=0.7, label='RM (Nm)')
-    ax2.tick_params(axis='y', labelcolor=color2)
-
-    # Mark ama engagement angle if detected
-    ama_angle = gz_result['summary'].get('ama_engagement_angle_deg')
-    if ama_angle is not None:
-        ax1.axvline(x=ama_angle, color='orange', linestyle=':', alpha=0.7, linewidth=2,
-                    label=f'Ama engages ({ama_angle:.1f}°)')
-
-    # Add summary statistics to plot
-    summary = gz_result['summary']
-    stats_text = (
-        f"Max GZ: {summary['max_gz_m']*100:.1f} cm at {summary['max_gz_angle_deg']}°"
-    )
-    if summary.get('turtle_angle_deg'):
-        stats_text += f"\nTurtle: {summary['turtle_angle_deg']:.1f}°"
-    if summary.get('capsize_angle_deg'):
-        stats_text += f"\nCapsize: {summary['capsize_angle_deg']:.1f}°"
-    if ama_angle is not None:
-        stats_text += f"\nAma engages: {ama_angle:.1f}°"
-    stats_text += f"\nEquilibrium roll: {eq_roll:.1f}°"
+        hull: Hull geometry loaded from the FreeCAD design file
+        buoyancy_result: Result from buoyancy equilibrium solver
+        heel_angles: List of heel angles in degrees (default: DEFAULT_HEEL_ANGLES)
+        table: Optional HydrostaticTable to narrow each equilibrium search
+        curves: Optional HydrostaticCurves for the first (upright) search
+        verbose: Print progress
+
+    Returns:
+        Dictionary with GZ curve data (in heel_angles order)
+    """
+    if heel_angles is None:
+        heel_angles = DEFAULT_HEEL_ANGLES
+
+    points = {}
+    for chain in continuation_chains(heel_angles):
+        for point in _solve_chain(hull, buoyancy_result, chain, table, curves, verbose):
+            points[point['heel_deg']] = point
+    gz_data = [points[roll_deg] for roll_deg in heel_angles]
+    return _gz_result(buoyancy_result, gz_data)
+
+
+def continuation_chains(heel_angles: list,
+                        chain_length: int = CONTINUATION_CHAIN_LENGTH) -> list:
+    """
+    Split heel angles into continuation chains.
+
+    Each side of upright (upright itself goes with the positive side) is
+    ordered outwards from upright and cut into chains of chain_length
+    angles. The chains depend on the heel angles only, not on the number
+    of processes they are spread across.
+
+    Returns:
+        List of chains, each a list of heel angles in solving order
+    """
+    positive = sorted(angle for angle in heel_angles if angle >= 0)
+    negative = sorted((angle for angle in heel_angles if angle < 0), reverse=True)
+    chains = []
+    for side in (positive, negative):
+        chains += [side[i:i + chain_length] for i in range(0, len(side), chain_length)]
+    return chains
+
+
+def _solve_chain(hull: HullModel, buoyancy_result: dict, chain: list,
+                 table=None, curves=None, verbose: bool = False) -> list:
+    """
+    Compute the GZ points of a continuation chain in order.
+
+    The first search starts from the upright z (see compute_gz_point), each
+    following one from the converged z of the previous angle, or again from
+    upright if that did not converge.
+
+    Returns:
+        GZ points in chain order
+    """
+    points = []
+    z_initial = None
+    for roll_deg in chain:
+        if verbose:
+            print(f"  Computing GZ at heel = {roll_deg:+.1f}°...", end='', flush=True)
+
+        point = compute_gz_point(hull, buoyancy_result, roll_deg, table, curves, z_initial)
+
+        if verbose:
+            print(_format_gz_point(point))
+
+        z_initial = point['z_eq_mm'] if point['converged'] else None
+        points.append(point)
+    return points
+
+
+def _refine_heel_angles(hull: HullModel, buoyancy_result: dict, heel_angles: list,
+                        points: dict, table=None, curves=None,
+                        verbose: bool = True) -> dict:
+    """
+    Compute GZ points for heel angles between angles already solved.
+
+    Each search starts from the converged z of the closest solved angle on
+    the upright side of it (or from upright if there is none).
+
+    Args:
+        points: {heel_deg: GZ point} already computed; extended in place
+
+    Returns:
+        points
+    """
+    solved = {angle: point for angle, point in points.items() if point['converged']}
+    for roll_deg in heel_angles:
+        if verbose:
+            print(f"  Computing GZ at heel = {roll_deg:+.1f}°...", end='', flush=True)
+
+        inner = [angle for angle in solved
+                 if abs(angle) < abs(roll_deg) and (angle >= 0) == (roll_deg >= 0)]
+        z_initial = solved[max(inner, key=abs)]['z_eq_mm'] if inner else None
+
+        point = compute_gz_point(hull, buoyancy_result, roll_deg, table, curves, z_initial)
+
+        if verbose:
+            print(_format_gz_point(point))
+
+        points[roll_deg] = point
+
+    return points
+
+
+def _interval_needs_refinement(gz_data: list, i: int, tolerance_m: float) -> bool:
+    """
+    Whether the heel interval between gz_data[i] and gz_data[i + 1] needs a midpoint.
+
+    Refines where a summary feature lies inside the interval (GZ sign change
+    for turtle/capsize, CoB_x jump for ama engagement, edge of convergence)
+    and where a parabola through either neighbouring point predicts the
+    midpoint more than tolerance_m away from the straight line.
+    """
+    a, b = gz_data[i], gz_data[i + 1]
+    if not (a['converged'] and b['converged']):
+        return a['converged'] != b['converged']
+
+    if (a['gz_m'] > 0) != (b['gz_m'] > 0):
+        return True
+
+    width = b['heel_deg'] - a['heel_deg']
+    if abs(b['cob_x_mm'] - a['cob_x_mm']) / width > AMA_ENGAGEMENT_COB_SLOPE:
+        return True
+
+    midpoint = (a['heel_deg'] + b['heel_deg']) / 2
+    linear = (a['gz_m'] + b['gz_m']) / 2
+    for j in (i - 1, i + 2):
+        if 0 <= j < len(gz_data) and gz_data[j]['converged']:
+            # Lagrange parabola through a, b and the neighbour, at the midpoint
+            x = [a['heel_deg'], b['heel_deg'], gz_data[j]['heel_deg']]
+            y = [a['gz_m'], b['gz_m'], gz_data[j]['gz_m']]
+            parabola = sum(
+                y[k] * math.prod((midpoint - x[m]) / (x[k] - x[m]) for m in range(3) if m != k)
+                for k in range(3)
+            )
+            if abs(parabola - linear) > tolerance_m:
+                return True
+    return False
+
+
+def compute_gz_curve_adaptive(hull: HullModel, buoyancy_result: dict,
+                              min_heel: float = -60.0, max_heel: float = 60.0,
+                              initial_step: float = 5.0,
+                              tolerance_m: float = ADAPTIVE_GZ_TOLERANCE_M,
+                              min_step: float = ADAPTIVE_MIN_STEP_DEG,
+                              max_points: int = ADAPTIVE_MAX_POINTS,
+                              table=None,
+                              curves=None,
+                              verbose: bool = True) -> dict:
+    """
+    Compute the GZ curve on an adaptively refined heel grid.
+
+    Starts from a uniform grid (plus upright) and then bisects, round by
+    round, every interval that still needs it (see
+    _interval_needs_refinement): where the curve bends, and around the
+    turtle, capsize, ama engagement and convergence limits. Intervals are
+    not split below min_step.
+
+    Args:
+        hull: Hull geometry loaded from the FreeCAD design file
+        buoyancy_result: Result from buoyancy equilibrium solver
+        min_heel, max_heel: Heel range in degrees
+        initial_step: Step of the starting grid in degrees
+        tolerance_m: Target GZ accuracy of linear interpolation in m
+        min_step: Smallest heel step in degrees
+        max_points: Stop refining once the curve has this many points
+        table, curves, verbose: See compute_gz_curve
+
+    Returns:
+        Dictionary with GZ curve data (in increasing heel angle order)
+    """
+    intervals = max(1, int(round((max_heel - min_heel) / initial_step)))
+    heel_angles = {round(min_heel + k * (max_heel - min_heel) / intervals, 6)
+                   for k in range(intervals + 1)}
+    if min_heel < 0 < max_heel:
+        heel_angles.add(0.0)
+    heel_angles = sorted(heel_angles)
+
+    points = {}
+    for chain in continuation_chains(heel_angles):
+        for point in _solve_chain(hull, buoyancy_result, chain, table, curves, verbose):
+            points[point['heel_deg']] = point
+
+    while len(points) < max_points:
+        gz_data = [points[angle] for angle in sorted(points)]
+        new_angles = []
+        for i in range(len(gz_data) - 1):
+            width = gz_data[i + 1]['heel_deg'] - gz_data[i]['heel_deg']
+            if width / 2 >= min_step and _interval_needs_refinement(gz_data, i, tolerance_m):
+                new_angles.append(round(gz_data[i]['heel_deg'] + width / 2, 6))
+
+        new_angles = new_angles[:max_points - len(points)]
+        if not new_angles:
+            break
+        if verbose:
+            print(f"  Refining {len(new_angles)} heel intervals")
+        _refine_heel_angles(hull, buoyancy_result, new_angles, points,
+                            table, curves, verbose)
 
-    ax1.text(0.02, 0.98, stats_text, transform=ax1.transAxes, fontsize=10,
-             verticalalignment='top', bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
+    gz_data = [points[angle] for angle in sorted(points)]
+    return _gz_result(buoyancy_result, gz_data)
 
-    # Title
-    mass = gz_result['total_mass_kg']
-    plt.title(f'GZ Curve (Righting Arm) - Displacement: {mass:.0f} kg', fontsize=14)
 
-    # Combined legend
-    lines = [line1, line2]
-    labels = [l.get_label() for l in lines]
-    ax1.legend(lines, labels, loc='upper right')
+def compute_gz_curve_from_kn(kn, buoyancy_result: dict, heel_angles: list = None,
+                             verbose: bool = True) -> dict:
+    """
+    Compute the GZ curve by interpolation in the KN cross curves.
+
+    No hull geometry is evaluated: the equilibrium z and CoB at each heel
+    angle come from the cross curves at the boat's displacement, and the
+    CoG enters through the rigid-body correction (see
+    src/physics/cross_curves.py).
+
+    Args:
+        kn: CrossCurves of the same hull geometry
+        buoyancy_result: Result from buoyancy equilibrium solver
+        heel_angles: List of heel angles in degrees (default: DEFAULT_HEEL_ANGLES)
+        verbose: Print progress
+
+    Returns:
+        Dictionary with GZ curve data (in heel_angles order); angles outside
+        the cross curves are unconverged points
+    """
+    if heel_angles is None:
+        heel_angles = DEFAULT_HEEL_ANGLES
+
+    cog_body = buoyancy_result['center_of_gravity_body']
+    weight_N = buoyancy_result['weight_N']
+    displacement_kg = weight_N / GRAVITY_M_S2
+    rotation_center = kn.rotation_center
+
+    gz_data = []
+    for roll_deg in heel_angles:
+        entry = kn.interpolate(roll_deg, displacement_kg)
+        if entry is None:
+            point = {
+                'heel_deg': roll_deg,
+                'converged': False,
+                'gz_m': 0.0,
+                'righting_moment_Nm': 0.0,
+                'iterations': 0,
+                'error': 'Outside the KN cross curves'
+            }
+        else:
+            cob = {'x': entry['kn_mm'] + rotation_center['x'], 'y': 0.0, 'z': 0.0}
+            point = gz_from_cob(roll_deg, entry['z_eq_mm'], cob, cog_body,
+                                rotation_center, weight_N)
+            # Only the transverse CoB position is tabulated
+            del point['cob_y_mm'], point['cob_z_mm']
+            point.update({
+                'kn_mm': round(entry['kn_mm'], 2),
+                'buoyancy_force_N': round(weight_N, 2),
+                'submerged_volume_liters': round(
+                    displacement_kg / SALTWATER_DENSITY_KG_M3 * 1000.0, 2),
+                'iterations': 0
+            })
 
-    # Tight layout and save
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=150, bbox_inches='tight')
-    plt.close()
+        if verbose:
+            print(f"  GZ at heel = {roll_deg:+.1f}°:{_format_gz_point(point)}")
+        gz_data.append(point)
+
+    return _gz_result(buoyancy_result, gz_data)
+
+
+# Per-process state of compute_gz_curve_parallel workers
+_worker_hull = None
+_worker_table = None
+_worker_curves = None
+_worker_buoyancy_result = None
 
-    print(f"✓ GZ curve plot saved to {output_path}")
+
+def _init_gz_worker(design_path: str, engine: str, mesh_tolerance: float, fuse: bool,
+                    cache_size: int, disk_cache_dir: str, disk_cache_size_mb: float,
+                    table_path: str, curves_path: str, buoyancy_result: dict):
+    """Pool initializer: load the hull geometry once per worker process."""
+    global _worker_hull, _worker_table, _worker_curves, _worker_buoyancy_result
+    disk_cache = DiskCache(disk_cache_dir, disk_cache_size_mb) if disk_cache_dir else None
+    _worker_hull = HullModel(design_path, engine=engine, mesh_tolerance=mesh_tolerance,
+                             cache_size=cache_size, disk_cache=disk_cache, fuse=fuse)
+    _worker_table = HydrostaticTable(table_path) if table_path else None
+    _worker_curves = HydrostaticCurves(curves_path) if curves_path else None
+    _worker_buoyancy_result = buoyancy_result
+
+
+def _gz_chain_worker(chain: list) -> tuple:
+    """
+    Pool task: compute the GZ points of a continuation chain in a worker process.
+
+    Returns:
+        Tuple (points, worker pid, worker cache statistics)
+    """
+    points = _solve_chain(_worker_hull, _worker_buoyancy_result, chain,
+                          _worker_table, _worker_curves)
+    return points, os.getpid(), cache_statistics(_worker_hull)
+
+
+def compute_gz_curve_parallel(design_path: str, buoyancy_result: dict,
+                              heel_angles: list = None,
+                              jobs: int = 2,
+                              engine: str = 'brep',
+                              mesh_tolerance: float = DEFAULT_MESH_TOLERANCE,
+                              fuse: bool = False,
+                              cache_size: int = DEFAULT_CACHE_SIZE,
+                              disk_cache_dir: str = None,
+                              disk_cache_size_mb: float = DEFAULT_DISK_CACHE_SIZE_MB,
+                              table_path: str = None,
+                              curves_path: str = None,
+                              verbose: bool = True) -> dict:
+    """
+    Compute the GZ curve with heel angles spread across worker processes.
+
+    Each worker loads the hull geometry from the design file once and then
+    solves whole continuation chains (see continuation_chains), so every
+    search starts from the same z as in compute_gz_curve and the points
+    are the same. Points are collected in heel angle order.
+
+    Args:
+        design_path: Path to FCStd design file
+        buoyancy_result: Result from buoyancy equilibrium solver
+        heel_angles: List of heel angles in degrees (default: DEFAULT_HEEL_ANGLES)
+        jobs: Number of worker processes
+        engine: Hydrostatics engine, one of ENGINES
+        mesh_tolerance: Tessellation tolerance in mm for the mesh engine
+        fuse: Fuse the components of each hull into one solid (see HullModel)
+        cache_size: Pose cache size of each worker's hull
+        disk_cache_dir: Optional on-disk cache directory shared by the workers
+        disk_cache_size_mb: Size cap of the on-disk cache
+        table_path: Optional lookup.npz artifact to narrow each equilibrium search
+        curves_path: Optional hydrostatics.json artifact to narrow each equilibrium search
+        verbose: Print progress
+
+    Returns:
+        Dictionary with GZ curve data; "cache" (and "disk_cache") hold the
+        cache statistics summed over the workers
+    """
+    if heel_angles is None:
+        heel_angles = DEFAULT_HEEL_ANGLES
+
+    chains = continuation_chains(heel_angles)
+    jobs = max(1, min(jobs, len(chains)))
+    if verbose:
+        print(f"  Spreading {len(heel_angles)} heel angles in {len(chains)} chains "
+              f"over {jobs} worker processes")
+
+    points = {}
+    worker_cache_stats = {}
+    with multiprocessing.Pool(
+            jobs,
+            initializer=_init_gz_worker,
+            initargs=(design_path, engine, mesh_tolerance, fuse, cache_size,
+                      disk_cache_dir, disk_cache_size_mb,
+                      table_path, curves_path, buoyancy_result)) as pool:
+        # chunksize=1 balances slow and fast chains
+        for chain_points, pid, cache_stats in pool.imap_unordered(_gz_chain_worker, chains,
+                                                                  chunksize=1):
+            for point in chain_points:
+                if verbose:
+                    print(f"  GZ at heel = {point['heel_deg']:+.1f}°:{_format_gz_point(point)}")
+                points[point['heel_deg']] = point
+            # Counters only grow, so the latest statistics per worker are its totals
+            worker_cache_stats[pid] = cache_stats
+
+    gz_data = [points[roll_deg] for roll_deg in heel_angles]
+    result = _gz_result(buoyancy_result, gz_data)
+    stats = list(worker_cache_stats.values())
+    result['cache'] = merge_cache_stats([s['cache'] for s in stats])
+    if disk_cache_dir:
+        result['disk_cache'] = merge_disk_cache_stats([s['disk_cache'] for s in stats])
+    return result
 
 
 def main():
@@ -488,14 +983,42 @@ def main():
                         help='Path to buoyancy.json artifact')
     parser.add_argument('--output', required=True,
                         help='Path to output JSON file')
-    parser.add_argument('--output-png',
-                        help='Path to output PNG plot (optional, defaults to same name as output with .png)')
     parser.add_argument('--min-heel', type=float, default=-60.0,
                         help='Minimum heel angle in degrees (default: -60)')
     parser.add_argument('--max-heel', type=float, default=60.0,
                         help='Maximum heel angle in degrees (default: 60)')
     parser.add_argument('--heel-step', type=float, default=5.0,
                         help='Heel angle step in degrees (default: 5)')
+    parser.add_argument('--adaptive', action='store_true',
+                        help='Refine the heel grid (starting at --heel-step) only where GZ '
+                             'bends or crosses zero, instead of the fixed grid')
+    parser.add_argument('--gz-tolerance', type=float, default=ADAPTIVE_GZ_TOLERANCE_M,
+                        help=f'Target GZ accuracy in m for --adaptive (default: {ADAPTIVE_GZ_TOLERANCE_M})')
+    parser.add_argument('--min-heel-step', type=float, default=ADAPTIVE_MIN_STEP_DEG,
+                        help=f'Smallest heel step in degrees for --adaptive (default: {ADAPTIVE_MIN_STEP_DEG})')
+    parser.add_argument('--jobs', type=int, default=1,
+                        help='Number of worker processes for the heel angles (default: 1)')
+    parser.add_argument('--table',
+                        help='Path to lookup.npz artifact used to narrow each '
+                             'equilibrium search (optional, faster)')
+    parser.add_argument('--curves',
+                        help='Path to hydrostatics.json artifact used to narrow each '
+                             'equilibrium search when there is no table (optional, faster)')
+    parser.add_argument('--kn',
+                        help='Path to kn.json cross curves; if they cover the displacement, '
+                             'GZ is interpolated without evaluating the hull (optional, fastest)')
+    parser.add_argument('--engine', choices=ENGINES, default='brep',
+                        help='Hydrostatics engine: exact OCC booleans or tessellated mesh (default: brep)')
+    parser.add_argument('--mesh-tolerance', type=float, default=DEFAULT_MESH_TOLERANCE,
+                        help=f'Tessellation tolerance in mm for the mesh engine (default: {DEFAULT_MESH_TOLERANCE})')
+    parser.add_argument('--fuse', action='store_true',
+                        help='Fuse the components of each hull (ama, vaka) into one solid at load time')
+    parser.add_argument('--cache-size', type=int, default=DEFAULT_CACHE_SIZE,
+                        help=f'Number of memoized pose evaluations per hull, 0 to disable (default: {DEFAULT_CACHE_SIZE})')
+    parser.add_argument('--disk-cache',
+                        help='Directory of the persistent CoB cache (optional)')
+    parser.add_argument('--disk-cache-size-mb', type=float, default=DEFAULT_DISK_CACHE_SIZE_MB,
+                        help=f'Size cap of the persistent CoB cache (default: {DEFAULT_DISK_CACHE_SIZE_MB:.0f} MB)')
     parser.add_argument('--quiet', action='store_true',
                         help='Suppress progress output')
 
@@ -524,27 +1047,91 @@ def main():
               f"pitch={eq['pitch_deg']:.2f}°, roll={eq['roll_deg']:.2f}°")
         print(f"  Mass: {buoyancy_result['total_mass_kg']:.1f} kg")
 
-    # Generate heel angles with fine steps near 0° to capture ama engagement
-    heel_angles = []
-    angle = args.min_heel
-    while angle <= args.max_heel + 0.01:  # Small epsilon for float comparison
-        heel_angles.append(angle)
-        # Use 1° steps between -5° and +5°, otherwise use heel_step
-        if -6 < angle < 5:
-            angle += 1.0
-        else:
-            angle += args.heel_step
+    heel_angles = heel_angle_grid(args.min_heel, args.max_heel, args.heel_step)
 
     if verbose:
-        print(f"  Computing {len(heel_angles)} points from {args.min_heel}° to {args.max_heel}°")
+        if args.adaptive:
+            print(f"  Adaptive sampling from {args.min_heel}° to {args.max_heel}° "
+                  f"(GZ tolerance {args.gz_tolerance * 100:.1f} cm)")
+            if args.jobs > 1:
+                print("  Adaptive sampling runs in a single process, ignoring --jobs")
+        else:
+            print(f"  Computing {len(heel_angles)} points from {args.min_heel}° to {args.max_heel}°")
+
+    table_path = args.table if args.table and os.path.exists(args.table) else None
+    if verbose and table_path:
+        print(f"  Using lookup table: {table_path}")
+    curves_path = args.curves if args.curves and os.path.exists(args.curves) else None
+    if verbose and curves_path and not table_path:
+        print(f"  Using hydrostatic curves: {curves_path}")
+
+    kn = None
+    if args.kn and os.path.exists(args.kn):
+        kn = CrossCurves(args.kn)
+        displacement_kg = buoyancy_result['weight_N'] / GRAVITY_M_S2
+        if not kn.covers(displacement_kg):
+            if verbose:
+                print(f"  KN cross curves do not cover {displacement_kg:.1f} kg, "
+                      f"computing from the hull")
+            kn = None
+        elif verbose:
+            print(f"  Using KN cross curves: {args.kn}")
 
     # Compute GZ curve
-    result = compute_gz_curve(
-        args.design,
-        buoyancy_result,
-        heel_angles=heel_angles,
-        verbose=verbose
-    )
+    if kn is not None:
+        result = compute_gz_curve_from_kn(kn, buoyancy_result, heel_angles, verbose=verbose)
+        result['kn'] = args.kn
+    elif args.jobs > 1 and not args.adaptive:
+        # Each worker process loads the hull geometry itself
+        result = compute_gz_curve_parallel(
+            args.design,
+            buoyancy_result,
+            heel_angles=heel_angles,
+            jobs=args.jobs,
+            engine=args.engine,
+            mesh_tolerance=args.mesh_tolerance,
+            fuse=args.fuse,
+            cache_size=args.cache_size,
+            disk_cache_dir=args.disk_cache,
+            disk_cache_size_mb=args.disk_cache_size_mb,
+            table_path=table_path,
+            curves_path=curves_path,
+            verbose=verbose
+        )
+    else:
+        # Load hull geometry once for all heel angles
+        disk_cache = DiskCache(args.disk_cache, args.disk_cache_size_mb) if args.disk_cache else None
+        hull = HullModel(args.design, engine=args.engine,
+                         mesh_tolerance=args.mesh_tolerance,
+                         cache_size=args.cache_size,
+                         disk_cache=disk_cache,
+                         fuse=args.fuse)
+        table = HydrostaticTable(table_path) if table_path else None
+        curves = HydrostaticCurves(curves_path) if curves_path else None
+
+        if args.adaptive:
+            result = compute_gz_curve_adaptive(
+                hull,
+                buoyancy_result,
+                min_heel=args.min_heel,
+                max_heel=args.max_heel,
+                initial_step=args.heel_step,
+                tolerance_m=args.gz_tolerance,
+                min_step=args.min_heel_step,
+                table=table,
+                curves=curves,
+                verbose=verbose
+            )
+        else:
+            result = compute_gz_curve(
+                hull,
+                buoyancy_result,
+                heel_angles=heel_angles,
+                table=table,
+                curves=curves,
+                verbose=verbose
+            )
+        result.update(cache_statistics(hull))
 
     # Write JSON output
     os.makedirs(os.path.dirname(args.output) or '.', exist_ok=True)
@@ -560,13 +1147,18 @@ def main():
             print(f"  Turtle angle (ama down): {summary['turtle_angle_deg']:.1f}°")
         if summary.get('capsize_angle_deg'):
             print(f"  Capsize angle (ama up): {summary['capsize_angle_deg']:.1f}°")
-
-    # Generate PNG plot
-    png_path = args.output_png
-    if not png_path:
-        png_path = args.output.replace('.json', '.png')
-
-    plot_gz_curve(result, png_path)
+        print(f"  CoB evaluations per heel angle: {summary['mean_iterations']:.1f} mean, "
+              f"{summary['max_iterations']} max")
+        if result['cached_points']:
+            print(f"  {result['cached_points']} of {len(result['gz_curve'])} points "
+                  f"reused from earlier runs")
+        if 'cache' in result:
+            cache = result['cache']
+            print(f"  Pose cache: {cache['hits']} hits, {cache['misses']} misses")
+        if 'disk_cache' in result:
+            disk = result['disk_cache']
+            print(f"  Disk cache: {disk['hits']} hits, {disk['misses']} misses, "
+                  f"{disk['size_mb']:.1f} MB")
 
 
 if __name__ == "__main__":
@@ -0,0 +1 @@
+# GZ curve plotting stage
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+GZ curve plots - renders gz.json artifacts as PNG.
+
+Plotting is kept out of the gz stage so the physics run never imports
+matplotlib, and a plot can be redone (e.g. after changing its style)
+without recomputing the curve. This stage needs neither FreeCAD nor the
+design, only the gz artifact.
+
+With --batch, every given gz.json is plotted next to itself (.png) in
+one process, so matplotlib is imported once for all boats and
+configurations. Plots newer than their artifact are skipped unless
+--force is given.
+
+Usage:
+    python -m src.gzplot \
+        --input artifact/boat.gz.json \
+        --output artifact/boat.gz.png
+
+    python -m src.gzplot --batch artifact/*.gz.json
+"""
+
+import sys
+import os
+import json
+import argparse
+
+
+def plot_gz_curve(gz_result: dict, output_path: str):
+    """
+    Generate a PNG plot of the GZ curve.
+
+    Args:
+        gz_result: Result from compute_gz_curve
+        output_path: Path for output PNG file
+    """
+    import matplotlib
+    matplotlib.use('Agg')  # Non-interactive backend
+    import matplotlib.pyplot as plt
+
+    # Extract data for plotting
+    gz_data = gz_result['gz_curve']
+    converged = [p for p in gz_data if p.get('converged', False)]
+
+    if not converged:
+        print("Warning: No converged points to plot")
+        return
+
+    angles = [p['heel_deg'] for p in converged]
+    gz_values = [p['gz_m'] * 100 for p in converged]  # Convert to cm for readability
+    rm_values = [p['righting_moment_Nm'] for p in converged]
+
+    # Get equilibrium roll angle
+    eq_roll = gz_result['equilibrium_pose']['roll_deg']
+
+    # Create figure with two y-axes
+    fig, ax1 = plt.subplots(figsize=(10, 6))
+
+    # Plot GZ curve
+    color1 = '#2563eb'
+    ax1.set_xlabel('Heel Angle (degrees)', fontsize=12)
+    ax1.set_ylabel('GZ Righting Arm (cm)', color=color1, fontsize=12)
+    line1, = ax1.plot(angles, gz_values, 'o-', color=color1, linewidth=2,
+                      markersize=4, label='GZ (cm)')
+    ax1.tick_params(axis='y', labelcolor=color1)
+    ax1.axhline(y=0, color='gray', linestyle='--', alpha=0.5)
+    ax1.axvline(x=0, color='gray', linestyle='--', alpha=0.5)
+
+    # Mark the equilibrium roll angle
+    ax1.axvline(x=eq_roll, color='green', linestyle=':', alpha=0.7, linewidth=2,
+                label=f'Equilibrium ({eq_roll:.1f}°)')
+
+    # Add grid
+    ax1.grid(True, alpha=0.3)
+
+    # Second y-axis for righting moment
+    ax2 = ax1.twinx()
+    color2 = '#dc2626'
+    ax2.set_ylabel('Righting Moment (Nm)', color=color2, fontsize=12)
+    line2, = ax2.plot(angles, rm_values, 's--', color=color2, linewidth=1.5,
+                      markersize=3, alpha=0.7, label='RM (Nm)')
+    ax2.tick_params(axis='y', labelcolor=color2)
+
+    # Mark ama engagement angle if detected
+    ama_angle = gz_result['summary'].get('ama_engagement_angle_deg')
+    if ama_angle is not None:
+        ax1.axvline(x=ama_angle, color='orange', linestyle=':', alpha=0.7, linewidth=2,
+                    label=f'Ama engages ({ama_angle:.1f}°)')
+
+    # Add summary statistics to plot
+    summary = gz_result['summary']
+    stats_text = (
+        f"Max GZ: {summary['max_gz_m']*100:.1f} cm at {summary['max_gz_angle_deg']}°"
+    )
+    if summary.get('turtle_angle_deg'):
+        stats_text += f"\nTurtle: {summary['turtle_angle_deg']:.1f}°"
+    if summary.get('capsize_angle_deg'):
+        stats_text += f"\nCapsize: {summary['capsize_angle_deg']:.1f}°"
+    if ama_angle is not None:
+        stats_text += f"\nAma engages: {ama_angle:.1f}°"
+    stats_text += f"\nEquilibrium roll: {eq_roll:.1f}°"
+
+    ax1.text(0.02, 0.98, stats_text, transform=ax1.transAxes, fontsize=10,
+             verticalalignment='top', bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
+
+    # Title
+    mass = gz_result['total_mass_kg']
+    plt.title(f'GZ Curve (Righting Arm) - Displacement: {mass:.0f} kg', fontsize=14)
+
+    # Combined legend
+    lines = [line1, line2]
+    labels = [l.get_label() for l in lines]
+    ax1.legend(lines, labels, loc='upper right')
+
+    # Tight layout and save
+    plt.tight_layout()
+    plt.savefig(output_path, dpi=150, bbox_inches='tight')
+    plt.close()
+
+    print(f"✓ GZ curve plot saved to {output_path}")
+
+
+def png_path_for(gz_path: str) -> str:
+    """Default plot path of a gz artifact: the same name with .png."""
+    root, _ = os.path.splitext(gz_path)
+    return root + '.png'
+
+
+def plot_batch(gz_paths: list, force: bool = False) -> dict:
+    """
+    Plot several gz artifacts next to themselves.
+
+    Args:
+        gz_paths: Paths of gz.json artifacts
+        force: Replot even if the PNG is newer than the artifact
+
+    Returns:
+        Dictionary with the lists of plotted, skipped (up to date) and
+        failed artifact paths
+    """
+    plotted, skipped, failed = [], [], []
+    for gz_path in gz_paths:
+        png_path = png_path_for(gz_path)
+        if (not force and os.path.exists(png_path) and
+                os.path.getmtime(png_path) >= os.path.getmtime(gz_path)):
+            skipped.append(gz_path)
+            continue
+        try:
+            with open(gz_path) as f:
+                gz_result = json.load(f)
+            plot_gz_curve(gz_result, png_path)
+            plotted.append(gz_path)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"ERROR: {gz_path}: {e}", file=sys.stderr)
+            failed.append(gz_path)
+    return {'plotted': plotted, 'skipped': skipped, 'failed': failed}
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Plot GZ (righting arm) curves',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+    parser.add_argument('--input',
+                        help='Path to gz.json artifact')
+    parser.add_argument('--output',
+                        help='Path to output PNG plot (default: same name as input with .png)')
+    parser.add_argument('--batch', nargs='*', metavar='GZ_JSON',
+                        help='Plot all these gz.json artifacts next to themselves')
+    parser.add_argument('--force', action='store_true',
+                        help='With --batch, replot even if the PNG is up to date')
+
+    args = parser.parse_args()
+
+    if args.batch is not None:
+        result = plot_batch(args.batch, args.force)
+        print(f"✓ {len(result['plotted'])} GZ plots written, "
+              f"{len(result['skipped'])} up to date, {len(result['failed'])} failed")
+        if result['failed']:
+            sys.exit(1)
+        return
+
+    if not args.input:
+        parser.error('--input or --batch is required')
+
+    if not os.path.exists(args.input):
+        print(f"ERROR: GZ file not found: {args.input}", file=sys.stderr)
+        sys.exit(1)
+
+    with open(args.input) as f:
+        gz_result = json.load(f)
+
+    output = args.output or png_path_for(args.input)
+    os.makedirs(os.path.dirname(output) or '.', exist_ok=True)
+    plot_gz_curve(gz_result, output)
+
+
+if __name__ == "__main__":
+    main()
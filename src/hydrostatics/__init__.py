@@ -0,0 +1 @@
+# Hydrostatic curves stage
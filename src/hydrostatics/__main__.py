@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Hydrostatic curves - upright hydrostatic particulars versus draft.
+
+Sweeps the hull of a design once through level-trim drafts and writes the
+classic hydrostatic curves (displacement, LCB, KB, waterplane area, TPC,
+MCT, metacentric radii) as a JSON table (see
+src/physics/hydrostatic_curves.py). The buoyancy and gz stages read it
+(--curves option) to start their equilibrium searches at the interpolated
+draft instead of bisecting over the whole z range.
+
+Only the hull is swept, so the base design of a boat gives the same curves
+as any of its configurations; the Makefile builds one set per boat from it
+(USE_HYDROSTATICS=yes passes them to buoyancy and gz).
+
+Usage:
+    python -m src.hydrostatics \
+        --design artifact/boat.base.FCStd \
+        --output artifact/boat.hydrostatics.json
+"""
+
+import sys
+import os
+import time
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
+
+try:
+    import FreeCAD as App
+except ImportError as e:
+    print(f"ERROR: {e}", file=sys.stderr)
+    print("This script must be run with FreeCAD's Python", file=sys.stderr)
+    sys.exit(1)
+
+from src.physics.center_of_buoyancy import HullModel, ENGINES
+from src.physics.mesh_hydrostatics import DEFAULT_MESH_TOLERANCE
+from src.physics.hydrostatic_curves import compute_hydrostatic_curves, save_hydrostatic_curves
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Compute hydrostatic curves versus draft',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+    parser.add_argument('--design', required=True,
+                        help='Path to FCStd design file')
+    parser.add_argument('--output', required=True,
+                        help='Path to output JSON file')
+    parser.add_argument('--draft-count', type=int, default=101,
+                        help='Number of drafts from keel to fully submerged (default: 101)')
+    parser.add_argument('--engine', choices=ENGINES, default='brep',
+                        help='Hydrostatics engine used for sampling (default: brep)')
+    parser.add_argument('--mesh-tolerance', type=float, default=DEFAULT_MESH_TOLERANCE,
+                        help=f'Tessellation tolerance in mm for the mesh engine (default: {DEFAULT_MESH_TOLERANCE})')
+    parser.add_argument('--fuse', action='store_true',
+                        help='Fuse the components of each hull (ama, vaka) into one solid at load time')
+    parser.add_argument('--quiet', action='store_true',
+                        help='Suppress progress output')
+
+    args = parser.parse_args()
+
+    if not os.path.exists(args.design):
+        print(f"ERROR: Design file not found: {args.design}", file=sys.stderr)
+        sys.exit(1)
+
+    verbose = not args.quiet
+
+    if verbose:
+        print(f"Computing hydrostatic curves: {args.design}")
+
+    hull = HullModel(args.design, engine=args.engine,
+                     mesh_tolerance=args.mesh_tolerance,
+                     fuse=args.fuse)
+
+    start = time.time()
+    result = compute_hydrostatic_curves(hull, args.draft_count)
+    elapsed = time.time() - start
+
+    os.makedirs(os.path.dirname(args.output) or '.', exist_ok=True)
+    save_hydrostatic_curves(result, args.output, {
+        'design': args.design,
+        'engine': args.engine
+    })
+
+    if verbose:
+        curves = result['curves']
+        print(f"  {args.draft_count} drafts from 0 to {curves['draft_mm'][-1]:.0f} mm "
+              f"in {elapsed:.1f} s ({args.engine} engine)")
+        print(f"  Fully submerged: {curves['displacement_kg'][-1]:.1f} kg")
+        print(f"✓ Hydrostatic curves saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+# KN cross curves stage
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+KN cross curves - transverse stability of the hull for any loading.
+
+For each displacement of a range and each heel angle (level pitch), finds
+the equilibrium z where buoyancy equals the displacement and records the
+transverse CoB position relative to the hull rotation center (KN). The
+table depends on the hull geometry only; the gz stage (--kn option)
+interpolates it and applies the CoG correction, so the GZ curve of any
+mass, CoG, crew position or cargo takes milliseconds (see
+src/physics/cross_curves.py).
+
+Displacements are solved in increasing order and heel angles outward from
+upright; each equilibrium search starts from the solution at the same
+heel angle for the previous displacement, or at the neighbouring heel
+angle.
+
+The hull shapes are the same in every configuration, so the Makefile
+builds one set per boat from the configuration-invariant base design
+(src/design, DESIGN_PART=base) and every configuration's gz run reads it.
+
+Usage:
+    python -m src.kn \
+        --design artifact/boat.base.FCStd \
+        --output artifact/boat.kn.json
+"""
+
+import sys
+import os
+import time
+import argparse
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
+
+try:
+    import FreeCAD as App
+except ImportError as e:
+    print(f"ERROR: {e}", file=sys.stderr)
+    print("This script must be run with FreeCAD's Python", file=sys.stderr)
+    sys.exit(1)
+
+from src.physics.center_of_buoyancy import (
+    HullModel, ENGINES, SALTWATER_DENSITY_KG_M3, GRAVITY_M_S2
+)
+from src.physics.mesh_hydrostatics import DEFAULT_MESH_TOLERANCE
+from src.physics.hydrostatic_curves import HydrostaticCurves
+from src.physics.cross_curves import save_cross_curves
+from src.gz.__main__ import find_equilibrium_z_at_heel, heel_angle_grid
+
+# Default displacement range as fractions of the fully submerged displacement
+DEFAULT_MIN_DISPLACEMENT_FRACTION = 0.05
+DEFAULT_MAX_DISPLACEMENT_FRACTION = 0.6
+
+# Default number of displacements
+DEFAULT_DISPLACEMENT_COUNT = 12
+
+
+def submerged_displacement_kg(hull: HullModel) -> float:
+    """Displacement of the fully submerged hull in kg."""
+    volume_mm3 = hull.total_ama_volume_mm3 + hull.total_vaka_volume_mm3
+    return volume_mm3 * SALTWATER_DENSITY_KG_M3 / 1e9
+
+
+def compute_cross_curves(hull: HullModel, heel_angles: list, displacements_kg: list,
+                         curves=None, verbose: bool = True) -> dict:
+    """
+    Compute KN and equilibrium z over a (displacement, heel) grid.
+
+    Args:
+        hull: Hull geometry loaded from the FreeCAD design file
+        heel_angles: Heel angles in degrees
+        displacements_kg: Displacements in kg
+        curves: Optional HydrostaticCurves for the upright starting z of
+                each displacement
+        verbose: Print progress
+
+    Returns:
+        Dictionary for save_cross_curves (grid in increasing order) plus
+        the number of CoB evaluations
+    """
+    heel_angles = sorted(heel_angles)
+    displacements_kg = sorted(displacements_kg)
+    center = hull.rotation_center
+
+    kn_mm = np.full((len(displacements_kg), len(heel_angles)), np.nan)
+    z_eq_mm = np.full_like(kn_mm, np.nan)
+    evaluations = 0
+
+    # Heel angle columns in order of increasing magnitude
+    order = sorted(range(len(heel_angles)), key=lambda j: abs(heel_angles[j]))
+
+    for i, displacement_kg in enumerate(displacements_kg):
+        weight_N = displacement_kg * GRAVITY_M_S2
+        z_upright = curves.z_for_displacement(displacement_kg) if curves is not None else None
+        failed = 0
+
+        for j in order:
+            # Continue from the previous displacement, else the nearest angle solved
+            if i > 0 and np.isfinite(z_eq_mm[i - 1, j]):
+                z_initial = z_eq_mm[i - 1, j]
+            else:
+                solved = [k for k in range(len(heel_angles)) if np.isfinite(z_eq_mm[i, k])]
+                if solved:
+                    nearest = min(solved, key=lambda k: abs(heel_angles[k] - heel_angles[j]))
+                    z_initial = z_eq_mm[i, nearest]
+                elif z_upright is not None:
+                    z_initial = z_upright
+                else:
+                    z_initial = -500.0
+
+            result = find_equilibrium_z_at_heel(hull, weight_N, 0.0, heel_angles[j],
+                                                z_initial=float(z_initial))
+            evaluations += result['iterations']
+            if not result['converged']:
+                failed += 1
+                continue
+
+            z_eq_mm[i, j] = result['z_mm']
+            kn_mm[i, j] = result['cob_result']['CoB']['x'] - center.x
+
+        if verbose:
+            status = f", {failed} heel angles without equilibrium" if failed else ""
+            print(f"  {displacement_kg:8.1f} kg: {len(heel_angles) - failed} heel angles{status}")
+
+    return {
+        'heel_deg': heel_angles,
+        'displacement_kg': displacements_kg,
+        'kn_mm': kn_mm,
+        'z_eq_mm': z_eq_mm,
+        'rotation_center': {'x': center.x, 'y': center.y, 'z': center.z},
+        'pitch_deg': 0.0,
+        'water_density_kg_m3': SALTWATER_DENSITY_KG_M3,
+        'evaluations': evaluations
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Compute KN cross curves of stability',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+    parser.add_argument('--design', required=True,
+                        help='Path to FCStd design file')
+    parser.add_argument('--output', required=True,
+                        help='Path to output JSON file')
+    parser.add_argument('--curves',
+                        help='Path to hydrostatics.json artifact for the upright starting z '
+                             'of each displacement (optional, faster)')
+    parser.add_argument('--min-displacement', type=float,
+                        help=f'Smallest displacement in kg (default: '
+                             f'{DEFAULT_MIN_DISPLACEMENT_FRACTION:.0%} of fully submerged)')
+    parser.add_argument('--max-displacement', type=float,
+                        help=f'Largest displacement in kg (default: '
+                             f'{DEFAULT_MAX_DISPLACEMENT_FRACTION:.0%} of fully submerged)')
+    parser.add_argument('--displacement-count', type=int, default=DEFAULT_DISPLACEMENT_COUNT,
+                        help=f'Number of displacements (default: {DEFAULT_DISPLACEMENT_COUNT})')
+    parser.add_argument('--min-heel', type=float, default=-60.0,
+                        help='Minimum heel angle in degrees (default: -60)')
+    parser.add_argument('--max-heel', type=float, default=60.0,
+                        help='Maximum heel angle in degrees (default: 60)')
+    parser.add_argument('--heel-step', type=float, default=5.0,
+                        help='Heel angle step in degrees (default: 5)')
+    parser.add_argument('--engine', choices=ENGINES, default='brep',
+                        help='Hydrostatics engine: exact OCC booleans or tessellated mesh (default: brep)')
+    parser.add_argument('--mesh-tolerance', type=float, default=DEFAULT_MESH_TOLERANCE,
+                        help=f'Tessellation tolerance in mm for the mesh engine (default: {DEFAULT_MESH_TOLERANCE})')
+    parser.add_argument('--fuse', action='store_true',
+                        help='Fuse the components of each hull (ama, vaka) into one solid at load time')
+    parser.add_argument('--quiet', action='store_true',
+                        help='Suppress progress output')
+
+    args = parser.parse_args()
+
+    if not os.path.exists(args.design):
+        print(f"ERROR: Design file not found: {args.design}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.displacement_count < 1:
+        print("ERROR: --displacement-count must be at least 1", file=sys.stderr)
+        sys.exit(1)
+
+    verbose = not args.quiet
+
+    if verbose:
+        print(f"Computing KN cross curves: {args.design}")
+
+    hull = HullModel(args.design, engine=args.engine,
+                     mesh_tolerance=args.mesh_tolerance,
+                     fuse=args.fuse)
+    curves = HydrostaticCurves(args.curves) if args.curves and os.path.exists(args.curves) else None
+
+    submerged_kg = submerged_displacement_kg(hull)
+    min_displacement = (args.min_displacement if args.min_displacement is not None
+                        else DEFAULT_MIN_DISPLACEMENT_FRACTION * submerged_kg)
+    max_displacement = (args.max_displacement if args.max_displacement is not None
+                        else DEFAULT_MAX_DISPLACEMENT_FRACTION * submerged_kg)
+    displacements_kg = list(np.linspace(min_displacement, max_displacement,
+                                        args.displacement_count))
+    heel_angles = heel_angle_grid(args.min_heel, args.max_heel, args.heel_step)
+
+    if verbose:
+        print(f"  {len(displacements_kg)} displacements from {min_displacement:.1f} to "
+              f"{max_displacement:.1f} kg, {len(heel_angles)} heel angles from "
+              f"{args.min_heel}° to {args.max_heel}°")
+
+    start = time.time()
+    result = compute_cross_curves(hull, heel_angles, displacements_kg, curves, verbose)
+    elapsed = time.time() - start
+
+    os.makedirs(os.path.dirname(args.output) or '.', exist_ok=True)
+    save_cross_curves(result, args.output, {
+        'design': args.design,
+        'engine': args.engine
+    })
+
+    if verbose:
+        print(f"  {result['evaluations']} CoB evaluations in {elapsed:.1f} s ({args.engine} engine)")
+        print(f"✓ KN cross curves saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
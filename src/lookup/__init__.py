@@ -0,0 +1 @@
+# Hydrostatic lookup table stage
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Hydrostatic lookup table - samples submerged volume and CoB over a pose grid.
+
+Evaluates the hull of a design on a regular (z, pitch, roll) grid and stores
+submerged volume and first moments as a compressed .npz artifact. The
+buoyancy and gz stages can answer most pose queries from this table by
+trilinear interpolation (see src/physics/lookup_table.py) and only use the
+exact hull for the final polish near the solution (--table option).
+
+The table depends on the hull only and is built once per boat from the base
+model. Its default z range covers only what --table queries: the
+equilibrium z at every roll of the grid for the displacements of the KN
+stage (5% to 60% of fully submerged), widened by the pitch range and by the
+polish window of the exact search. --full-z-range samples everything from
+fully dry to fully submerged instead.
+
+Build time is the pose count times the cost of one CoB evaluation. The
+default grid is 31 z x 7 pitch x 61 roll = 13237 poses, which is about a
+third of the earlier full-range grid (61 x 11 x 61). The stage times the
+evaluations of the z range search and prints the expected build time before
+sampling.
+
+Usage:
+    python -m src.lookup \
+        --design artifact/boat.base.FCStd \
+        --output artifact/boat.lookup.npz
+"""
+
+import sys
+import os
+import time
+import argparse
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
+
+try:
+    import FreeCAD as App
+except ImportError as e:
+    print(f"ERROR: {e}", file=sys.stderr)
+    print("This script must be run with FreeCAD's Python", file=sys.stderr)
+    sys.exit(1)
+
+from src.physics.center_of_buoyancy import (
+    HullModel, ENGINES, SALTWATER_DENSITY_KG_M3, GRAVITY_M_S2
+)
+from src.physics.mesh_hydrostatics import DEFAULT_MESH_TOLERANCE, transform_vertices
+from src.physics.lookup_table import build_lookup_table, save_lookup_table, HydrostaticTable
+from src.gz.__main__ import find_equilibrium_z_at_heel, TABLE_POLISH_WINDOW_MM
+from src.kn.__main__ import (
+    submerged_displacement_kg, DEFAULT_MIN_DISPLACEMENT_FRACTION,
+    DEFAULT_MAX_DISPLACEMENT_FRACTION
+)
+
+
+def hull_corners(hull: HullModel) -> np.ndarray:
+    """Corners of the bounding boxes of all hull shapes (body frame)"""
+    corners = []
+    for hs in hull.hull_shapes:
+        bbox = hs["shape"].BoundBox
+        for x in (bbox.XMin, bbox.XMax):
+            for y in (bbox.YMin, bbox.YMax):
+                for z in (bbox.ZMin, bbox.ZMax):
+                    corners.append((x, y, z))
+    return np.array(corners)
+
+
+def full_z_range(hull: HullModel, pitch_values, roll_values) -> tuple:
+    """
+    Range of z displacements from fully submerged to fully dry.
+
+    Rotates the corners of the hull bounding box through every pitch/roll
+    of the grid and returns (z_min, z_max) such that the hull is completely
+    below the water at z_min and completely above it at z_max.
+    """
+    corners = hull_corners(hull)
+    center = hull.rotation_center
+    lowest, highest = np.inf, -np.inf
+    for pitch in pitch_values:
+        for roll in roll_values:
+            world = transform_vertices(corners, 0.0, pitch, roll,
+                                       (center.x, center.y, center.z))
+            lowest = min(lowest, world[:, 2].min())
+            highest = max(highest, world[:, 2].max())
+
+    return -highest, -lowest
+
+
+def floating_z_range(hull: HullModel, pitch_max: float, roll_values,
+                     verbose: bool = True) -> dict:
+    """
+    Range of z displacements the buoyancy and gz searches query.
+
+    Solves the equilibrium z at pitch 0 for the lightest and heaviest KN
+    displacement at every roll of the grid, then widens the band by the
+    largest vertical shift of a hull corner over the pitch range and by
+    TABLE_POLISH_WINDOW_MM on both sides.
+
+    Returns:
+        Dictionary with z_min, z_max, the number of CoB evaluations and
+        their total time in seconds
+    """
+    submerged_kg = submerged_displacement_kg(hull)
+    weights_N = [fraction * submerged_kg * GRAVITY_M_S2
+                 for fraction in (DEFAULT_MIN_DISPLACEMENT_FRACTION,
+                                  DEFAULT_MAX_DISPLACEMENT_FRACTION)]
+
+    start = time.time()
+    evaluations = 0
+    solutions = []
+    for weight_N in weights_N:
+        z_previous = -500.0
+        for roll in sorted(roll_values, key=abs):
+            result = find_equilibrium_z_at_heel(hull, weight_N, 0.0, roll, z_previous)
+            evaluations += result['iterations']
+            if not result['converged']:
+                if verbose:
+                    print(f"  WARNING: no equilibrium at roll {roll:.0f}°: "
+                          f"{result.get('error')}")
+                continue
+            solutions.append(result['z_mm'])
+            z_previous = result['z_mm']
+    elapsed = time.time() - start
+
+    if not solutions:
+        raise RuntimeError("No equilibrium found for the KN displacements")
+
+    center = hull.rotation_center
+    reach = np.abs(hull_corners(hull)[:, 0] - center.x).max()
+    margin = reach * np.sin(np.radians(pitch_max)) + TABLE_POLISH_WINDOW_MM
+
+    return {
+        'z_min': min(solutions) - margin,
+        'z_max': max(solutions) + margin,
+        'evaluations': evaluations,
+        'elapsed_s': elapsed
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Sample hydrostatics over a (z, pitch, roll) grid',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+    parser.add_argument('--design', required=True,
+                        help='Path to FCStd design file')
+    parser.add_argument('--output', required=True,
+                        help='Path to output .npz file')
+    parser.add_argument('--z-min', type=float,
+                        help='Lowest z displacement in mm (default: floating band)')
+    parser.add_argument('--z-max', type=float,
+                        help='Highest z displacement in mm (default: floating band)')
+    parser.add_argument('--full-z-range', action='store_true',
+                        help='Default z range from hull fully submerged to fully dry '
+                             'instead of the floating band')
+    parser.add_argument('--z-count', type=int, default=31,
+                        help='Number of z samples (default: 31)')
+    parser.add_argument('--pitch-max', type=float, default=3.0,
+                        help='Pitch range +/- in degrees (default: 3)')
+    parser.add_argument('--pitch-step', type=float, default=1.0,
+                        help='Pitch step in degrees (default: 1)')
+    parser.add_argument('--min-heel', type=float, default=-60.0,
+                        help='Minimum roll angle in degrees (default: -60)')
+    parser.add_argument('--max-heel', type=float, default=60.0,
+                        help='Maximum roll angle in degrees (default: 60)')
+    parser.add_argument('--heel-step', type=float, default=2.0,
+                        help='Roll step in degrees (default: 2)')
+    parser.add_argument('--engine', choices=ENGINES, default='brep',
+                        help='Hydrostatics engine used for sampling (default: brep)')
+    parser.add_argument('--mesh-tolerance', type=float, default=DEFAULT_MESH_TOLERANCE,
+                        help=f'Tessellation tolerance in mm for the mesh engine (default: {DEFAULT_MESH_TOLERANCE})')
+    parser.add_argument('--fuse', action='store_true',
+                        help='Fuse the components of each hull (ama, vaka) into one solid at load time')
+    parser.add_argument('--quiet', action='store_true',
+                        help='Suppress progress output')
+
+    args = parser.parse_args()
+
+    if not os.path.exists(args.design):
+        print(f"ERROR: Design file not found: {args.design}", file=sys.stderr)
+        sys.exit(1)
+
+    verbose = not args.quiet
+
+    if verbose:
+        print(f"Sampling hydrostatic lookup table: {args.design}")
+
+    hull = HullModel(args.design, engine=args.engine,
+                     mesh_tolerance=args.mesh_tolerance,
+                     fuse=args.fuse)
+
+    pitch_count = int(round(2 * args.pitch_max / args.pitch_step)) + 1
+    pitch_values = np.linspace(-args.pitch_max, args.pitch_max, pitch_count)
+    roll_count = int(round((args.max_heel - args.min_heel) / args.heel_step)) + 1
+    roll_values = np.linspace(args.min_heel, args.max_heel, roll_count)
+
+    seconds_per_pose = None
+    if args.full_z_range:
+        z_low, z_high = full_z_range(hull, pitch_values, roll_values)
+    elif args.z_min is None or args.z_max is None:
+        band = floating_z_range(hull, args.pitch_max, roll_values, verbose)
+        z_low, z_high = band['z_min'], band['z_max']
+        if band['evaluations']:
+            seconds_per_pose = band['elapsed_s'] / band['evaluations']
+    z_min = args.z_min if args.z_min is not None else z_low
+    z_max = args.z_max if args.z_max is not None else z_high
+    z_values = np.linspace(z_min, z_max, args.z_count)
+
+    pose_count = len(z_values) * len(pitch_values) * len(roll_values)
+    if verbose:
+        print(f"  Grid: {len(z_values)} z ({z_min:.0f} to {z_max:.0f} mm) x "
+              f"{len(pitch_values)} pitch x {len(roll_values)} roll "
+              f"= {pose_count} poses ({args.engine} engine)")
+        if seconds_per_pose is not None:
+            print(f"  Expected build time: {pose_count * seconds_per_pose / 60:.1f} min "
+                  f"({seconds_per_pose * 1000:.0f} ms per pose)")
+
+    start = time.time()
+    table = build_lookup_table(hull, z_values, pitch_values, roll_values)
+    elapsed = time.time() - start
+
+    os.makedirs(os.path.dirname(args.output) or '.', exist_ok=True)
+    save_lookup_table(table, args.output)
+
+    if verbose:
+        volume_bound = HydrostaticTable(args.output).bounds["volume_mm3"]
+        force_bound = volume_bound * SALTWATER_DENSITY_KG_M3 * GRAVITY_M_S2 / 1e9
+        print(f"  Sampled in {elapsed:.1f} s")
+        print(f"  Force error bound per cell: median {np.median(force_bound):.1f} N, "
+              f"max {force_bound.max():.1f} N")
+        print(f"✓ Lookup table saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,13 +2,36 @@
 """
 Mass analysis validator - computes mass, volume, and component breakdown from FreeCAD model.
 Outputs JSON artifact for downstream validators.
+
+Per-component mass, the world-frame center of gravity, the inertia tensor
+and radii of gyration are computed in one pass, from the geometry index
+written by the design stage when it is up to date (see
+src/physics/geometry_index.py); the FCStd is only opened without it.
+The buoyancy stage reads the CoG from this artifact.
+
+What-if mode (--what-if, --density-factors) re-aggregates mass, CoG and
+material breakdown for other material files, or for a NumPy matrix of
+density factors (one row per case, one column per material used by the
+design, in sorted key order), from the same per-component volume table
+and writes a mass_whatif artifact instead. Geometry is never recomputed.
+
+Usage:
+    python -m src.mass --design artifact/boat.design.FCStd \
+        --materials constant/material/proa.json --output artifact/boat.mass.json
+
+    python -m src.mass --design artifact/boat.design.FCStd \
+        --materials constant/material/proa.json \
+        --what-if light.json heavy.json --density-factors cases.npy \
+        --output artifact/boat.mass_whatif.json
 """
 
 import sys
 import os
 import json
+import time
 import argparse
-import json
+
+import numpy as np
 
 # Add src to path for FreeCAD imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..', 'src'))
@@ -20,117 +43,174 @@ except ImportError as e:
     print("This script must be run with FreeCAD's Python", file=sys.stderr)
     sys.exit(1)
 
+from src.physics.geometry_index import design_objects
+from src.physics.mass_properties import VolumeTable, compute_mass_properties
+
 
 def analyze_mass(fcstd_path: str, materials_path: str) -> dict:
     """
     Analyze mass properties of a FreeCAD model.
+
+    Mass, center of gravity and inertia tensor come from one pass over the
+    design's objects (see src/physics/mass_properties.py).
     
     Returns:
         Dictionary with mass analysis results
     """
-    doc = App.openDocument(fcstd_path)
-
     with open(materials_path, 'r') as m:
         materials_data = json.load(m)
 
     materials = materials_data["materials"]
-        
-    material_weights = {}
-    material_volumes = {}
-    processed_labels = set()
-    all_components = []
-    
-    def get_all_objects(obj_list):
-        """Recursively get all objects including those in groups"""
-        all_objs = []
-        for obj in obj_list:
-            all_objs.append(obj)
-            if hasattr(obj, 'Group'):
-                all_objs.extend(get_all_objects(obj.Group))
-        return all_objs
-    
-    all_objects = get_all_objects(doc.Objects)
-    
-    for obj in all_objects:
-        if not hasattr(obj, 'Shape'):
-            continue
-        
-        if obj.Label in processed_labels:
-            continue
-        
-        # Look for material name in label (format: ComponentName__material_name)
-        label = obj.Label
-        label_lower = label.lower()
-        mat_key = None
-        
-        if '__' in label_lower:
-            parts = label_lower.split('__')
-            if len(parts) >= 2:
-                mat_key = parts[1].rstrip('_0123456789').strip()
-        
-        if mat_key and mat_key in materials:
-            mat = materials[mat_key]
-            volume_m3 = obj.Shape.Volume / 1e9
-            volume_liters = volume_m3 * 1000
-            weight_kg = volume_m3 * mat['density_kg_m3']
-            
-            # Track by material
-            if mat_key not in material_weights:
-                material_weights[mat_key] = 0
-                material_volumes[mat_key] = 0
-            material_weights[mat_key] += weight_kg
-            material_volumes[mat_key] += volume_liters
-            
-            # Track individual component
-            all_components.append({
-                'name': obj.Label,
-                'mass_kg': round(weight_kg, 2),
-                'volume_liters': round(volume_liters, 2),
-                'material': mat['name']
-            })
-            
-            processed_labels.add(obj.Label)
-    
-    total_mass = sum(material_weights.values())
-    total_volume = sum(material_volumes.values())
-    total_volume_air = material_volumes['air']
+
+    properties = compute_mass_properties(design_objects(fcstd_path), materials)
+
+    total_volume = properties['total_volume_liters']
+    total_volume_air = properties['materials'].get('air', {}).get('volume_liters', 0.0)
     
     # Build result
     result = {
         'validator': 'mass',
-        'total_mass_kg': round(total_mass, 2),
-        'total_volume_liters': round(total_volume, 2),
+        'total_mass_kg': properties['total_mass_kg'],
+        'weight_N': properties['weight_N'],
+        'total_volume_liters': total_volume,
         'total_unsinkable_volume_liters':
              round(total_volume - total_volume_air, 2),
         'displacement_saltwater_kg': round(total_volume * 1.025, 2),
-        'materials': {},
-        'components': sorted(all_components, key=lambda x: x['mass_kg'], reverse=True),
-        'component_count': len(all_components)
+        'CoG': properties['CoG'],
+        'inertia_tensor_kg_m2': properties['inertia_tensor_kg_m2'],
+        'radii_of_gyration_m': properties['radii_of_gyration_m'],
+        'point_mass_components': properties['point_mass_components'],
+        'materials': properties['materials'],
+        'components': properties['components'],
+        'component_count': len(properties['components'])
     }
     
-    # Add material breakdown
-    for mat_name in sorted(material_weights.keys()):
-        result['materials'][mat_name] = {
-            'mass_kg': round(material_weights[mat_name], 2),
-            'volume_liters': round(material_volumes[mat_name], 2)
+    return result
+
+
+def _load_materials(materials_path: str) -> dict:
+    with open(materials_path, 'r') as m:
+        return json.load(m)["materials"]
+
+
+def _case_summary(properties: dict) -> dict:
+    return {
+        'total_mass_kg': properties['total_mass_kg'],
+        'weight_N': properties['weight_N'],
+        'CoG': properties['CoG'],
+        'radii_of_gyration_m': properties['radii_of_gyration_m'],
+        'materials': properties['materials']
+    }
+
+
+def analyze_mass_what_if(fcstd_path: str, materials_path: str, what_if_paths: list = (),
+                         density_factors: np.ndarray = None) -> dict:
+    """
+    Mass properties of one design under other material densities.
+
+    The per-component volume table is built once (from the geometry index
+    when fresh) and every case is a re-aggregation of it.
+
+    Args:
+        fcstd_path: Path to the FreeCAD design file
+        materials_path: Baseline materials JSON
+        what_if_paths: Other materials JSON files
+        density_factors: Optional (K, M) matrix of factors applied to the
+                         baseline densities, columns in the order of
+                         material_keys in the result
+
+    Returns:
+        Dictionary with the baseline, one summary per materials file and,
+        with density_factors, per-case totals
+    """
+    table = VolumeTable(design_objects(fcstd_path))
+    baseline = _load_materials(materials_path)
+
+    start = time.time()
+    result = {
+        'validator': 'mass_whatif',
+        'design': fcstd_path,
+        'component_count': len(table.labels),
+        'baseline': dict(materials_file=materials_path, **_case_summary(table.evaluate(baseline))),
+        'cases': [
+            dict(materials_file=path, **_case_summary(table.evaluate(_load_materials(path))))
+            for path in what_if_paths
+        ]
+    }
+
+    if density_factors is not None:
+        keys = table.used_materials(baseline)
+        base_densities = np.array([baseline[key]['density_kg_m3'] for key in keys])
+        factors = np.atleast_2d(np.asarray(density_factors, dtype=float))
+        batch = table.evaluate_batch(keys, factors * base_densities)
+        result['density_factors'] = {
+            'material_keys': keys,
+            'base_density_kg_m3': [float(v) for v in base_densities],
+            'factors': factors.round(6).tolist(),
+            'total_mass_kg': batch['total_mass_kg'].round(2).tolist(),
+            'CoG_mm': batch['CoG_mm'].round(2).tolist(),
+            'radii_of_gyration_m': batch['radii_of_gyration_m'].round(4).tolist()
         }
-    
-    App.closeDocument(doc.Name)
+
+    result['elapsed_ms'] = round((time.time() - start) * 1000, 2)
     return result
 
 
 def main():
-    parser = argparse.ArgumentParser(description='Analyze mass properties of FreeCAD model')
+    parser = argparse.ArgumentParser(
+        description='Analyze mass properties of FreeCAD model',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
     parser.add_argument('--design', required=True, help='Path to FCStd design file')
     parser.add_argument('--materials', required=True, help='Path to materials JSON file')
     parser.add_argument('--output', required=True, help='Path to output JSON artifact')
+    parser.add_argument('--what-if', nargs='+', metavar='MATERIALS',
+                        help='Other materials JSON files to evaluate (writes a what-if artifact)')
+    parser.add_argument('--density-factors',
+                        help='NumPy .npy matrix of density factors, one row per case and one '
+                             'column per material used by the design, in sorted key order '
+                             '(writes a what-if artifact)')
     
     args = parser.parse_args()
     
     if not os.path.exists(args.design):
         print(f"ERROR: Design file not found: {args.design}", file=sys.stderr)
         sys.exit(1)
-    
+
+    if args.what_if or args.density_factors:
+        inputs = (args.what_if or []) + ([args.density_factors] if args.density_factors else [])
+        for path in inputs:
+            if not os.path.exists(path):
+                print(f"ERROR: File not found: {path}", file=sys.stderr)
+                sys.exit(1)
+
+        factors = np.load(args.density_factors) if args.density_factors else None
+        print(f"Mass what-if: {args.design}")
+        try:
+            result = analyze_mass_what_if(args.design, args.materials, args.what_if or [], factors)
+        except ValueError as e:
+            print(f"ERROR: {e}", file=sys.stderr)
+            sys.exit(1)
+
+        os.makedirs(os.path.dirname(args.output) or '.', exist_ok=True)
+        with open(args.output, 'w') as f:
+            json.dump(result, f, indent=2)
+
+        baseline_kg = result['baseline']['total_mass_kg']
+        print(f"✓ Mass what-if complete ({result['elapsed_ms']:.1f} ms)")
+        print(f"  Baseline: {baseline_kg:.2f} kg ({args.materials})")
+        for case in result['cases']:
+            print(f"  {case['total_mass_kg']:.2f} kg ({case['total_mass_kg'] - baseline_kg:+.2f}) "
+                  f"{case['materials_file']}")
+        if 'density_factors' in result:
+            masses = result['density_factors']['total_mass_kg']
+            print(f"  {len(masses)} density cases over "
+                  f"{', '.join(result['density_factors']['material_keys'])}: "
+                  f"{min(masses):.2f} to {max(masses):.2f} kg")
+        print(f"  Output: {args.output}")
+        return
+
     print(f"Analyzing mass properties: {args.design}")
     result = analyze_mass(args.design, args.materials)
     
@@ -141,6 +221,10 @@ def main():
     
     print(f"✓ Mass analysis complete")
     print(f"  Total mass: {result['total_mass_kg']:.2f} kg")
+    print(f"  CoG: ({result['CoG']['x']:.1f}, {result['CoG']['y']:.1f}, {result['CoG']['z']:.1f}) mm")
+    radii = result['radii_of_gyration_m']
+    print(f"  Radii of gyration: roll {radii['roll']:.2f} m, pitch {radii['pitch']:.2f} m, "
+          f"yaw {radii['yaw']:.2f} m")
     print(f"  Components: {result['component_count']}")
     print(f"  Output: {args.output}")
 
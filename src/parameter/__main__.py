@@ -139,7 +139,9 @@ def compute_derived(base: Dict[str, Any]) -> Dict[str, Any]:
 def main():
     parser = argparse.ArgumentParser(description='Compute parameters')
     parser.add_argument('--boat', required=True, help='Path to boat constants')
-    parser.add_argument('--configuration', required=True, help='Path to configuration constants')
+    parser.add_argument('--configuration',
+                        help='Path to configuration constants (without it, only the boat-level '
+                             'parameters of the configuration-invariant base design)')
     parser.add_argument('--output', required=True, help='Path to output JSON artifact')
     
     args = parser.parse_args()
@@ -148,8 +150,10 @@ def main():
     with open(args.boat, 'r') as b:
         boat_data = json.load(b)
     
-    with open(args.configuration, 'r') as c:
-        configuration_data = json.load(c)
+    configuration_data = {}
+    if args.configuration:
+        with open(args.configuration, 'r') as c:
+            configuration_data = json.load(c)
 
     data = boat_data | configuration_data
     
@@ -4,15 +4,61 @@
 # - Center of Buoyancy (CoB) - centroid of submerged volume
 # - Center of Gravity (CoG) - mass-weighted centroid
 #
+# Buoyancy can be computed with exact OCC booleans ("brep" engine) or on
+# a tessellated hull clipped against the water plane ("mesh" engine).
+#
 # These functions are designed to be called iteratively by a
 # buoyancy equilibrium solver (Newton-Raphson).
 
 from .center_of_buoyancy import (
+    HullModel,
     compute_center_of_buoyancy,
+    compute_center_of_buoyancy_batch,
+    select_pose,
     compute_cob,
     transform_shape,
     compute_submerged_volume,
     DEFAULT_HULL_COMPONENTS,
+    ENGINES,
+)
+
+from .mesh_hydrostatics import (
+    tessellate_shape,
+    submerged_properties,
+    submerged_properties_batch,
+)
+
+from .hydrostatic_derivatives import (
+    compute_hydrostatic_derivatives,
+    point_derivatives,
+)
+
+from .cache import (
+    PoseCache,
+    DEFAULT_CACHE_SIZE,
+)
+
+from .disk_cache import (
+    DiskCache,
+    DEFAULT_DISK_CACHE_SIZE_MB,
+)
+
+from .lookup_table import (
+    HydrostaticTable,
+    build_lookup_table,
+    save_lookup_table,
+)
+
+from .geometry_index import (
+    design_objects,
+    build_geometry_index,
+    save_geometry_index,
+    index_path_for,
+)
+
+from .mass_properties import (
+    VolumeTable,
+    compute_mass_properties,
 )
 
 from .center_of_mass import (
@@ -23,11 +69,40 @@ from .center_of_mass import (
 
 __all__ = [
     # Center of Buoyancy
+    'HullModel',
     'compute_center_of_buoyancy',
+    'compute_center_of_buoyancy_batch',
+    'select_pose',
     'compute_cob',
     'transform_shape',
     'compute_submerged_volume',
     'DEFAULT_HULL_COMPONENTS',
+    'ENGINES',
+    # Mesh hydrostatics
+    'tessellate_shape',
+    'submerged_properties',
+    'submerged_properties_batch',
+    # Hydrostatic derivatives
+    'compute_hydrostatic_derivatives',
+    'point_derivatives',
+    # Pose cache
+    'PoseCache',
+    'DEFAULT_CACHE_SIZE',
+    # Disk cache
+    'DiskCache',
+    'DEFAULT_DISK_CACHE_SIZE_MB',
+    # Lookup table
+    'HydrostaticTable',
+    'build_lookup_table',
+    'save_lookup_table',
+    # Geometry index
+    'design_objects',
+    'build_geometry_index',
+    'save_geometry_index',
+    'index_path_for',
+    # Mass properties
+    'VolumeTable',
+    'compute_mass_properties',
     # Center of Gravity
     'compute_center_of_gravity',
     'compute_cog',
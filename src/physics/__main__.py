@@ -12,11 +12,17 @@ Usage:
     python -m src.physics cob --design artifact/boat.design.FCStd \
                               --z -100 --pitch 2.0 --roll 0.5 \
                               --output artifact/boat.cob.json
+
+    # Tolerance report: mesh engine against the exact BREP engine
+    # (--check exits with an error if the mesh engine is out of tolerance)
+    python -m src.physics compare --design artifact/boat.design.FCStd \
+                                  --output /tmp/boat.engines.json --check
 """
 
 import sys
 import os
 import json
+import time
 import argparse
 
 # Add src to path for FreeCAD imports
@@ -30,7 +36,14 @@ except ImportError as e:
     sys.exit(1)
 
 from src.physics.center_of_mass import compute_center_of_gravity, compute_cog_from_mass_artifact
-from src.physics.center_of_buoyancy import compute_center_of_buoyancy
+from src.physics.center_of_buoyancy import HullModel, ENGINES
+from src.physics.mesh_hydrostatics import (
+    DEFAULT_MESH_TOLERANCE,
+    MESH_VOLUME_REL_TOLERANCE,
+    MESH_WATERPLANE_REL_TOLERANCE,
+    MESH_COB_TOLERANCE_MM,
+    mesh_volume,
+)
 
 
 def cmd_cog(args):
@@ -76,13 +89,16 @@ def cmd_cob(args):
     else:
         hull_components = None  # Use default ["vaka", "ama"]
 
-    result = compute_center_of_buoyancy(
-        fcstd_path=args.design,
+    if args.engine == 'mesh':
+        print(f"  Engine: mesh (tolerance {args.mesh_tolerance} mm)")
+
+    hull = HullModel(args.design, hull_components,
+                     engine=args.engine, mesh_tolerance=args.mesh_tolerance)
+    result = hull.center_of_buoyancy(
         z_displacement=args.z,
         pitch_deg=args.pitch,
         roll_deg=args.roll,
-        water_level_z=args.water_level,
-        hull_components=hull_components
+        water_level_z=args.water_level
     )
 
     # Add validator field for pipeline compatibility
@@ -101,6 +117,156 @@ def cmd_cob(args):
     print(f"  Output: {args.output}")
 
 
+def _comparison_poses(hull: HullModel) -> list:
+    """
+    Poses for the engine comparison: three drafts between keel and deck,
+    combined with level, pitched and heeled attitudes.
+    """
+    z_min = min(hs["shape"].BoundBox.ZMin for hs in hull.hull_shapes)
+    z_max = max(hs["shape"].BoundBox.ZMax for hs in hull.hull_shapes)
+
+    poses = []
+    for fraction in (0.1, 0.25, 0.4):
+        z = -(z_min + fraction * (z_max - z_min))
+        for pitch, roll in ((0.0, 0.0), (2.0, 0.0), (0.0, 5.0),
+                            (0.0, 20.0), (0.0, -10.0), (-1.5, 10.0)):
+            poses.append((z, pitch, roll))
+    return poses
+
+
+def compare_engines(fcstd_path: str, mesh_tolerance: float = DEFAULT_MESH_TOLERANCE,
+                    hull_components: list = None) -> dict:
+    """
+    Compare the mesh engine against the exact BREP engine for one design.
+
+    Evaluates both engines on the same set of poses and reports the
+    relative submerged volume and waterplane area errors, the CoB position
+    error and the run time of each engine, and whether the largest errors
+    are within the accepted tolerances (MESH_*_TOLERANCE).
+
+    Args:
+        fcstd_path: Path to the FreeCAD design file
+        mesh_tolerance: Tessellation tolerance for the mesh engine in mm
+        hull_components: Hull component patterns (default: DEFAULT_HULL_COMPONENTS)
+
+    Returns:
+        Dictionary with per-component volume errors, per-pose errors,
+        the tolerances and a summary of maximum errors and timings
+    """
+    brep = HullModel(fcstd_path, hull_components, engine="brep")
+    t0 = time.perf_counter()
+    mesh = HullModel(fcstd_path, hull_components, engine="mesh",
+                     mesh_tolerance=mesh_tolerance)
+    tessellation_seconds = time.perf_counter() - t0
+
+    # Closed-mesh volume of each component against the exact solid volume
+    component_errors = []
+    for hs in mesh.hull_shapes:
+        exact = hs["shape"].Volume
+        meshed = mesh_volume(*hs["mesh"])
+        component_errors.append({
+            "label": hs["label"],
+            "triangles": int(len(hs["mesh"][1])),
+            "volume_liters": round(exact / 1e6, 4),
+            "volume_rel_error": round((meshed - exact) / exact, 6) if exact > 0 else 0.0
+        })
+
+    pose_errors = []
+    brep_seconds = 0.0
+    mesh_seconds = 0.0
+    for z, pitch, roll in _comparison_poses(brep):
+        t0 = time.perf_counter()
+        exact = brep.center_of_buoyancy(z, pitch, roll)
+        brep_seconds += time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        approx = mesh.center_of_buoyancy(z, pitch, roll)
+        mesh_seconds += time.perf_counter() - t0
+
+        v_exact = exact["submerged_volume_mm3"]
+        v_mesh = approx["submerged_volume_mm3"]
+        a_exact = exact["waterplane"]["area_mm2"]
+        a_mesh = approx["waterplane"]["area_mm2"]
+        cob_error = sum((exact["CoB"][k] - approx["CoB"][k]) ** 2 for k in "xyz") ** 0.5
+
+        pose_errors.append({
+            "z_mm": round(z, 2),
+            "pitch_deg": pitch,
+            "roll_deg": roll,
+            "brep_liters": round(v_exact / 1e6, 4),
+            "mesh_liters": round(v_mesh / 1e6, 4),
+            "volume_rel_error": round((v_mesh - v_exact) / v_exact, 6) if v_exact > 0 else 0.0,
+            "brep_waterplane_m2": round(a_exact / 1e6, 4),
+            "mesh_waterplane_m2": round(a_mesh / 1e6, 4),
+            "waterplane_rel_error": round((a_mesh - a_exact) / a_exact, 6) if a_exact > 0 else 0.0,
+            "cob_error_mm": round(cob_error, 2)
+        })
+
+    max_volume_error = max((abs(p["volume_rel_error"]) for p in pose_errors), default=0.0)
+    max_waterplane_error = max((abs(p["waterplane_rel_error"]) for p in pose_errors), default=0.0)
+    max_cob_error = max((p["cob_error_mm"] for p in pose_errors), default=0.0)
+
+    return {
+        "design": fcstd_path,
+        "mesh_tolerance_mm": mesh_tolerance,
+        "tolerances": {
+            "volume_rel_error": MESH_VOLUME_REL_TOLERANCE,
+            "waterplane_rel_error": MESH_WATERPLANE_REL_TOLERANCE,
+            "cob_error_mm": MESH_COB_TOLERANCE_MM
+        },
+        "summary": {
+            "max_component_volume_rel_error": max(
+                (abs(c["volume_rel_error"]) for c in component_errors), default=0.0),
+            "max_volume_rel_error": max_volume_error,
+            "max_waterplane_rel_error": max_waterplane_error,
+            "max_cob_error_mm": max_cob_error,
+            "within_tolerance": (max_volume_error <= MESH_VOLUME_REL_TOLERANCE and
+                                 max_waterplane_error <= MESH_WATERPLANE_REL_TOLERANCE and
+                                 max_cob_error <= MESH_COB_TOLERANCE_MM),
+            "poses": len(pose_errors),
+            "tessellation_seconds": round(tessellation_seconds, 3),
+            "brep_seconds": round(brep_seconds, 3),
+            "mesh_seconds": round(mesh_seconds, 3),
+            "speedup": round(brep_seconds / mesh_seconds, 1) if mesh_seconds > 0 else None
+        },
+        "components": component_errors,
+        "poses": pose_errors
+    }
+
+
+def cmd_compare(args):
+    """Compare mesh and BREP hydrostatics engines."""
+    print(f"Comparing hydrostatics engines: {args.design}")
+    print(f"  Mesh tolerance: {args.mesh_tolerance} mm")
+
+    result = compare_engines(args.design, args.mesh_tolerance)
+
+    # Add validator field for pipeline compatibility
+    result['validator'] = 'engines'
+
+    # Write output
+    os.makedirs(os.path.dirname(args.output) or '.', exist_ok=True)
+    with open(args.output, 'w') as f:
+        json.dump(result, f, indent=2)
+
+    summary = result['summary']
+    print(f"✓ Engine comparison complete ({summary['poses']} poses)")
+    print(f"  Max component volume error: {summary['max_component_volume_rel_error'] * 100:.3f}%")
+    print(f"  Max submerged volume error: {summary['max_volume_rel_error'] * 100:.3f}% "
+          f"(tolerance {MESH_VOLUME_REL_TOLERANCE * 100:.3f}%)")
+    print(f"  Max waterplane area error: {summary['max_waterplane_rel_error'] * 100:.3f}% "
+          f"(tolerance {MESH_WATERPLANE_REL_TOLERANCE * 100:.3f}%)")
+    print(f"  Max CoB error: {summary['max_cob_error_mm']:.2f} mm "
+          f"(tolerance {MESH_COB_TOLERANCE_MM:.2f} mm)")
+    print(f"  Time: brep {summary['brep_seconds']:.2f}s, mesh {summary['mesh_seconds']:.2f}s "
+          f"(+{summary['tessellation_seconds']:.2f}s tessellation)")
+    print(f"  Output: {args.output}")
+
+    if args.check and not summary['within_tolerance']:
+        print("ERROR: Mesh engine out of tolerance", file=sys.stderr)
+        sys.exit(1)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Physics computations for hydrostatic analysis',
@@ -124,14 +290,28 @@ def main():
     cob_parser.add_argument('--roll', type=float, default=0.0, help='Roll angle in degrees (positive = starboard down)')
     cob_parser.add_argument('--water-level', type=float, default=0.0, help='Water surface Z coordinate in mm')
     cob_parser.add_argument('--hull-components', help='Comma-separated list of hull component patterns (default: vaka,ama)')
+    cob_parser.add_argument('--engine', choices=ENGINES, default='brep', help='Hydrostatics engine (default: brep)')
+    cob_parser.add_argument('--mesh-tolerance', type=float, default=DEFAULT_MESH_TOLERANCE,
+                            help=f'Tessellation tolerance in mm for the mesh engine (default: {DEFAULT_MESH_TOLERANCE})')
     cob_parser.add_argument('--output', required=True, help='Path to output JSON file')
 
+    # Engine comparison subcommand
+    compare_parser = subparsers.add_parser('compare', help='Compare mesh engine against exact BREP engine')
+    compare_parser.add_argument('--design', required=True, help='Path to FCStd design file')
+    compare_parser.add_argument('--mesh-tolerance', type=float, default=DEFAULT_MESH_TOLERANCE,
+                                help=f'Tessellation tolerance in mm (default: {DEFAULT_MESH_TOLERANCE})')
+    compare_parser.add_argument('--output', required=True, help='Path to output JSON file')
+    compare_parser.add_argument('--check', action='store_true',
+                                help='Exit with an error if the mesh engine is out of tolerance')
+
     args = parser.parse_args()
 
     if args.command == 'cog':
         cmd_cog(args)
     elif args.command == 'cob':
         cmd_cob(args)
+    elif args.command == 'compare':
+        cmd_compare(args)
     else:
         parser.print_help()
         sys.exit(1)
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Pose-keyed memoization cache for hydrostatic evaluations.
+
+The solvers often evaluate the same pose more than once: the Newton loop
+re-evaluates the pose accepted by the line search, the final result repeats
+the last iterate, and GZ sweeps revisit bracket ends. PoseCache is a small
+in-process LRU cache keyed by the pose rounded to a fixed quantum, so those
+repeats cost a dictionary lookup instead of a boolean operation.
+
+HullModel owns one PoseCache; its hits and misses are written into the
+buoyancy and gz artifacts under "cache".
+
+Usage:
+    from src.physics.cache import PoseCache
+
+    cache = PoseCache(max_size=1024)
+    key = cache.key("pose", z, pitch, roll, water_level_z)
+    result = cache.get(key)
+    if result is None:
+        result = evaluate(z, pitch, roll)
+        cache.put(key, result)
+"""
+
+import copy
+from collections import OrderedDict
+
+
+# Default number of cached results per hull (0 disables caching)
+DEFAULT_CACHE_SIZE = 1024
+
+# Pose quantization: poses closer than this share a cache entry
+DEFAULT_Z_QUANTUM_MM = 1e-3
+DEFAULT_ANGLE_QUANTUM_DEG = 1e-6
+
+
+class PoseCache:
+    """
+    LRU cache of hydrostatic results keyed by quantized pose.
+
+    Results are deep-copied on the way in and out, so callers are free to
+    modify what they get back.
+
+    Attributes:
+        max_size: Maximum number of entries (0 disables caching)
+        hits, misses: Lookup counters
+    """
+
+    def __init__(self, max_size: int = DEFAULT_CACHE_SIZE,
+                 z_quantum_mm: float = DEFAULT_Z_QUANTUM_MM,
+                 angle_quantum_deg: float = DEFAULT_ANGLE_QUANTUM_DEG):
+        self.max_size = max_size
+        self.z_quantum_mm = z_quantum_mm
+        self.angle_quantum_deg = angle_quantum_deg
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def key(self, kind: str, z_displacement: float, pitch_deg: float,
+            roll_deg: float, water_level_z: float = 0.0) -> tuple:
+        """Cache key of a pose; kind separates different result types."""
+        return (kind,
+                round(z_displacement / self.z_quantum_mm),
+                round(pitch_deg / self.angle_quantum_deg),
+                round(roll_deg / self.angle_quantum_deg),
+                round(water_level_z / self.z_quantum_mm))
+
+    def get(self, key: tuple):
+        """Return a copy of the cached result for key, or None."""
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return copy.deepcopy(self._entries[key])
+        self.misses += 1
+        return None
+
+    def put(self, key: tuple, result):
+        """Store a copy of result, evicting the least recently used entries."""
+        if self.max_size <= 0:
+            return
+        self._entries[key] = copy.deepcopy(result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop all entries (counters are kept)."""
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        """Hit/miss counters and occupancy, for the JSON artifacts."""
+        lookups = self.hits + self.misses
+        return {
+            "max_size": self.max_size,
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups > 0 else 0.0
+        }
+
+
+def merge_cache_stats(stats_list: list) -> dict:
+    """
+    Combine PoseCache.stats() of several caches (e.g. one per worker process).
+
+    Returns:
+        Same keys as PoseCache.stats() summed over the caches, plus "caches"
+    """
+    hits = sum(s["hits"] for s in stats_list)
+    misses = sum(s["misses"] for s in stats_list)
+    lookups = hits + misses
+    return {
+        "max_size": sum(s["max_size"] for s in stats_list),
+        "size": sum(s["size"] for s in stats_list),
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": round(hits / lookups, 4) if lookups > 0 else 0.0,
+        "caches": len(stats_list)
+    }
@@ -32,12 +32,24 @@ Usage:
     #     "submerged_volume_liters": ...,
     #     "buoyancy_force_N": ...
     # }
+
+    # For many poses of the same design, load the hull once:
+    from src.physics.center_of_buoyancy import HullModel
+
+    hull = HullModel("artifact/boat.design.FCStd")
+    result = hull.center_of_buoyancy(z_displacement=-100, pitch_deg=2.0, roll_deg=0.5)
+
+    # Or evaluate a whole array of (z, pitch, roll) poses in one call:
+    batch = hull.center_of_buoyancy_batch([(-100, 0, 0), (-100, 0, 5)])
+    # batch["buoyancy_force_N"], batch["CoB"]["x"], ... are NumPy arrays
 """
 
 import sys
 import os
 import math
 
+import numpy as np
+
 # Add src to path for FreeCAD imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..', 'src'))
 
@@ -50,11 +62,38 @@ except ImportError as e:
     print("This module must be run with FreeCAD's Python", file=sys.stderr)
     sys.exit(1)
 
+from .mesh_hydrostatics import (
+    DEFAULT_MESH_TOLERANCE,
+    tessellate_shape,
+    transform_vertices,
+    transform_vertices_batch,
+    merge_meshes,
+    submerged_properties,
+    submerged_properties_batch,
+    empty_waterplane,
+)
+from .cache import PoseCache, DEFAULT_CACHE_SIZE
+from .disk_cache import hull_fingerprint
+
 
 # Physical constants
 SALTWATER_DENSITY_KG_M3 = 1025.0  # kg/m³
 GRAVITY_M_S2 = 9.81  # m/s²
 
+# Hydrostatics engines:
+#   "brep" - exact OCC boolean intersection with a box below the water plane
+#   "mesh" - hull tessellated once, triangles clipped against the water plane
+ENGINES = ("brep", "mesh")
+
+# Hulls whose components are fused into one solid with fuse=True: every
+# component whose pattern starts with "ama" belongs to the ama, all others
+# to the vaka
+HULL_GROUPS = ("ama", "vaka")
+
+# Upper bound on triangles clipped at once by the mesh engine in batch mode
+# (poses x triangles per component); larger batches are split into chunks
+BATCH_TRIANGLE_LIMIT = 2_000_000
+
 
 # =============================================================================
 # BUOYANCY-CONTRIBUTING COMPONENTS
@@ -186,6 +225,41 @@ def transform_shape(shape: Part.Shape, z_displacement: float, pitch_deg: float,
     return transformed
 
 
+def _waterplane_from_cap(submerged: Part.Shape, water_level_z: float,
+                         tolerance: float = 1e-3) -> dict:
+    """
+    Waterplane integrals from the faces of a submerged shape lying on the water plane.
+
+    The boolean with the underwater box closes the submerged shape with flat
+    faces at the water level; together they are the waterplane area.
+
+    Returns:
+        Same keys as mesh_hydrostatics.waterplane_integrals (about world origin)
+    """
+    waterplane = empty_waterplane()
+
+    for face in submerged.Faces:
+        bbox = face.BoundBox
+        if (abs(bbox.ZMin - water_level_z) > tolerance or
+                abs(bbox.ZMax - water_level_z) > tolerance):
+            continue
+
+        area = face.Area
+        center = face.CenterOfMass
+        # Matrix of inertia about the face centroid (unit density):
+        # A11 = ∫(y² + z²), A22 = ∫(x² + z²), A12 = -∫xy, with z = 0 on the face
+        inertia = face.MatrixOfInertia
+
+        waterplane["area_mm2"] += area
+        waterplane["moment_x_mm3"] += area * center.x
+        waterplane["moment_y_mm3"] += area * center.y
+        waterplane["xx_mm4"] += inertia.A22 + area * center.x ** 2
+        waterplane["yy_mm4"] += inertia.A11 + area * center.y ** 2
+        waterplane["xy_mm4"] += -inertia.A12 + area * center.x * center.y
+
+    return waterplane
+
+
 def compute_submerged_volume(shape: Part.Shape, water_level_z: float = 0.0) -> dict:
     """
     Compute the submerged portion of a shape below a water plane.
@@ -199,6 +273,7 @@ def compute_submerged_volume(shape: Part.Shape, water_level_z: float = 0.0) -> d
         - submerged_shape: The submerged portion (Part.Shape or None)
         - volume_mm3: Volume in mm³
         - CoB: Center of buoyancy as {"x", "y", "z"} in mm
+        - waterplane: Waterplane integrals (see _waterplane_from_cap)
     """
     # Get bounding box to determine cutting box dimensions
     bbox = shape.BoundBox
@@ -208,7 +283,8 @@ def compute_submerged_volume(shape: Part.Shape, water_level_z: float = 0.0) -> d
         return {
             "submerged_shape": None,
             "volume_mm3": 0.0,
-            "CoB": {"x": 0.0, "y": 0.0, "z": 0.0}
+            "CoB": {"x": 0.0, "y": 0.0, "z": 0.0},
+            "waterplane": empty_waterplane()
         }
 
     # Create a large box below the water level to use for intersection
@@ -226,7 +302,8 @@ def compute_submerged_volume(shape: Part.Shape, water_level_z: float = 0.0) -> d
         return {
             "submerged_shape": None,
             "volume_mm3": 0.0,
-            "CoB": {"x": 0.0, "y": 0.0, "z": 0.0}
+            "CoB": {"x": 0.0, "y": 0.0, "z": 0.0},
+            "waterplane": empty_waterplane()
         }
 
     # Create the underwater cutting box
@@ -241,7 +318,8 @@ def compute_submerged_volume(shape: Part.Shape, water_level_z: float = 0.0) -> d
         return {
             "submerged_shape": None,
             "volume_mm3": 0.0,
-            "CoB": {"x": 0.0, "y": 0.0, "z": 0.0}
+            "CoB": {"x": 0.0, "y": 0.0, "z": 0.0},
+            "waterplane": empty_waterplane()
         }
 
     # Check if we got a valid result
@@ -249,7 +327,8 @@ def compute_submerged_volume(shape: Part.Shape, water_level_z: float = 0.0) -> d
         return {
             "submerged_shape": None,
             "volume_mm3": 0.0,
-            "CoB": {"x": 0.0, "y": 0.0, "z": 0.0}
+            "CoB": {"x": 0.0, "y": 0.0, "z": 0.0},
+            "waterplane": empty_waterplane()
         }
 
     # Get volume and center of mass of submerged portion
@@ -259,23 +338,773 @@ def compute_submerged_volume(shape: Part.Shape, water_level_z: float = 0.0) -> d
     return {
         "submerged_shape": submerged,
         "volume_mm3": volume_mm3,
-        "CoB": {"x": cog.x, "y": cog.y, "z": cog.z}
+        "CoB": {"x": cog.x, "y": cog.y, "z": cog.z},
+        "waterplane": _waterplane_from_cap(submerged, water_level_z)
+    }
+
+
+def _hull_group(pattern: str) -> str:
+    """Hull (one of HULL_GROUPS) a hull component pattern belongs to."""
+    return "ama" if pattern.startswith("ama") else "vaka"
+
+
+def fuse_shapes(shapes: list) -> Part.Shape:
+    """
+    Fuse shapes into a single solid.
+
+    Falls back to a compound of the shapes if the boolean fuse fails, which
+    still lets one common() cut all of them at once.
+    """
+    if len(shapes) == 1:
+        return shapes[0].copy()
+    try:
+        fused = shapes[0].multiFuse(shapes[1:]).removeSplitter()
+        if not fused.isNull():
+            return fused
+    except Exception as e:
+        print(f"Warning: Fusing hull components failed: {e}", file=sys.stderr)
+    return Part.makeCompound(shapes)
+
+
+def _match_hull_pattern(label: str, hull_components: list):
+    """Return the first hull component pattern matching a label, or None."""
+    label_lower = label.lower()
+    for pattern in hull_components:
+        if pattern.lower() in label_lower:
+            return pattern
+    return None
+
+
+def _transform_ref_point(ref_body: dict, z_disp: float, pitch: float, roll: float,
+                         rot_center: Base.Vector) -> dict:
+    """Transform a reference point from body to world frame."""
+    # Translate to rotation center
+    x = ref_body["x"] - rot_center.x
+    y = ref_body["y"] - rot_center.y
+    z = ref_body["z"] - rot_center.z
+
+    # Apply rotation (R = Ry(roll) * Rx(pitch))
+    pitch_rad = math.radians(pitch)
+    roll_rad = math.radians(roll)
+    cos_p, sin_p = math.cos(pitch_rad), math.sin(pitch_rad)
+    cos_r, sin_r = math.cos(roll_rad), math.sin(roll_rad)
+
+    x_new = cos_r * x + sin_r * sin_p * y + sin_r * cos_p * z
+    y_new = cos_p * y - sin_p * z
+    z_new = -sin_r * x + cos_r * sin_p * y + cos_r * cos_p * z
+
+    # Translate back and apply z displacement
+    return {
+        "x": round(x_new + rot_center.x, 2),
+        "y": round(y_new + rot_center.y, 2),
+        "z": round(z_new + rot_center.z + z_disp, 2)
+    }
+
+
+class HullModel:
+    """
+    Hull geometry of a design, loaded once for repeated pose queries.
+
+    Loading the FreeCAD document, walking its objects, matching labels against
+    the hull component patterns and computing volumes, rotation center and
+    ama/vaka reference points does not depend on the pose. HullModel does all
+    of this once; center_of_buoyancy() then only transforms the hull shapes and
+    intersects them with the water.
+
+    With engine="mesh", the hull shapes are also tessellated once at load time
+    and each pose is evaluated on the triangle meshes (see mesh_hydrostatics.py)
+    instead of with OCC booleans.
+
+    With fuse=True, the components of each hull (ama, vaka) are fused into
+    one solid at load time (one merged mesh for the mesh engine), so a pose
+    costs two transforms and intersections instead of one per component.
+    The per-component breakdown is then only computed on request, by
+    component_breakdown(). Fused solids count volume shared by overlapping
+    components once; the mesh engine sums the components as before.
+
+    Results are memoized per pose in an LRU cache (see cache.py), so repeated
+    evaluations of the same pose are free; cache_size=0 disables it. With a
+    DiskCache (see disk_cache.py), results also persist across runs, keyed
+    by a hash of the hull geometry.
+
+    Usage:
+        hull = HullModel("artifact/boat.design.FCStd")
+        for z in (-100, -200, -300):
+            result = hull.center_of_buoyancy(z, pitch_deg=0.0, roll_deg=0.0)
+
+    Attributes:
+        fcstd_path: Path to the FreeCAD design file
+        hull_components: Component name patterns used to select hull shapes
+        engine: Hydrostatics engine, one of ENGINES
+        fuse: Evaluate one fused solid per hull instead of each component
+        hull_shapes: List of {"label", "shape", "pattern"} for matched objects
+                     (plus "mesh": (vertices, faces) for the mesh engine)
+        fused_shapes: Same layout, one entry per hull of HULL_GROUPS (fuse=True)
+        rotation_center: Volume-weighted center of the hull shapes (body frame)
+        ama_ref_body, vaka_ref_body: Hull reference points (body frame)
+        total_ama_volume_mm3, total_vaka_volume_mm3: Total hull volumes
+        cache: PoseCache of evaluated poses
+        disk_cache: Optional DiskCache shared across runs
+    """
+
+    def __init__(self, fcstd_path: str, hull_components: list = None,
+                 engine: str = "brep",
+                 mesh_tolerance: float = DEFAULT_MESH_TOLERANCE,
+                 cache_size: int = DEFAULT_CACHE_SIZE,
+                 disk_cache=None,
+                 fuse: bool = False):
+        if hull_components is None:
+            hull_components = DEFAULT_HULL_COMPONENTS
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown hydrostatics engine: {engine} (expected one of {ENGINES})")
+
+        self.fcstd_path = fcstd_path
+        self.hull_components = hull_components
+        self.engine = engine
+        self.mesh_tolerance = mesh_tolerance
+        self.fuse = fuse
+        self.hull_shapes = []
+        self.fused_shapes = None
+        self.cache = PoseCache(cache_size)
+        self.disk_cache = disk_cache
+        self._fingerprint = None
+
+        # Open the FreeCAD document
+        doc = App.openDocument(fcstd_path)
+
+        # Find hull components by matching against labels.
+        # Shapes are copied so they outlive the document.
+        processed_labels = set()
+        for obj in _get_all_objects(doc.Objects):
+            if not hasattr(obj, 'Shape') or obj.Shape.isNull():
+                continue
+
+            if obj.Label in processed_labels:
+                continue
+
+            matched_pattern = _match_hull_pattern(obj.Label, hull_components)
+            if matched_pattern is None:
+                continue
+
+            processed_labels.add(obj.Label)
+            self.hull_shapes.append({
+                "label": obj.Label,
+                "shape": obj.Shape.copy(),
+                "pattern": matched_pattern
+            })
+
+        App.closeDocument(doc.Name)
+
+        # Tessellate once for the mesh engine
+        if engine == "mesh":
+            for hs in self.hull_shapes:
+                hs["mesh"] = tessellate_shape(hs["shape"], mesh_tolerance)
+
+        if fuse:
+            self.fused_shapes = self._fuse_hulls()
+
+        # Bounding boxes, volumes and centroids for the dry/submerged fast paths
+        for hs in self.hull_shapes + (self.fused_shapes or []):
+            self._prepare_bounds(hs)
+
+        # Compute hull reference points (body frame) from original geometry
+        # These are fixed points on each hull used to track their world position
+        # Ama reference: (0, 0, z_min) - ama is built symmetric around origin
+        # Vaka reference: (x_center, 0, z_min) - vaka is offset in x
+        # Note: Skip "001" suffix parts for ama_z_min as they may have geometry bugs
+        ama_z_min = None
+        vaka_x_sum, vaka_y_sum, vaka_z_min, vaka_count = 0.0, 0.0, None, 0
+
+        for hs in self.hull_shapes:
+            bbox = hs["shape"].BoundBox
+            cog = hs["shape"].CenterOfGravity
+            is_ama = hs["pattern"].startswith("ama")
+
+            if is_ama:
+                # Skip mirrored parts (001 suffix) for z_min calculation
+                # as they may have geometry artifacts from mirroring
+                if "001" not in hs["label"]:
+                    if ama_z_min is None or bbox.ZMin < ama_z_min:
+                        ama_z_min = bbox.ZMin
+            else:
+                vaka_x_sum += cog.x
+                vaka_y_sum += cog.y
+                vaka_count += 1
+                if vaka_z_min is None or bbox.ZMin < vaka_z_min:
+                    vaka_z_min = bbox.ZMin
+
+        # Hull reference points in body frame (before transformation)
+        # Ama is symmetric around (0, 0), so use origin with z_min
+        self.ama_ref_body = {
+            "x": 0.0,
+            "y": 0.0,
+            "z": ama_z_min if ama_z_min is not None else 0.0
+        }
+        self.vaka_ref_body = {
+            "x": vaka_x_sum / vaka_count if vaka_count > 0 else 0.0,
+            "y": vaka_y_sum / vaka_count if vaka_count > 0 else 0.0,
+            "z": vaka_z_min if vaka_z_min is not None else 0.0
+        }
+
+        # Compute the combined center of mass for rotation center
+        # (This approximates the boat's CoG for rotation purposes)
+        total_volume = 0.0
+        weighted_center = Base.Vector(0, 0, 0)
+        for hs in self.hull_shapes:
+            vol = hs["shape"].Volume
+            cog = hs["shape"].CenterOfGravity
+            total_volume += vol
+            weighted_center += Base.Vector(cog.x * vol, cog.y * vol, cog.z * vol)
+
+        if total_volume > 0:
+            self.rotation_center = Base.Vector(
+                weighted_center.x / total_volume,
+                weighted_center.y / total_volume,
+                weighted_center.z / total_volume
+            )
+        else:
+            self.rotation_center = Base.Vector(0, 0, 0)
+
+        # Compute total volumes per hull type (before transformation)
+        self.total_ama_volume_mm3 = 0.0
+        self.total_vaka_volume_mm3 = 0.0
+        for hs in self.hull_shapes:
+            vol = hs["shape"].Volume
+            if hs["pattern"].startswith("ama"):
+                self.total_ama_volume_mm3 += vol
+            else:
+                self.total_vaka_volume_mm3 += vol
+
+    def _fuse_hulls(self) -> list:
+        """Fuse the hull shapes of each hull group into one shape (or mesh)."""
+        fused_shapes = []
+        for group in HULL_GROUPS:
+            members = [hs for hs in self.hull_shapes if _hull_group(hs["pattern"]) == group]
+            if not members:
+                continue
+            fused = {"label": f"{group.capitalize()} (fused)", "pattern": group}
+            if self.engine == "mesh":
+                fused["mesh"] = merge_meshes([hs["mesh"] for hs in members])
+            else:
+                fused["shape"] = fuse_shapes([hs["shape"] for hs in members])
+            fused_shapes.append(fused)
+        return fused_shapes
+
+    def _prepare_bounds(self, hs: dict):
+        """
+        Store body-frame bounding box corners, volume and centroid of a hull shape.
+
+        A transformed box that lies entirely above (below) the water plane
+        means the shape is dry (fully submerged) at that pose; see
+        _classify_poses.
+        """
+        if self.engine == "mesh":
+            vertices, faces = hs["mesh"]
+            if len(vertices) > 0:
+                lower, upper = vertices.min(axis=0), vertices.max(axis=0)
+            else:
+                lower = upper = np.zeros(3)
+            # Whole mesh below a water plane above its top
+            whole = submerged_properties(vertices, faces, upper[2] + 1.0)
+            volume = whole["volume_mm3"]
+            centroid = (whole["CoB"]["x"], whole["CoB"]["y"], whole["CoB"]["z"])
+        else:
+            shape = hs["shape"]
+            bbox = shape.BoundBox
+            lower = (bbox.XMin, bbox.YMin, bbox.ZMin)
+            upper = (bbox.XMax, bbox.YMax, bbox.ZMax)
+            volume = shape.Volume
+            cog = shape.CenterOfGravity
+            centroid = (cog.x, cog.y, cog.z)
+
+        hs["corners"] = np.array([(x, y, z)
+                                  for x in (lower[0], upper[0])
+                                  for y in (lower[1], upper[1])
+                                  for z in (lower[2], upper[2])], dtype=float)
+        hs["volume_mm3"] = float(volume)
+        hs["centroid"] = np.array(centroid, dtype=float)
+
+    def _classify_poses(self, hs: dict, poses: np.ndarray, water_level_z: float) -> tuple:
+        """
+        Split poses by where a hull shape's bounding box ends up.
+
+        Returns:
+            Boolean (N,) arrays (dry, submerged): box entirely above the
+            water plane, box entirely below it. Poses in neither straddle
+            the waterline and need the full intersection.
+        """
+        rotation_center = self.rotation_center
+        center = (rotation_center.x, rotation_center.y, rotation_center.z)
+        corner_z = transform_vertices_batch(hs["corners"], poses, center)[:, :, 2]
+        return (corner_z.min(axis=1) >= water_level_z,
+                corner_z.max(axis=1) <= water_level_z)
+
+    def _submerged_centroids(self, hs: dict, poses: np.ndarray) -> np.ndarray:
+        """(N, 3) world-frame centroids of a whole hull shape at poses."""
+        rotation_center = self.rotation_center
+        center = (rotation_center.x, rotation_center.y, rotation_center.z)
+        return transform_vertices_batch(hs["centroid"][None], poses, center)[:, 0, :]
+
+    def _evaluation_shapes(self) -> list:
+        """Shapes intersected per pose: fused hulls or individual components."""
+        return self.fused_shapes if self.fuse else self.hull_shapes
+
+    def center_of_buoyancy(self, z_displacement: float = 0.0,
+                           pitch_deg: float = 0.0, roll_deg: float = 0.0,
+                           water_level_z: float = 0.0) -> dict:
+        """
+        Compute the center of buoyancy of the loaded hull at a given pose.
+
+        Args:
+            z_displacement: Vertical displacement of the boat in mm (negative = sink)
+            pitch_deg: Pitch angle in degrees (positive = bow up)
+            roll_deg: Roll angle in degrees (positive = starboard down)
+            water_level_z: Z coordinate of the water surface (default: 0)
+
+        Returns:
+            Same as compute_center_of_buoyancy
+        """
+        key = self.cache.key("pose", z_displacement, pitch_deg, roll_deg, water_level_z)
+        result = self._cached(key)
+        if result is None:
+            result = self._evaluate(z_displacement, pitch_deg, roll_deg, water_level_z)
+            self._store(key, result)
+        return result
+
+    def component_breakdown(self, z_displacement: float = 0.0,
+                            pitch_deg: float = 0.0, roll_deg: float = 0.0,
+                            water_level_z: float = 0.0) -> list:
+        """
+        Per-component submerged volumes and centers of buoyancy at a pose.
+
+        Without fuse this is the "components" list of center_of_buoyancy().
+        With fuse, center_of_buoyancy() only reports the fused hulls and the
+        components are intersected one by one here, on request.
+
+        Returns:
+            List of {"label", "pattern", "submerged_volume_mm3",
+            "submerged_volume_liters", "CoB"}
+        """
+        if not self.fuse:
+            return self.center_of_buoyancy(z_displacement, pitch_deg, roll_deg,
+                                           water_level_z)["components"]
+
+        key = self.cache.key("components", z_displacement, pitch_deg, roll_deg, water_level_z)
+        components = self._cached(key)
+        if components is None:
+            components = [
+                _component_summary(hs, self._submerged(hs, z_displacement, pitch_deg,
+                                                       roll_deg, water_level_z))
+                for hs in self.hull_shapes
+            ]
+            self._store(key, components)
+        return components
+
+    def fingerprint(self) -> str:
+        """Content hash of the hull geometry and settings (see disk_cache.py)."""
+        if self._fingerprint is None:
+            self._fingerprint = hull_fingerprint(self)
+        return self._fingerprint
+
+    def _cached(self, key: tuple):
+        """Look a pose key up in the memory cache, then the disk cache."""
+        result = self.cache.get(key)
+        if result is None and self.disk_cache is not None:
+            result = self.disk_cache.get(self.disk_cache.key(self.fingerprint(), key))
+            if result is not None:
+                self.cache.put(key, result)
+        return result
+
+    def _store(self, key: tuple, result):
+        """Store a freshly evaluated result in the memory and disk caches."""
+        self.cache.put(key, result)
+        if self.disk_cache is not None:
+            self.disk_cache.put(self.disk_cache.key(self.fingerprint(), key), result)
+
+    def cached_solution(self, key: tuple):
+        """
+        Look up a result derived from this hull (e.g. a GZ point) by key.
+
+        Uses the same memory and disk caches as the pose evaluations, so
+        solver results persist across runs under the hull fingerprint.
+        """
+        return self._cached(key)
+
+    def store_solution(self, key: tuple, result):
+        """Store a result derived from this hull under key (see cached_solution)."""
+        self._store(key, result)
+
+    def _submerged(self, hs: dict, z_displacement: float, pitch_deg: float,
+                   roll_deg: float, water_level_z: float) -> dict:
+        """Submerged volume, centroid and waterplane of one shape at a pose."""
+        # Fast paths from the bounding box, before copying any geometry
+        pose = np.array([[z_displacement, pitch_deg, roll_deg]], dtype=float)
+        dry, submerged = self._classify_poses(hs, pose, water_level_z)
+        if dry[0]:
+            return {"volume_mm3": 0.0, "CoB": {"x": 0.0, "y": 0.0, "z": 0.0},
+                    "waterplane": empty_waterplane()}
+        if submerged[0]:
+            centroid = self._submerged_centroids(hs, pose)[0]
+            return {"volume_mm3": hs["volume_mm3"],
+                    "CoB": {"x": float(centroid[0]), "y": float(centroid[1]),
+                            "z": float(centroid[2])},
+                    "waterplane": empty_waterplane()}
+
+        rotation_center = self.rotation_center
+        if self.engine == "mesh":
+            # Transform the mesh vertices and clip at the water plane
+            vertices, faces = hs["mesh"]
+            world = transform_vertices(
+                vertices,
+                z_displacement,
+                pitch_deg,
+                roll_deg,
+                (rotation_center.x, rotation_center.y, rotation_center.z)
+            )
+            return submerged_properties(world, faces, water_level_z)
+
+        # Transform the shape
+        transformed = transform_shape(
+            hs["shape"],
+            z_displacement,
+            pitch_deg,
+            roll_deg,
+            rotation_center
+        )
+
+        # Compute submerged portion
+        return compute_submerged_volume(transformed, water_level_z)
+
+    def _evaluate(self, z_displacement: float, pitch_deg: float, roll_deg: float,
+                  water_level_z: float) -> dict:
+        """Uncached center_of_buoyancy."""
+        if not self.hull_shapes:
+            return {
+                "error": "No hull components found",
+                "CoB": {"x": 0.0, "y": 0.0, "z": 0.0},
+                "submerged_volume_mm3": 0.0,
+                "submerged_volume_liters": 0.0,
+                "buoyancy_force_N": 0.0,
+                "displacement_kg": 0.0,
+                "pose": {
+                    "z_offset_mm": z_displacement,
+                    "pitch_deg": pitch_deg,
+                    "roll_deg": roll_deg
+                },
+                "components": []
+            }
+
+        rotation_center = self.rotation_center
+
+        # Transform each hull shape and compute submerged volume
+        component_results = []
+        total_submerged_volume = 0.0
+        weighted_cob = Base.Vector(0, 0, 0)
+        waterplane = empty_waterplane()
+
+        for hs in self._evaluation_shapes():
+            result = self._submerged(hs, z_displacement, pitch_deg, roll_deg, water_level_z)
+            vol = result["volume_mm3"]
+            cob = result["CoB"]
+
+            component_results.append(_component_summary(hs, result))
+
+            # Accumulate for total CoB calculation
+            total_submerged_volume += vol
+            weighted_cob += Base.Vector(
+                cob["x"] * vol,
+                cob["y"] * vol,
+                cob["z"] * vol
+            )
+            for key, value in result["waterplane"].items():
+                waterplane[key] += value
+
+        # Compute combined center of buoyancy
+        if total_submerged_volume > 1e-6:
+            combined_cob = {
+                "x": round(weighted_cob.x / total_submerged_volume, 2),
+                "y": round(weighted_cob.y / total_submerged_volume, 2),
+                "z": round(weighted_cob.z / total_submerged_volume, 2)
+            }
+        else:
+            combined_cob = {"x": 0.0, "y": 0.0, "z": 0.0}
+
+        # Waterplane centroid (center of flotation)
+        area = waterplane["area_mm2"]
+        waterplane["centroid"] = {
+            "x": round(waterplane["moment_x_mm3"] / area, 2) if area > 0 else 0.0,
+            "y": round(waterplane["moment_y_mm3"] / area, 2) if area > 0 else 0.0
+        }
+
+        # Convert volume to liters (1 liter = 1e6 mm³)
+        volume_liters = total_submerged_volume / 1e6
+
+        # Compute buoyancy force
+        # F = ρ * V * g, where V is in m³
+        volume_m3 = total_submerged_volume / 1e9  # mm³ to m³
+        displacement_kg = volume_m3 * SALTWATER_DENSITY_KG_M3
+        buoyancy_force_N = displacement_kg * GRAVITY_M_S2
+
+        # Transform hull reference points to world frame
+        ama_ref_world = _transform_ref_point(self.ama_ref_body, z_displacement,
+                                             pitch_deg, roll_deg, rotation_center)
+        vaka_ref_world = _transform_ref_point(self.vaka_ref_body, z_displacement,
+                                              pitch_deg, roll_deg, rotation_center)
+
+        return {
+            "CoB": combined_cob,
+            "submerged_volume_mm3": round(total_submerged_volume, 2),
+            "submerged_volume_liters": round(volume_liters, 4),
+            "buoyancy_force_N": round(buoyancy_force_N, 2),
+            "displacement_kg": round(displacement_kg, 2),
+            "engine": self.engine,
+            "pose": {
+                "z_offset_mm": z_displacement,
+                "pitch_deg": pitch_deg,
+                "roll_deg": roll_deg,
+                "water_level_z": water_level_z,
+                "rotation_center": {
+                    "x": round(rotation_center.x, 2),
+                    "y": round(rotation_center.y, 2),
+                    "z": round(rotation_center.z, 2)
+                }
+            },
+            "hull_refs": {
+                "ama_body": {
+                    "x": round(self.ama_ref_body["x"], 2),
+                    "y": round(self.ama_ref_body["y"], 2),
+                    "z": round(self.ama_ref_body["z"], 2)
+                },
+                "ama_world": ama_ref_world,
+                "vaka_body": {
+                    "x": round(self.vaka_ref_body["x"], 2),
+                    "y": round(self.vaka_ref_body["y"], 2),
+                    "z": round(self.vaka_ref_body["z"], 2)
+                },
+                "vaka_world": vaka_ref_world
+            },
+            "total_volumes": {
+                "ama_liters": round(self.total_ama_volume_mm3 / 1e6, 1),
+                "vaka_liters": round(self.total_vaka_volume_mm3 / 1e6, 1)
+            },
+            "waterplane": waterplane,
+            "components": component_results
+        }
+
+    def center_of_buoyancy_batch(self, poses, water_level_z: float = 0.0) -> dict:
+        """
+        Compute the center of buoyancy of the loaded hull at many poses.
+
+        The hull shapes (and meshes) are shared across all poses. With the
+        mesh engine the poses are evaluated together with vectorized NumPy
+        operations; the BREP engine evaluates them one after another.
+        Poses found in the cache are not evaluated again. Values are not
+        rounded, so they can be differenced directly.
+
+        Args:
+            poses: (N, 3) array-like of (z_displacement, pitch_deg, roll_deg)
+            water_level_z: Z coordinate of the water surface (default: 0)
+
+        Returns:
+            Dictionary with (N,) NumPy arrays:
+            - submerged_volume_mm3, buoyancy_force_N, displacement_kg
+            - CoB: {"x", "y", "z"} center of buoyancy in mm (world frame)
+            - waterplane: Waterplane integrals (about the world origin)
+            - pose: {"z_offset_mm", "pitch_deg", "roll_deg"} arrays plus
+                    "water_level_z" and "rotation_center"
+            - engine: Hydrostatics engine used
+        """
+        poses = np.asarray(poses, dtype=float).reshape(-1, 3)
+        if len(poses) == 0:
+            return self._evaluate_batch(poses, water_level_z)
+
+        # Only evaluate the poses that are not cached yet
+        keys = [self.cache.key("batch", z, pitch, roll, water_level_z)
+                for z, pitch, roll in poses]
+        results = [self._cached(key) for key in keys]
+        missing = [i for i, result in enumerate(results) if result is None]
+
+        if missing:
+            fresh = self._evaluate_batch(poses[missing], water_level_z)
+            for n, i in enumerate(missing):
+                results[i] = select_pose(fresh, n)
+                self._store(keys[i], results[i])
+
+        batch = stack_poses(results)
+        batch["pose"]["z_offset_mm"] = poses[:, 0]
+        batch["pose"]["pitch_deg"] = poses[:, 1]
+        batch["pose"]["roll_deg"] = poses[:, 2]
+        return batch
+
+    def _evaluate_batch(self, poses: np.ndarray, water_level_z: float) -> dict:
+        """Uncached center_of_buoyancy_batch."""
+        n_poses = len(poses)
+        rotation_center = self.rotation_center
+        center = (rotation_center.x, rotation_center.y, rotation_center.z)
+
+        volume = np.zeros(n_poses)
+        moment = {"x": np.zeros(n_poses), "y": np.zeros(n_poses), "z": np.zeros(n_poses)}
+        waterplane = {key: np.zeros(n_poses) for key in empty_waterplane()}
+
+        for hs in self._evaluation_shapes():
+            # Dry poses contribute nothing; fully submerged poses the whole
+            # shape. Only the poses straddling the waterline are clipped.
+            dry, submerged = self._classify_poses(hs, poses, water_level_z)
+            if submerged.any():
+                centroids = self._submerged_centroids(hs, poses[submerged])
+                volume[submerged] += hs["volume_mm3"]
+                for k, axis in enumerate("xyz"):
+                    moment[axis][submerged] += centroids[:, k] * hs["volume_mm3"]
+            straddling = np.flatnonzero(~(dry | submerged))
+
+            if self.engine == "mesh":
+                vertices, faces = hs["mesh"]
+                chunk = max(1, BATCH_TRIANGLE_LIMIT // max(1, len(faces)))
+                for start in range(0, len(straddling), chunk):
+                    index = straddling[start:start + chunk]
+                    world = transform_vertices_batch(vertices, poses[index], center)
+                    result = submerged_properties_batch(world, faces, water_level_z)
+
+                    vol = result["volume_mm3"]
+                    volume[index] += vol
+                    for axis in moment:
+                        moment[axis][index] += result["CoB"][axis] * vol
+                    for key in waterplane:
+                        waterplane[key][index] += result["waterplane"][key]
+            else:
+                for i in straddling:
+                    z_disp, pitch, roll = poses[i]
+                    transformed = transform_shape(hs["shape"], z_disp, pitch, roll,
+                                                  rotation_center)
+                    result = compute_submerged_volume(transformed, water_level_z)
+
+                    vol = result["volume_mm3"]
+                    volume[i] += vol
+                    for axis in moment:
+                        moment[axis][i] += result["CoB"][axis] * vol
+                    for key in waterplane:
+                        waterplane[key][i] += result["waterplane"][key]
+
+        submerged = volume > 1e-6
+        safe_volume = np.where(submerged, volume, 1.0)
+        displacement_kg = volume / 1e9 * SALTWATER_DENSITY_KG_M3
+
+        return {
+            "CoB": {axis: np.where(submerged, moment[axis] / safe_volume, 0.0)
+                    for axis in moment},
+            "submerged_volume_mm3": volume,
+            "buoyancy_force_N": displacement_kg * GRAVITY_M_S2,
+            "displacement_kg": displacement_kg,
+            "engine": self.engine,
+            "pose": {
+                "z_offset_mm": poses[:, 0],
+                "pitch_deg": poses[:, 1],
+                "roll_deg": poses[:, 2],
+                "water_level_z": water_level_z,
+                "rotation_center": {
+                    "x": round(rotation_center.x, 2),
+                    "y": round(rotation_center.y, 2),
+                    "z": round(rotation_center.z, 2)
+                }
+            },
+            "waterplane": waterplane
+        }
+
+
+def _component_summary(hs: dict, result: dict) -> dict:
+    """Entry of the "components" list for one hull shape's submerged result."""
+    vol = result["volume_mm3"]
+    cob = result["CoB"]
+    return {
+        "label": hs["label"],
+        "pattern": hs["pattern"],
+        "submerged_volume_mm3": round(vol, 2),
+        "submerged_volume_liters": round(vol / 1e6, 4),
+        "CoB": {
+            "x": round(cob["x"], 2),
+            "y": round(cob["y"], 2),
+            "z": round(cob["z"], 2)
+        }
     }
 
 
+def select_pose(batch: dict, index: int) -> dict:
+    """
+    Extract one pose from a center_of_buoyancy_batch result.
+
+    Returns a dictionary with the summary keys of a single-pose result (CoB,
+    submerged volume, buoyancy force, displacement, pose and, when present,
+    waterplane and error_bound), so it can be passed to code written against
+    center_of_buoyancy().
+    """
+    pose = batch["pose"]
+    result = {
+        "CoB": {axis: float(value[index]) for axis, value in batch["CoB"].items()},
+        "submerged_volume_mm3": float(batch["submerged_volume_mm3"][index]),
+        "buoyancy_force_N": float(batch["buoyancy_force_N"][index]),
+        "displacement_kg": float(batch["displacement_kg"][index]),
+        "engine": batch["engine"],
+        "pose": {
+            "z_offset_mm": float(pose["z_offset_mm"][index]),
+            "pitch_deg": float(pose["pitch_deg"][index]),
+            "roll_deg": float(pose["roll_deg"][index]),
+            "water_level_z": pose["water_level_z"],
+            "rotation_center": pose["rotation_center"]
+        }
+    }
+    for key in ("waterplane", "error_bound"):
+        if key in batch:
+            result[key] = {name: float(value[index]) for name, value in batch[key].items()}
+    return result
+
+
+def stack_poses(results: list) -> dict:
+    """
+    Combine single-pose results into a batch result (inverse of select_pose).
+
+    Args:
+        results: Non-empty list of dictionaries as returned by select_pose
+
+    Returns:
+        Dictionary with the layout of HullModel.center_of_buoyancy_batch
+    """
+    first = results[0]
+    batch = {
+        "CoB": {axis: np.array([r["CoB"][axis] for r in results]) for axis in first["CoB"]},
+        "engine": first["engine"],
+        "pose": {
+            "z_offset_mm": np.array([r["pose"]["z_offset_mm"] for r in results]),
+            "pitch_deg": np.array([r["pose"]["pitch_deg"] for r in results]),
+            "roll_deg": np.array([r["pose"]["roll_deg"] for r in results]),
+            "water_level_z": first["pose"]["water_level_z"],
+            "rotation_center": first["pose"]["rotation_center"]
+        }
+    }
+    for key in ("submerged_volume_mm3", "buoyancy_force_N", "displacement_kg"):
+        batch[key] = np.array([r[key] for r in results])
+    for key in ("waterplane", "error_bound"):
+        if key in first:
+            batch[key] = {name: np.array([r[key][name] for r in results]) for name in first[key]}
+    return batch
+
+
 def compute_center_of_buoyancy(fcstd_path: str, z_displacement: float = 0.0,
                                 pitch_deg: float = 0.0, roll_deg: float = 0.0,
                                 water_level_z: float = 0.0,
-                                hull_components: list = None) -> dict:
+                                hull_components: list = None,
+                                engine: str = "brep") -> dict:
     """
     Compute the center of buoyancy for a hull at a given pose.
 
-    This is the main entry point for buoyancy calculations. It:
+    This is the one-shot entry point for buoyancy calculations. It:
     1. Loads the FreeCAD document
     2. Collects hull component shapes (vaka, ama, etc.)
     3. Transforms them according to the pose
     4. Computes the submerged volume and its centroid
 
+    Callers that evaluate many poses of the same design should create a
+    HullModel once and call its center_of_buoyancy() method instead.
+
     Args:
         fcstd_path: Path to the FreeCAD design file
         z_displacement: Vertical displacement of the boat in mm (negative = sink)
@@ -285,6 +1114,8 @@ def compute_center_of_buoyancy(fcstd_path: str, z_displacement: float = 0.0,
         hull_components: List of component name patterns to include.
                         Defaults to DEFAULT_HULL_COMPONENTS (see top of module).
                         Components are matched case-insensitively against object labels.
+        engine: "brep" (exact OCC booleans, default) or "mesh" (tessellated
+                hull clipped against the water plane, see mesh_hydrostatics.py)
 
     Returns:
         Dictionary with:
@@ -294,260 +1125,38 @@ def compute_center_of_buoyancy(fcstd_path: str, z_displacement: float = 0.0,
         - buoyancy_force_N: Buoyancy force in Newtons (saltwater)
         - displacement_kg: Water displaced in kg (saltwater)
         - pose: The input pose parameters
-        - components: Per-component breakdown
+        - waterplane: Waterplane area, centroid and second moments
+                      (about the world origin) of the submerged hull
+        - components: Per-component breakdown (per hull with fuse=True)
     """
-    if hull_components is None:
-        hull_components = DEFAULT_HULL_COMPONENTS
-
-    # Open the FreeCAD document
-    doc = App.openDocument(fcstd_path)
-
-    # Collect all objects
-    all_objects = _get_all_objects(doc.Objects)
-
-    # Find hull components by matching against labels
-    hull_shapes = []
-    component_results = []
-    processed_labels = set()
-
-    for obj in all_objects:
-        if not hasattr(obj, 'Shape') or obj.Shape.isNull():
-            continue
-
-        if obj.Label in processed_labels:
-            continue
-
-        label_lower = obj.Label.lower()
-
-        # Check if this object matches any hull component pattern
-        is_hull = False
-        matched_pattern = None
-        for pattern in hull_components:
-            if pattern.lower() in label_lower:
-                is_hull = True
-                matched_pattern = pattern
-                break
-
-        if not is_hull:
-            continue
-
-        processed_labels.add(obj.Label)
-        hull_shapes.append({
-            "label": obj.Label,
-            "shape": obj.Shape,
-            "pattern": matched_pattern
-        })
-
-    if not hull_shapes:
-        App.closeDocument(doc.Name)
-        return {
-            "error": "No hull components found",
-            "CoB": {"x": 0.0, "y": 0.0, "z": 0.0},
-            "submerged_volume_mm3": 0.0,
-            "submerged_volume_liters": 0.0,
-            "buoyancy_force_N": 0.0,
-            "displacement_kg": 0.0,
-            "pose": {
-                "z_offset_mm": z_displacement,
-                "pitch_deg": pitch_deg,
-                "roll_deg": roll_deg
-            },
-            "components": []
-        }
+    hull = HullModel(fcstd_path, hull_components, engine=engine)
+    return hull.center_of_buoyancy(z_displacement, pitch_deg, roll_deg, water_level_z)
 
-    # Compute hull reference points (body frame) from original geometry
-    # These are fixed points on each hull used to track their world position
-    # Ama reference: (0, 0, z_min) - ama is built symmetric around origin
-    # Vaka reference: (x_center, 0, z_min) - vaka is offset in x
-    # Note: Skip "001" suffix parts for ama_z_min as they may have geometry bugs
-    ama_z_min = None
-    vaka_x_sum, vaka_y_sum, vaka_z_min, vaka_count = 0.0, 0.0, None, 0
-
-    for hs in hull_shapes:
-        bbox = hs["shape"].BoundBox
-        cog = hs["shape"].CenterOfGravity
-        is_ama = hs["pattern"].startswith("ama")
-
-        if is_ama:
-            # Skip mirrored parts (001 suffix) for z_min calculation
-            # as they may have geometry artifacts from mirroring
-            if "001" not in hs["label"]:
-                if ama_z_min is None or bbox.ZMin < ama_z_min:
-                    ama_z_min = bbox.ZMin
-        else:
-            vaka_x_sum += cog.x
-            vaka_y_sum += cog.y
-            vaka_count += 1
-            if vaka_z_min is None or bbox.ZMin < vaka_z_min:
-                vaka_z_min = bbox.ZMin
-
-    # Hull reference points in body frame (before transformation)
-    # Ama is symmetric around (0, 0), so use origin with z_min
-    ama_ref_body = {
-        "x": 0.0,
-        "y": 0.0,
-        "z": ama_z_min if ama_z_min is not None else 0.0
-    }
-    vaka_ref_body = {
-        "x": vaka_x_sum / vaka_count if vaka_count > 0 else 0.0,
-        "y": vaka_y_sum / vaka_count if vaka_count > 0 else 0.0,
-        "z": vaka_z_min if vaka_z_min is not None else 0.0
-    }
 
-    # Compute the combined center of mass for rotation center
-    # (This approximates the boat's CoG for rotation purposes)
-    total_volume = 0.0
-    weighted_center = Base.Vector(0, 0, 0)
-    for hs in hull_shapes:
-        vol = hs["shape"].Volume
-        cog = hs["shape"].CenterOfGravity
-        total_volume += vol
-        weighted_center += Base.Vector(cog.x * vol, cog.y * vol, cog.z * vol)
-
-    if total_volume > 0:
-        rotation_center = Base.Vector(
-            weighted_center.x / total_volume,
-            weighted_center.y / total_volume,
-            weighted_center.z / total_volume
-        )
-    else:
-        rotation_center = Base.Vector(0, 0, 0)
-
-    # Compute total volumes per hull type (before transformation)
-    total_ama_volume_mm3 = 0.0
-    total_vaka_volume_mm3 = 0.0
-    for hs in hull_shapes:
-        vol = hs["shape"].Volume
-        if hs["pattern"].startswith("ama"):
-            total_ama_volume_mm3 += vol
-        else:
-            total_vaka_volume_mm3 += vol
-
-    # Transform each hull shape and compute submerged volume
-    total_submerged_volume = 0.0
-    weighted_cob = Base.Vector(0, 0, 0)
-
-    for hs in hull_shapes:
-        # Transform the shape
-        transformed = transform_shape(
-            hs["shape"],
-            z_displacement,
-            pitch_deg,
-            roll_deg,
-            rotation_center
-        )
-
-        # Compute submerged portion
-        result = compute_submerged_volume(transformed, water_level_z)
-
-        vol = result["volume_mm3"]
-        cob = result["CoB"]
-
-        component_results.append({
-            "label": hs["label"],
-            "pattern": hs["pattern"],
-            "submerged_volume_mm3": round(vol, 2),
-            "submerged_volume_liters": round(vol / 1e6, 4),
-            "CoB": {
-                "x": round(cob["x"], 2),
-                "y": round(cob["y"], 2),
-                "z": round(cob["z"], 2)
-            }
-        })
-
-        # Accumulate for total CoB calculation
-        total_submerged_volume += vol
-        weighted_cob += Base.Vector(
-            cob["x"] * vol,
-            cob["y"] * vol,
-            cob["z"] * vol
-        )
+def compute_center_of_buoyancy_batch(fcstd_path: str, poses,
+                                      water_level_z: float = 0.0,
+                                      hull_components: list = None,
+                                      engine: str = "brep") -> dict:
+    """
+    Compute the center of buoyancy for a hull at many poses.
 
-    # Compute combined center of buoyancy
-    if total_submerged_volume > 1e-6:
-        combined_cob = {
-            "x": round(weighted_cob.x / total_submerged_volume, 2),
-            "y": round(weighted_cob.y / total_submerged_volume, 2),
-            "z": round(weighted_cob.z / total_submerged_volume, 2)
-        }
-    else:
-        combined_cob = {"x": 0.0, "y": 0.0, "z": 0.0}
-
-    # Convert volume to liters (1 liter = 1e6 mm³)
-    volume_liters = total_submerged_volume / 1e6
-
-    # Compute buoyancy force
-    # F = ρ * V * g, where V is in m³
-    volume_m3 = total_submerged_volume / 1e9  # mm³ to m³
-    displacement_kg = volume_m3 * SALTWATER_DENSITY_KG_M3
-    buoyancy_force_N = displacement_kg * GRAVITY_M_S2
-
-    App.closeDocument(doc.Name)
-
-    # Transform hull reference points to world frame
-    def transform_ref_point(ref_body, z_disp, pitch, roll, rot_center):
-        """Transform a reference point from body to world frame."""
-        # Translate to rotation center
-        x = ref_body["x"] - rot_center.x
-        y = ref_body["y"] - rot_center.y
-        z = ref_body["z"] - rot_center.z
-
-        # Apply rotation (R = Ry(roll) * Rx(pitch))
-        pitch_rad = math.radians(pitch)
-        roll_rad = math.radians(roll)
-        cos_p, sin_p = math.cos(pitch_rad), math.sin(pitch_rad)
-        cos_r, sin_r = math.cos(roll_rad), math.sin(roll_rad)
-
-        x_new = cos_r * x + sin_r * sin_p * y + sin_r * cos_p * z
-        y_new = cos_p * y - sin_p * z
-        z_new = -sin_r * x + cos_r * sin_p * y + cos_r * cos_p * z
-
-        # Translate back and apply z displacement
-        return {
-            "x": round(x_new + rot_center.x, 2),
-            "y": round(y_new + rot_center.y, 2),
-            "z": round(z_new + rot_center.z + z_disp, 2)
-        }
+    Loads the design once and evaluates every pose against the same hull
+    shapes (see HullModel.center_of_buoyancy_batch).
 
-    ama_ref_world = transform_ref_point(ama_ref_body, z_displacement, pitch_deg, roll_deg, rotation_center)
-    vaka_ref_world = transform_ref_point(vaka_ref_body, z_displacement, pitch_deg, roll_deg, rotation_center)
+    Args:
+        fcstd_path: Path to the FreeCAD design file
+        poses: (N, 3) array-like of (z_displacement, pitch_deg, roll_deg)
+        water_level_z: Z coordinate of the water surface (default: 0)
+        hull_components: List of component name patterns to include
+        engine: "brep" or "mesh" (see compute_center_of_buoyancy)
 
-    return {
-        "CoB": combined_cob,
-        "submerged_volume_mm3": round(total_submerged_volume, 2),
-        "submerged_volume_liters": round(volume_liters, 4),
-        "buoyancy_force_N": round(buoyancy_force_N, 2),
-        "displacement_kg": round(displacement_kg, 2),
-        "pose": {
-            "z_offset_mm": z_displacement,
-            "pitch_deg": pitch_deg,
-            "roll_deg": roll_deg,
-            "rotation_center": {
-                "x": round(rotation_center.x, 2),
-                "y": round(rotation_center.y, 2),
-                "z": round(rotation_center.z, 2)
-            }
-        },
-        "hull_refs": {
-            "ama_body": {
-                "x": round(ama_ref_body["x"], 2),
-                "y": round(ama_ref_body["y"], 2),
-                "z": round(ama_ref_body["z"], 2)
-            },
-            "ama_world": ama_ref_world,
-            "vaka_body": {
-                "x": round(vaka_ref_body["x"], 2),
-                "y": round(vaka_ref_body["y"], 2),
-                "z": round(vaka_ref_body["z"], 2)
-            },
-            "vaka_world": vaka_ref_world
-        },
-        "total_volumes": {
-            "ama_liters": round(total_ama_volume_mm3 / 1e6, 1),
-            "vaka_liters": round(total_vaka_volume_mm3 / 1e6, 1)
-        },
-        "components": component_results
-    }
+    Returns:
+        Dictionary of (N,) NumPy arrays: submerged_volume_mm3,
+        buoyancy_force_N, displacement_kg, CoB {"x", "y", "z"}, waterplane
+        integrals and the poses themselves
+    """
+    hull = HullModel(fcstd_path, hull_components, engine=engine)
+    return hull.center_of_buoyancy_batch(poses, water_level_z)
 
 
 # Convenience function for use in iterative solvers
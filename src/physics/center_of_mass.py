@@ -9,6 +9,10 @@ There are two approaches:
 1. From FreeCAD geometry + materials: Compute CoG directly from shapes
 2. From mass artifact: Load precomputed mass data (faster for iteration)
 
+Volumes and positions come from the geometry index sidecar written by the
+design stage (see geometry_index.py) when it is up to date, so neither
+approach has to open the FCStd.
+
 Usage:
     from src.physics.center_of_mass import compute_center_of_gravity
 
@@ -33,80 +37,18 @@ import json
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..', 'src'))
 
 try:
-    import FreeCAD as App
-    import Part
     from FreeCAD import Base
 except ImportError as e:
     print(f"ERROR: {e}", file=sys.stderr)
     print("This module must be run with FreeCAD's Python", file=sys.stderr)
     sys.exit(1)
 
+from .geometry_index import design_objects
 
 # Physical constants
 GRAVITY_M_S2 = 9.81  # m/s²
 
 
-def _get_all_objects(obj_list):
-    """Recursively get all objects including those in groups."""
-    all_objs = []
-    for obj in obj_list:
-        all_objs.append(obj)
-        if hasattr(obj, 'Group'):
-            all_objs.extend(_get_all_objects(obj.Group))
-    return all_objs
-
-
-def _extract_material_from_label(label: str) -> str:
-    """
-    Extract material name from object label.
-
-    Expected format: ComponentName__material_name or ComponentName__material_name_001
-    """
-    label_lower = label.lower()
-    if '__' in label_lower:
-        parts = label_lower.split('__')
-        if len(parts) >= 2:
-            return parts[1].rstrip('_0123456789').strip()
-    return None
-
-
-def _get_global_cog(obj) -> Base.Vector:
-    """
-    Get the center of gravity in world (global) coordinates.
-
-    There are two cases in the design:
-    1. Shape created at origin, then positioned via Placement (e.g., Mast in Rig group)
-       - Shape bbox center is near origin in X and Y
-       - We need to apply Placement to get world coords
-
-    2. Shape created at final world position (e.g., Hull, Ama parts)
-       - Shape bbox is already at final position (far from origin)
-       - Placement should NOT be applied (shape CoG is already in world coords)
-
-    We detect case 2 by checking if the shape bbox center is far from origin.
-    """
-    local_cog = obj.Shape.CenterOfGravity
-    bbox = obj.Shape.BoundBox
-
-    # Check if shape is already at world position (bbox center far from origin in X or Y)
-    bbox_center_x = (bbox.XMin + bbox.XMax) / 2
-    bbox_center_y = (bbox.YMin + bbox.YMax) / 2
-    shape_at_origin = abs(bbox_center_x) < 500 and abs(bbox_center_y) < 500
-
-    if shape_at_origin:
-        # Shape is at origin - apply placement to get world coords
-        if hasattr(obj, 'getGlobalPlacement'):
-            global_placement = obj.getGlobalPlacement()
-        else:
-            global_placement = obj.Placement if hasattr(obj, 'Placement') else App.Placement()
-
-        world_cog = global_placement.multVec(local_cog)
-        return world_cog
-    else:
-        # Shape already at world position - use CoG directly
-        return local_cog
-
-
 def compute_center_of_gravity(fcstd_path: str, materials_path: str) -> dict:
     """
     Compute the center of gravity from FreeCAD geometry and materials.
@@ -130,37 +72,27 @@ def compute_center_of_gravity(fcstd_path: str, materials_path: str) -> dict:
         materials_data = json.load(f)
     materials = materials_data["materials"]
 
-    # Open FreeCAD document
-    doc = App.openDocument(fcstd_path)
-    all_objects = _get_all_objects(doc.Objects)
-
-    # Compute mass and CoG for each component
+    # Compute mass and CoG for each component (labels are unique in the index)
     total_mass = 0.0
     weighted_position = Base.Vector(0, 0, 0)
     component_results = []
-    processed_labels = set()
-
-    for obj in all_objects:
-        if not hasattr(obj, 'Shape') or obj.Shape.isNull():
-            continue
-
-        if obj.Label in processed_labels:
-            continue
 
+    for record in design_objects(fcstd_path):
         # Get material from label
-        mat_key = _extract_material_from_label(obj.Label)
+        mat_key = record['material']
         if not mat_key or mat_key not in materials:
             continue
 
         mat = materials[mat_key]
-        volume_m3 = obj.Shape.Volume / 1e9  # mm³ to m³
+        volume_m3 = record['volume_mm3'] / 1e9  # mm³ to m³
         mass_kg = volume_m3 * mat['density_kg_m3']
 
-        # Get center of mass in world coordinates
-        cog = _get_global_cog(obj)
+        # Center of mass in world coordinates
+        cog = Base.Vector(record['global_cog']['x'], record['global_cog']['y'],
+                          record['global_cog']['z'])
 
         component_results.append({
-            "label": obj.Label,
+            "label": record['label'],
             "material": mat['name'],
             "mass_kg": round(mass_kg, 4),
             "volume_liters": round(volume_m3 * 1000, 4),
@@ -179,10 +111,6 @@ def compute_center_of_gravity(fcstd_path: str, materials_path: str) -> dict:
             cog.z * mass_kg
         )
 
-        processed_labels.add(obj.Label)
-
-    App.closeDocument(doc.Name)
-
     # Compute combined center of gravity
     if total_mass > 1e-6:
         combined_cog = {
@@ -209,7 +137,10 @@ def compute_cog_from_mass_artifact(mass_artifact_path: str, fcstd_path: str) ->
     Compute CoG using precomputed mass data and geometry positions.
 
     This is faster for iterative calculations because the mass data is
-    already computed. We just need to look up component positions.
+    already computed. Mass artifacts written by the single-pass mass stage
+    already contain the CoG of the boat and of every component, and are
+    used as they are; older ones only have masses, and the component
+    positions are looked up in the design.
 
     Args:
         mass_artifact_path: Path to the mass.json artifact
@@ -222,34 +153,34 @@ def compute_cog_from_mass_artifact(mass_artifact_path: str, fcstd_path: str) ->
     with open(mass_artifact_path, 'r') as f:
         mass_data = json.load(f)
 
+    if 'CoG' in mass_data:
+        return {
+            "CoG": mass_data['CoG'],
+            "total_mass_kg": mass_data['total_mass_kg'],
+            "weight_N": mass_data['weight_N'],
+            "component_count": mass_data['component_count'],
+            "components": [{"label": c['name'], "mass_kg": c['mass_kg'], "CoG": c['CoG']}
+                           for c in mass_data['components']]
+        }
+
     # Create a map from label to mass
     component_masses = {c['name']: c['mass_kg'] for c in mass_data['components']}
 
-    # Open FreeCAD document to get positions
-    doc = App.openDocument(fcstd_path)
-    all_objects = _get_all_objects(doc.Objects)
-
     # Compute CoG using masses from artifact and positions from geometry
     total_mass = 0.0
     weighted_position = Base.Vector(0, 0, 0)
     component_results = []
-    processed_labels = set()
-
-    for obj in all_objects:
-        if not hasattr(obj, 'Shape') or obj.Shape.isNull():
-            continue
 
-        if obj.Label in processed_labels:
+    for record in design_objects(fcstd_path):
+        if record['label'] not in component_masses:
             continue
 
-        if obj.Label not in component_masses:
-            continue
-
-        mass_kg = component_masses[obj.Label]
-        cog = _get_global_cog(obj)
+        mass_kg = component_masses[record['label']]
+        cog = Base.Vector(record['global_cog']['x'], record['global_cog']['y'],
+                          record['global_cog']['z'])
 
         component_results.append({
-            "label": obj.Label,
+            "label": record['label'],
             "mass_kg": round(mass_kg, 4),
             "CoG": {
                 "x": round(cog.x, 2),
@@ -265,10 +196,6 @@ def compute_cog_from_mass_artifact(mass_artifact_path: str, fcstd_path: str) ->
             cog.z * mass_kg
         )
 
-        processed_labels.add(obj.Label)
-
-    App.closeDocument(doc.Name)
-
     if total_mass > 1e-6:
         combined_cog = {
             "x": round(weighted_position.x / total_mass, 2),
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Cross curves of stability: KN versus heel angle over a range of displacements.
+
+GZ depends on the centre of gravity only through a rigid-body correction.
+At a heel angle phi (level pitch) and displacement D the equilibrium
+waterline, and with it the CoB, is fixed by the hull alone. Measuring the
+transverse CoB position from a pole P in the body (here the hull rotation
+center) gives the cross curve value
+
+    KN(phi, D) = CoB_x - P_x
+
+and for a CoG at body offset d = CoG - P (see transform_point in src/gz)
+
+    GZ(phi) = sign(phi) * (KN(phi, D) - d_x cos(phi) - d_z sin(phi))
+
+so the expensive equilibrium searches are done once per hull geometry (see
+src/kn) and the GZ curve of any mass, CoG, crew position or cargo is a
+bilinear interpolation in the (displacement, heel) table.
+
+Usage:
+    from src.physics.cross_curves import CrossCurves
+
+    kn = CrossCurves("artifact/boat.kn.json")
+    entry = kn.interpolate(heel_deg=20.0, displacement_kg=1500.0)
+    # entry["kn_mm"], entry["z_eq_mm"], or None outside the table
+"""
+
+import json
+
+import numpy as np
+
+
+def save_cross_curves(result: dict, path: str, metadata: dict = None):
+    """
+    Write cross curves as JSON.
+
+    Args:
+        result: Dictionary with heel_deg (H,), displacement_kg (D,),
+                kn_mm and z_eq_mm ((D, H) arrays, NaN where no equilibrium
+                was found) and rotation_center
+        path: Output JSON path
+        metadata: Extra top-level fields (design, engine, ...)
+    """
+    def table(values):
+        return [[round(float(v), 3) if np.isfinite(v) else None for v in row]
+                for row in values]
+
+    artifact = {key: value for key, value in result.items()
+                if key not in ("heel_deg", "displacement_kg", "kn_mm", "z_eq_mm")}
+    artifact["heel_deg"] = [float(v) for v in result["heel_deg"]]
+    artifact["displacement_kg"] = [round(float(v), 3) for v in result["displacement_kg"]]
+    artifact["kn_mm"] = table(result["kn_mm"])
+    artifact["z_eq_mm"] = table(result["z_eq_mm"])
+    artifact.update(metadata or {})
+    artifact["validator"] = "kn"
+
+    with open(path, "w") as f:
+        json.dump(artifact, f, indent=2)
+
+
+def _bracket(grid: np.ndarray, value: float):
+    """(i, t) with grid[i] <= value <= grid[i + 1] and t the fraction, or None."""
+    if not grid[0] <= value <= grid[-1]:
+        return None
+    if len(grid) == 1:
+        return 0, 0.0
+    i = int(np.clip(np.searchsorted(grid, value, side="right") - 1, 0, len(grid) - 2))
+    return i, (value - grid[i]) / (grid[i + 1] - grid[i])
+
+
+class CrossCurves:
+    """
+    Cross curves loaded from a kn JSON artifact.
+
+    Attributes:
+        heel_deg: (H,) heel angles, increasing
+        displacement_kg: (D,) displacements, increasing
+        kn_mm, z_eq_mm: (D, H) tables, NaN where no equilibrium was found
+        rotation_center: Pole of KN (body frame), {x, y, z}
+    """
+
+    def __init__(self, path: str):
+        with open(path) as f:
+            artifact = json.load(f)
+
+        def table(rows):
+            return np.array([[np.nan if v is None else v for v in row] for row in rows],
+                            dtype=float)
+
+        self.heel_deg = np.asarray(artifact["heel_deg"], dtype=float)
+        self.displacement_kg = np.asarray(artifact["displacement_kg"], dtype=float)
+        self.kn_mm = table(artifact["kn_mm"])
+        self.z_eq_mm = table(artifact["z_eq_mm"])
+        self.rotation_center = artifact["rotation_center"]
+
+    def covers(self, displacement_kg: float) -> bool:
+        """Whether displacement_kg lies inside the displacement range of the table."""
+        return bool(self.displacement_kg[0] <= displacement_kg <= self.displacement_kg[-1])
+
+    def interpolate(self, heel_deg: float, displacement_kg: float):
+        """
+        Bilinear interpolation of KN and equilibrium z.
+
+        Returns:
+            Dictionary with kn_mm and z_eq_mm, or None if the point is
+            outside the table or next to a grid point without equilibrium
+        """
+        heel = _bracket(self.heel_deg, heel_deg)
+        displacement = _bracket(self.displacement_kg, displacement_kg)
+        if heel is None or displacement is None:
+            return None
+
+        i, t = displacement
+        j, u = heel
+        result = {}
+        for name, values in (("kn_mm", self.kn_mm), ("z_eq_mm", self.z_eq_mm)):
+            total = 0.0
+            for di, wi in ((0, 1.0 - t), (1, t)):
+                for dj, wj in ((0, 1.0 - u), (1, u)):
+                    weight = wi * wj
+                    if weight == 0.0:
+                        continue
+                    value = values[i + di, j + dj]
+                    if not np.isfinite(value):
+                        return None
+                    total += weight * value
+            result[name] = float(total)
+        return result
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Content-addressed on-disk cache for CoB evaluations.
+
+The in-process PoseCache (cache.py) is lost when a stage exits. DiskCache
+keeps results across runs and configurations: the key is a hash of the hull
+geometry (BREP of every hull component), the hull_components patterns, the
+engine settings and the quantized pose. Touching the design file, or
+changing only the sail angles of a configuration, leaves the hull geometry
+and therefore the keys unchanged, so those poses are read back instead of
+recomputed.
+
+Each entry is a small JSON file named after its key. The directory is
+capped in size; when it grows beyond the cap, the least recently used
+entries (by file modification time, refreshed on every hit) are deleted.
+Writes go through a temporary file and os.replace, so several processes
+(e.g. parallel gz workers) can share one cache directory.
+
+Usage:
+    from src.physics.disk_cache import DiskCache
+
+    hull = HullModel(design, disk_cache=DiskCache("artifact/cache"))
+"""
+
+import os
+import json
+import time
+import hashlib
+import tempfile
+
+
+# Default size cap of the cache directory
+DEFAULT_DISK_CACHE_SIZE_MB = 256.0
+
+# After eviction the directory is trimmed to this fraction of the cap
+EVICTION_TARGET_FRACTION = 0.8
+
+# Temporary files older than this (seconds) are left over from a crashed
+# writer and are deleted on eviction
+STALE_TMP_AGE_S = 3600.0
+
+
+def hull_fingerprint(hull) -> str:
+    """
+    Content hash of everything besides the pose that a CoB result depends on.
+
+    Args:
+        hull: HullModel
+
+    Returns:
+        Hex SHA-256 digest of the engine settings, hull_components patterns
+        and the label, pattern and BREP of every hull shape
+    """
+    digest = hashlib.sha256()
+    digest.update(f"engine={hull.engine}\n".encode())
+    if hull.engine == "mesh":
+        digest.update(f"mesh_tolerance={hull.mesh_tolerance!r}\n".encode())
+    elif hull.fuse:
+        # Fused solids count overlapping component volume once
+        digest.update(b"fuse\n")
+    digest.update(json.dumps(list(hull.hull_components)).encode())
+    for hs in hull.hull_shapes:
+        digest.update(f"\n{hs['label']}\n{hs['pattern']}\n".encode())
+        digest.update(hs["shape"].exportBrepToString().encode())
+    return digest.hexdigest()
+
+
+class DiskCache:
+    """
+    Size-capped, content-addressed cache of JSON results in a directory.
+
+    Attributes:
+        directory: Cache directory (created if missing)
+        max_size_bytes: Size cap of all entries together
+        hits, misses, writes, evictions: Counters for this process
+    """
+
+    def __init__(self, directory: str,
+                 max_size_mb: float = DEFAULT_DISK_CACHE_SIZE_MB):
+        self.directory = directory
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+
+        os.makedirs(directory, exist_ok=True)
+        self._size_bytes = sum(size for _, size, _ in self._entries())
+
+    def _entries(self) -> list:
+        """(path, size, mtime) of all entries in the cache directory."""
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(".json"):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                # Removed by another process in the meantime
+                continue
+            entries.append((path, st.st_size, st.st_mtime))
+        return entries
+
+    def key(self, fingerprint: str, pose_key: tuple) -> str:
+        """Entry name for a hull fingerprint and a (quantized) pose key."""
+        return hashlib.sha256(f"{fingerprint}:{pose_key!r}".encode()).hexdigest()
+
+    def get(self, key: str):
+        """Return the cached result for key, or None."""
+        path = os.path.join(self.directory, key + ".json")
+        try:
+            with open(path) as f:
+                result = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.misses += 1
+            return None
+
+        # Refresh the modification time for LRU eviction
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        self.hits += 1
+        return result
+
+    def put(self, key: str, result: dict):
+        """Store result under key and evict old entries if over the cap."""
+        if self.max_size_bytes <= 0:
+            return
+
+        data = json.dumps(result, separators=(",", ":"))
+        path = os.path.join(self.directory, key + ".json")
+        # An overwritten entry (e.g. written by another process in the
+        # meantime) only adds the difference in size
+        try:
+            old_size = os.path.getsize(path)
+        except FileNotFoundError:
+            old_size = 0
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except FileNotFoundError:
+                pass
+            raise
+
+        self.writes += 1
+        self._size_bytes += len(data) - old_size
+        if self._size_bytes > self.max_size_bytes:
+            self.evict()
+
+    def _remove_stale_tmp(self):
+        """Delete temporary files left behind by writers that crashed."""
+        now = time.time()
+        for name in os.listdir(self.directory):
+            if not name.endswith(".tmp"):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                if now - os.stat(path).st_mtime > STALE_TMP_AGE_S:
+                    os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def evict(self):
+        """Delete least recently used entries until below the target size."""
+        self._remove_stale_tmp()
+        entries = sorted(self._entries(), key=lambda entry: entry[2])
+        size = sum(entry[1] for entry in entries)
+        target = self.max_size_bytes * EVICTION_TARGET_FRACTION
+
+        for path, entry_size, _ in entries:
+            if size <= target:
+                break
+            try:
+                os.remove(path)
+                self.evictions += 1
+            except FileNotFoundError:
+                pass
+            size -= entry_size
+
+        self._size_bytes = size
+
+    def stats(self) -> dict:
+        """Counters and occupancy, for the JSON artifacts."""
+        lookups = self.hits + self.misses
+        return {
+            "directory": self.directory,
+            "max_size_mb": round(self.max_size_bytes / (1024 * 1024), 3),
+            "size_mb": round(self._size_bytes / (1024 * 1024), 3),
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 4) if lookups > 0 else 0.0
+        }
+
+
+def merge_disk_cache_stats(stats_list: list) -> dict:
+    """
+    Combine DiskCache.stats() of several processes sharing one directory.
+
+    Counters are summed. Directory, cap and occupancy are those seen by the
+    process that wrote the most entries.
+    """
+    latest = max(stats_list, key=lambda s: s["writes"])
+    hits = sum(s["hits"] for s in stats_list)
+    misses = sum(s["misses"] for s in stats_list)
+    lookups = hits + misses
+    return {
+        "directory": latest["directory"],
+        "max_size_mb": latest["max_size_mb"],
+        "size_mb": latest["size_mb"],
+        "hits": hits,
+        "misses": misses,
+        "writes": sum(s["writes"] for s in stats_list),
+        "evictions": sum(s["evictions"] for s in stats_list),
+        "hit_rate": round(hits / lookups, 4) if lookups > 0 else 0.0,
+        "caches": len(stats_list)
+    }
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+Geometry properties index: per-object properties of a design, without OCC.
+
+Several stages open the same FCStd only to walk its objects and read the
+label, volume, center of gravity, bounding box and placement of each
+shape. The design stage walks the document once more before closing it and
+writes these properties next to the design as a small JSON sidecar:
+
+    artifact/boat.conf.design.FCStd  ->  artifact/boat.conf.design.index.json
+
+Per object (first object of each label, in document order):
+
+    name, label          FreeCAD object name and label
+    material             Material key parsed from the label (or null)
+    volume_mm3           Shape volume
+    center_of_gravity    Shape center of gravity {x, y, z}
+    global_cog           Center of gravity in world coordinates (see
+                         _get_global_cog)
+    bound_box            Shape bounding box {x_min, ..., z_max}
+    global_placement     {position: [x, y, z], rotation: quaternion [x, y, z, w]}
+    placement_applied    Whether global_placement maps the shape to world
+                         coordinates (shape built at the origin), or the
+                         shape is already in world coordinates
+    matrix_of_inertia    3x3 volume inertia about the center of gravity in
+                         mm^5 (times density for mass inertia), null if the
+                         shape has none
+
+design_objects() returns these records from the sidecar when it is at least
+as new as the design, and otherwise by opening the document, so consumers
+work with or without it.
+
+Usage:
+    from src.physics.geometry_index import design_objects
+
+    for record in design_objects("artifact/boat.design.FCStd"):
+        print(record["label"], record["volume_mm3"])
+"""
+
+import sys
+import os
+import json
+
+try:
+    import FreeCAD as App
+    from FreeCAD import Base
+except ImportError as e:
+    print(f"ERROR: {e}", file=sys.stderr)
+    print("This module must be run with FreeCAD's Python", file=sys.stderr)
+    sys.exit(1)
+
+
+# Format version of the sidecar; older indices are ignored
+GEOMETRY_INDEX_VERSION = 2
+
+
+def _get_all_objects(obj_list):
+    """Recursively get all objects including those in groups."""
+    all_objs = []
+    for obj in obj_list:
+        all_objs.append(obj)
+        if hasattr(obj, 'Group'):
+            all_objs.extend(_get_all_objects(obj.Group))
+    return all_objs
+
+
+def _extract_material_from_label(label: str) -> str:
+    """
+    Extract material name from object label.
+
+    Expected format: ComponentName__material_name or ComponentName__material_name_001
+    """
+    label_lower = label.lower()
+    if '__' in label_lower:
+        parts = label_lower.split('__')
+        if len(parts) >= 2:
+            return parts[1].rstrip('_0123456789').strip()
+    return None
+
+
+def _shape_at_origin(bbox) -> bool:
+    """
+    Whether a shape was built at the origin and is positioned by its placement.
+
+    True if the bounding box center is near the origin in X and Y; shapes
+    built at their final world position are far from it.
+    """
+    bbox_center_x = (bbox.XMin + bbox.XMax) / 2
+    bbox_center_y = (bbox.YMin + bbox.YMax) / 2
+    return abs(bbox_center_x) < 500 and abs(bbox_center_y) < 500
+
+
+def _get_global_cog(obj) -> Base.Vector:
+    """
+    Get the center of gravity in world (global) coordinates.
+
+    There are two cases in the design:
+    1. Shape created at origin, then positioned via Placement (e.g., Mast in Rig group)
+       - Shape bbox center is near origin in X and Y
+       - We need to apply Placement to get world coords
+
+    2. Shape created at final world position (e.g., Hull, Ama parts)
+       - Shape bbox is already at final position (far from origin)
+       - Placement should NOT be applied (shape CoG is already in world coords)
+
+    We detect case 2 by checking if the shape bbox center is far from origin.
+    """
+    local_cog = obj.Shape.CenterOfGravity
+
+    if _shape_at_origin(obj.Shape.BoundBox):
+        # Shape is at origin - apply placement to get world coords
+        if hasattr(obj, 'getGlobalPlacement'):
+            global_placement = obj.getGlobalPlacement()
+        else:
+            global_placement = obj.Placement if hasattr(obj, 'Placement') else App.Placement()
+
+        world_cog = global_placement.multVec(local_cog)
+        return world_cog
+    else:
+        # Shape already at world position - use CoG directly
+        return local_cog
+
+
+def index_path_for(fcstd_path: str) -> str:
+    """Sidecar index path of a design file."""
+    root, _ = os.path.splitext(fcstd_path)
+    return root + ".index.json"
+
+
+def _vector(v) -> dict:
+    return {"x": v.x, "y": v.y, "z": v.z}
+
+
+def object_properties(obj) -> dict:
+    """
+    Index record of one FreeCAD object with a shape.
+
+    Args:
+        obj: Document object with a non-null Shape
+
+    Returns:
+        Dictionary with the fields listed in the module docstring
+    """
+    shape = obj.Shape
+    bbox = shape.BoundBox
+
+    if hasattr(obj, 'getGlobalPlacement'):
+        placement = obj.getGlobalPlacement()
+    else:
+        placement = obj.Placement
+
+    try:
+        m = shape.MatrixOfInertia
+        inertia = [[m.A11, m.A12, m.A13],
+                   [m.A21, m.A22, m.A23],
+                   [m.A31, m.A32, m.A33]]
+    except Exception:
+        # Only solids and compounds of solids have an inertia matrix
+        inertia = None
+
+    return {
+        "name": obj.Name,
+        "label": obj.Label,
+        "material": _extract_material_from_label(obj.Label),
+        "volume_mm3": shape.Volume,
+        "center_of_gravity": _vector(shape.CenterOfGravity),
+        "global_cog": _vector(_get_global_cog(obj)),
+        "bound_box": {
+            "x_min": bbox.XMin, "x_max": bbox.XMax,
+            "y_min": bbox.YMin, "y_max": bbox.YMax,
+            "z_min": bbox.ZMin, "z_max": bbox.ZMax
+        },
+        "global_placement": {
+            "position": [placement.Base.x, placement.Base.y, placement.Base.z],
+            "rotation": list(placement.Rotation.Q)
+        },
+        "placement_applied": _shape_at_origin(bbox),
+        "matrix_of_inertia": inertia
+    }
+
+
+def build_geometry_index(doc) -> list:
+    """
+    Walk a document once and collect the index records.
+
+    Objects without a shape (groups, origins) are skipped, and of several
+    objects with the same label only the first is kept, as the mass and
+    center of gravity computations do.
+    """
+    records = []
+    labels = set()
+    for obj in _get_all_objects(doc.Objects):
+        if not hasattr(obj, 'Shape') or obj.Shape.isNull():
+            continue
+        if obj.Label in labels:
+            continue
+        records.append(object_properties(obj))
+        labels.add(obj.Label)
+    return records
+
+
+def save_geometry_index(records: list, path: str, design_path: str = None,
+                        design_stats: dict = None):
+    """
+    Write index records as JSON.
+
+    Args:
+        records: Result of build_geometry_index
+        path: Output path (see index_path_for)
+        design_path: Design file the records were taken from
+        design_stats: Optional generation statistics of the design
+                      (mirror mode, timings, file size)
+    """
+    artifact = {
+        "validator": "geometry_index",
+        "version": GEOMETRY_INDEX_VERSION,
+        "design": design_path,
+        "object_count": len(records),
+        "objects": records
+    }
+    if design_stats is not None:
+        artifact["design_stats"] = design_stats
+    with open(path, "w") as f:
+        json.dump(artifact, f, indent=1)
+
+
+def load_geometry_index(fcstd_path: str):
+    """
+    Index records of a design from its sidecar.
+
+    Returns:
+        List of records, or None if there is no sidecar, it is older than
+        the design, or it has another format version
+    """
+    path = index_path_for(fcstd_path)
+    try:
+        if os.path.getmtime(path) < os.path.getmtime(fcstd_path):
+            return None
+        with open(path) as f:
+            artifact = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+    if artifact.get("version") != GEOMETRY_INDEX_VERSION:
+        return None
+    return artifact["objects"]
+
+
+def design_objects(fcstd_path: str) -> list:
+    """
+    Index records of a design, from the sidecar if fresh, else from the document.
+
+    Args:
+        fcstd_path: Path to the FreeCAD design file
+
+    Returns:
+        List of records (see the module docstring)
+    """
+    records = load_geometry_index(fcstd_path)
+    if records is not None:
+        return records
+
+    doc = App.openDocument(fcstd_path)
+    try:
+        return build_geometry_index(doc)
+    finally:
+        App.closeDocument(doc.Name)
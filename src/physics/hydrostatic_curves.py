@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Hydrostatic curves: upright hydrostatic particulars as functions of draft.
+
+The hull is swept once through level-trim drafts, from just touching the
+water to fully submerged, and the classic hydrostatic curves are tabulated:
+
+    displacement_kg      Displaced water (saltwater)
+    lcb_mm, tcb_mm       Longitudinal (Y) and transverse (X) center of buoyancy
+    kb_mm                Center of buoyancy above the keel (lowest hull point)
+    waterplane_area_m2   Waterplane area
+    lcf_mm               Longitudinal center of flotation (waterplane centroid Y)
+    tpc_t_per_cm         Tonnes per centimetre immersion
+    bmt_mm, bml_mm       Transverse and longitudinal metacentric radius
+    mct_tm_per_cm        Moment to change trim one centimetre, in tonne metres
+
+MCT uses the usual approximation GM_L ~ BM_L and the overall hull length.
+
+The table is a small JSON artifact (see src/hydrostatics). HydrostaticCurves
+interpolates it, e.g. to find the level-trim z for a given weight without
+bisecting over the hull, or to answer loading questions (how much deeper
+with 100 kg more?) without opening the design.
+
+Usage:
+    from src.physics.hydrostatic_curves import HydrostaticCurves
+
+    curves = HydrostaticCurves("artifact/boat.hydrostatics.json")
+    z = curves.z_for_weight(weight_N)
+    tpc = curves.interpolate("tpc_t_per_cm", z)
+"""
+
+import json
+
+import numpy as np
+
+from .center_of_buoyancy import SALTWATER_DENSITY_KG_M3, GRAVITY_M_S2
+
+
+# Curves of the hydrostatics artifact, in table column order
+CURVE_NAMES = (
+    "z_offset_mm",
+    "draft_mm",
+    "volume_mm3",
+    "displacement_kg",
+    "lcb_mm",
+    "tcb_mm",
+    "kb_mm",
+    "waterplane_area_m2",
+    "lcf_mm",
+    "tpc_t_per_cm",
+    "bmt_mm",
+    "bml_mm",
+    "mct_tm_per_cm",
+)
+
+
+def hull_extent(hull) -> dict:
+    """
+    Body-frame extent of the hull shapes.
+
+    Returns:
+        Dictionary with keel_z_mm (lowest point), top_z_mm (highest point)
+        and length_mm (overall Y extent)
+    """
+    corners = np.concatenate([hs["corners"] for hs in hull.hull_shapes])
+    return {
+        "keel_z_mm": float(corners[:, 2].min()),
+        "top_z_mm": float(corners[:, 2].max()),
+        "length_mm": float(corners[:, 1].max() - corners[:, 1].min())
+    }
+
+
+def compute_hydrostatic_curves(hull, draft_count: int = 101,
+                               water_level_z: float = 0.0) -> dict:
+    """
+    Sweep level-trim drafts and compute the hydrostatic curves.
+
+    Args:
+        hull: HullModel of the design
+        draft_count: Number of drafts from 0 to the hull depth (at least 2)
+        water_level_z: Z coordinate of the water surface (default: 0)
+
+    Returns:
+        Dictionary with "curves" ({name: (N,) array} for CURVE_NAMES, in
+        increasing draft) and the hull extent used for draft and MCT
+    """
+    if draft_count < 2:
+        raise ValueError("Hydrostatic curves need at least two drafts")
+
+    extent = hull_extent(hull)
+    keel, top = extent["keel_z_mm"], extent["top_z_mm"]
+
+    # Level trim: draft 0 at z = water - keel, fully submerged at z = water - top
+    z_values = np.linspace(water_level_z - keel, water_level_z - top, draft_count)
+    poses = np.column_stack([z_values, np.zeros(draft_count), np.zeros(draft_count)])
+    batch = hull.center_of_buoyancy_batch(poses, water_level_z)
+
+    volume = batch["submerged_volume_mm3"]
+    displacement_kg = batch["displacement_kg"]
+    wp = batch["waterplane"]
+    area = wp["area_mm2"]
+
+    floating = volume > 1e-6
+    safe_volume = np.where(floating, volume, 1.0)
+    has_area = area > 0
+    safe_area = np.where(has_area, area, 1.0)
+
+    # Waterplane second moments about its own centroid
+    centroid_x = np.where(has_area, wp["moment_x_mm3"] / safe_area, 0.0)
+    centroid_y = np.where(has_area, wp["moment_y_mm3"] / safe_area, 0.0)
+    inertia_t = wp["xx_mm4"] - area * centroid_x ** 2
+    inertia_l = wp["yy_mm4"] - area * centroid_y ** 2
+
+    bmt = np.where(floating, inertia_t / safe_volume, 0.0)
+    bml = np.where(floating, inertia_l / safe_volume, 0.0)
+
+    keel_world = keel + z_values
+    length_m = extent["length_mm"] / 1000.0
+    area_m2 = area / 1e6
+
+    curves = {
+        "z_offset_mm": z_values,
+        "draft_mm": water_level_z - keel_world,
+        "volume_mm3": volume,
+        "displacement_kg": displacement_kg,
+        "lcb_mm": np.where(floating, batch["CoB"]["y"], 0.0),
+        "tcb_mm": np.where(floating, batch["CoB"]["x"], 0.0),
+        "kb_mm": np.where(floating, batch["CoB"]["z"] - keel_world, 0.0),
+        "waterplane_area_m2": area_m2,
+        "lcf_mm": centroid_y,
+        # One centimetre of immersion: rho * A * 0.01 m, in tonnes
+        "tpc_t_per_cm": SALTWATER_DENSITY_KG_M3 * area_m2 * 0.01 / 1000.0,
+        "bmt_mm": bmt,
+        "bml_mm": bml,
+        "mct_tm_per_cm": (displacement_kg / 1000.0 * bml / 1000.0 / (100.0 * length_m)
+                          if length_m > 0 else np.zeros(draft_count)),
+    }
+
+    return {
+        "curves": curves,
+        "keel_z_mm": round(keel, 2),
+        "length_mm": round(extent["length_mm"], 2),
+        "water_level_z": water_level_z,
+        "water_density_kg_m3": SALTWATER_DENSITY_KG_M3
+    }
+
+
+def save_hydrostatic_curves(result: dict, path: str, metadata: dict = None):
+    """
+    Write hydrostatic curves (from compute_hydrostatic_curves) as JSON.
+
+    Args:
+        result: Result of compute_hydrostatic_curves
+        path: Output JSON path
+        metadata: Extra top-level fields (design, engine, ...)
+    """
+    artifact = {key: value for key, value in result.items() if key != "curves"}
+    artifact["curves"] = {name: [round(float(v), 6) for v in result["curves"][name]]
+                          for name in CURVE_NAMES}
+    artifact.update(metadata or {})
+    artifact["validator"] = "hydrostatics"
+
+    with open(path, "w") as f:
+        json.dump(artifact, f, indent=2)
+
+
+class HydrostaticCurves:
+    """
+    Hydrostatic curves loaded from a hydrostatics JSON artifact.
+
+    Attributes:
+        curves: {name: (N,) array} in increasing draft
+        keel_z_mm, length_mm: Hull extent the curves were computed with
+    """
+
+    def __init__(self, path: str):
+        with open(path) as f:
+            artifact = json.load(f)
+        self.curves = {name: np.asarray(values, dtype=float)
+                       for name, values in artifact["curves"].items()}
+        self.keel_z_mm = artifact["keel_z_mm"]
+        self.length_mm = artifact["length_mm"]
+
+    def interpolate(self, name: str, z_displacement: float) -> float:
+        """Linear interpolation of one curve at a level-trim z displacement."""
+        # z decreases with draft; np.interp needs increasing sample points
+        z = self.curves["z_offset_mm"][::-1]
+        return float(np.interp(z_displacement, z, self.curves[name][::-1]))
+
+    def z_for_displacement(self, displacement_kg: float):
+        """
+        Level-trim z displacement at which the hull displaces displacement_kg.
+
+        Returns:
+            z in mm, or None if the displacement is outside the curves
+            (the boat would sink or not touch the water)
+        """
+        displacement = self.curves["displacement_kg"]
+        if not displacement[0] <= displacement_kg <= displacement[-1]:
+            return None
+        # Displacement grows monotonically with draft
+        return float(np.interp(displacement_kg, displacement, self.curves["z_offset_mm"]))
+
+    def z_for_weight(self, weight_N: float):
+        """Level-trim z displacement at which buoyancy equals weight_N (or None)."""
+        return self.z_for_displacement(weight_N / GRAVITY_M_S2)
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Closed-form hydrostatic derivatives from waterplane quantities.
+
+For a rigid hull moving with velocity field u (translation plus rotation
+about the pose's rotation center), the submerged volume V and its first
+moments M = ∫ p dV change only through the waterplane:
+
+    dV = -∫wp u_z dA
+    dM =  ∫V u dV - ∫wp p u_z dA
+
+Both integrals reduce to the submerged volume, its centroid and the
+waterplane area, first moments and second moments, which the CoB
+computation already returns in "waterplane". The derivatives of the
+center of buoyancy then follow from dCoB = (dM - CoB dV) / V.
+
+The pose variables are those of compute_center_of_buoyancy:
+    z: vertical displacement in mm
+    pitch: rotation about X in degrees, applied first
+    roll: rotation about Y in degrees, applied second (R = Ry(roll) * Rx(pitch))
+
+Usage:
+    from src.physics.hydrostatic_derivatives import compute_hydrostatic_derivatives
+
+    cob_result = hull.center_of_buoyancy(z, pitch, roll)
+    derivatives = compute_hydrostatic_derivatives(cob_result)
+    # derivatives["volume_mm3"] = [dV/dz, dV/dpitch, dV/droll]
+    # derivatives["CoB"]["x"] = [dx/dz, dx/dpitch, dx/droll]
+"""
+
+import math
+
+from .center_of_buoyancy import SALTWATER_DENSITY_KG_M3, GRAVITY_M_S2
+
+
+def _cross(a: tuple, b: tuple) -> tuple:
+    """Cross product of two 3-vectors."""
+    return (a[1] * b[2] - a[2] * b[1],
+            a[2] * b[0] - a[0] * b[2],
+            a[0] * b[1] - a[1] * b[0])
+
+
+def pose_velocities(pitch_deg: float, roll_deg: float) -> list:
+    """
+    Rigid-body velocities of the three pose variables.
+
+    Returns:
+        List of (translation, angular_velocity) for z, pitch and roll. The
+        angular velocities are in radians per degree of the pose angle.
+    """
+    roll_rad = math.radians(roll_deg)
+    per_degree = math.pi / 180.0
+
+    return [
+        # z: pure vertical translation
+        ((0.0, 0.0, 1.0), (0.0, 0.0, 0.0)),
+        # pitch: rotation about the body X axis, i.e. Ry(roll) * e_x in world frame
+        ((0.0, 0.0, 0.0), (math.cos(roll_rad) * per_degree, 0.0,
+                           -math.sin(roll_rad) * per_degree)),
+        # roll: rotation about the world Y axis
+        ((0.0, 0.0, 0.0), (0.0, per_degree, 0.0)),
+    ]
+
+
+def point_derivatives(point: dict, cob_result: dict) -> dict:
+    """
+    Derivatives of a body-fixed point's world position with respect to the pose.
+
+    Args:
+        point: World position {"x", "y", "z"} of the point at the current pose
+        cob_result: Result from compute_center_of_buoyancy at the current pose
+
+    Returns:
+        Dictionary {"x", "y", "z"} of [d/dz, d/dpitch, d/droll] lists
+    """
+    pose = cob_result['pose']
+    center = pose['rotation_center']
+    # Rotation center after the z displacement (rotation is applied first)
+    c_w = (center['x'], center['y'], center['z'] + pose['z_offset_mm'])
+    r = (point['x'] - c_w[0], point['y'] - c_w[1], point['z'] - c_w[2])
+
+    result = {"x": [], "y": [], "z": []}
+    for translation, omega in pose_velocities(pose['pitch_deg'], pose['roll_deg']):
+        rotation = _cross(omega, r)
+        for i, axis in enumerate("xyz"):
+            result[axis].append(translation[i] + rotation[i])
+    return result
+
+
+def compute_hydrostatic_derivatives(cob_result: dict) -> dict:
+    """
+    Derivatives of submerged volume and center of buoyancy with respect to the pose.
+
+    Args:
+        cob_result: Result from compute_center_of_buoyancy (must contain
+                    "waterplane" and "pose" with rotation center and water level)
+
+    Returns:
+        Dictionary with:
+        - volume_mm3: [dV/dz, dV/dpitch, dV/droll] in mm³/mm and mm³/degree
+        - buoyancy_force_N: same for the buoyancy force
+        - CoB: {"x", "y", "z"} of [d/dz, d/dpitch, d/droll] in mm/mm and mm/degree
+    """
+    pose = cob_result['pose']
+    wp = cob_result['waterplane']
+    water_level_z = pose.get('water_level_z', 0.0)
+
+    volume = cob_result['submerged_volume_mm3']
+    cob = cob_result['CoB']
+    moment = (cob['x'] * volume, cob['y'] * volume, cob['z'] * volume)
+
+    center = pose['rotation_center']
+    c_w = (center['x'], center['y'], center['z'] + pose['z_offset_mm'])
+
+    area = wp['area_mm2']
+    s_x, s_y = wp['moment_x_mm3'], wp['moment_y_mm3']
+    i_xx, i_yy, i_xy = wp['xx_mm4'], wp['yy_mm4'], wp['xy_mm4']
+
+    d_volume = []
+    d_cob = {"x": [], "y": [], "z": []}
+
+    for a, omega in pose_velocities(pose['pitch_deg'], pose['roll_deg']):
+        # Vertical velocity on the waterplane: u_z = a_z + w_x (y - c_y) - w_y (x - c_x)
+        flux = a[2] * area + omega[0] * (s_y - c_w[1] * area) - omega[1] * (s_x - c_w[0] * area)
+        flux_x = (a[2] * s_x + omega[0] * (i_xy - c_w[1] * s_x)
+                  - omega[1] * (i_xx - c_w[0] * s_x))
+        flux_y = (a[2] * s_y + omega[0] * (i_yy - c_w[1] * s_y)
+                  - omega[1] * (i_xy - c_w[0] * s_y))
+        flux_z = water_level_z * flux
+
+        dv = -flux
+
+        # ∫V u dV = a V + ω × (M - V c_w)
+        rotation = _cross(omega, (moment[0] - volume * c_w[0],
+                                  moment[1] - volume * c_w[1],
+                                  moment[2] - volume * c_w[2]))
+        dm = (a[0] * volume + rotation[0] - flux_x,
+              a[1] * volume + rotation[1] - flux_y,
+              a[2] * volume + rotation[2] - flux_z)
+
+        d_volume.append(dv)
+        for i, axis in enumerate("xyz"):
+            if volume > 1e-6:
+                d_cob[axis].append((dm[i] - cob[axis] * dv) / volume)
+            else:
+                d_cob[axis].append(0.0)
+
+    force_per_mm3 = SALTWATER_DENSITY_KG_M3 * GRAVITY_M_S2 / 1e9
+
+    return {
+        "volume_mm3": d_volume,
+        "buoyancy_force_N": [dv * force_per_mm3 for dv in d_volume],
+        "CoB": d_cob
+    }
@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""
+Precomputed hydrostatic lookup table with trilinear interpolation.
+
+The submerged volume and its first moments are sampled once on a regular
+(z, pitch, roll) grid (see src/lookup/__main__.py) and stored as a
+compressed .npz artifact next to the design. HydrostaticTable answers CoB
+queries from that grid by trilinear interpolation in microseconds.
+
+Moments (volume * CoB) are interpolated rather than the CoB itself, so the
+CoB stays well behaved where the submerged volume goes to zero.
+
+Every query also reports an error bound. For trilinear interpolation the
+error along each axis is at most h²/8 * max|f''| over the cell; the second
+derivatives are estimated from second differences of the grid values at the
+cell corners. Near kinks (ama touching the water, deck edge immersion) the
+second differences grow and so does the bound. Outside the grid the bound is
+infinite, which callers use to fall back to the exact HullModel.
+
+Usage:
+    from src.physics.lookup_table import HydrostaticTable
+
+    table = HydrostaticTable("artifact/boat.lookup.npz")
+    result = table.center_of_buoyancy(z_displacement=-300, pitch_deg=0, roll_deg=5)
+    # result["CoB"], result["buoyancy_force_N"], result["error_bound"], ...
+"""
+
+import numpy as np
+
+from .center_of_buoyancy import SALTWATER_DENSITY_KG_M3, GRAVITY_M_S2
+from .mesh_hydrostatics import transform_vertices
+
+
+def build_lookup_table(hull, z_values, pitch_values, roll_values,
+                       water_level_z: float = 0.0) -> dict:
+    """
+    Sample submerged volume and moments of a hull over a pose grid.
+
+    Args:
+        hull: HullModel of the design
+        z_values, pitch_values, roll_values: Increasing grid axes
+                                             (mm, degrees, degrees)
+        water_level_z: Z coordinate of the water surface (default: 0)
+
+    Returns:
+        Dictionary of NumPy arrays, ready for save_lookup_table()
+    """
+    z_values = np.asarray(z_values, dtype=float)
+    pitch_values = np.asarray(pitch_values, dtype=float)
+    roll_values = np.asarray(roll_values, dtype=float)
+
+    for name, axis in (("z", z_values), ("pitch", pitch_values), ("roll", roll_values)):
+        if len(axis) < 2 or np.any(np.diff(axis) <= 0):
+            raise ValueError(f"Lookup table {name} axis must have at least two increasing values")
+
+    grid = np.stack(np.meshgrid(z_values, pitch_values, roll_values, indexing='ij'), axis=-1)
+    shape = grid.shape[:3]
+
+    batch = hull.center_of_buoyancy_batch(grid.reshape(-1, 3), water_level_z)
+    volume = batch["submerged_volume_mm3"]
+
+    center = hull.rotation_center
+    return {
+        "z_mm": z_values,
+        "pitch_deg": pitch_values,
+        "roll_deg": roll_values,
+        "volume_mm3": volume.reshape(shape),
+        "moment_x_mm4": (batch["CoB"]["x"] * volume).reshape(shape),
+        "moment_y_mm4": (batch["CoB"]["y"] * volume).reshape(shape),
+        "moment_z_mm4": (batch["CoB"]["z"] * volume).reshape(shape),
+        "water_level_z": np.array(water_level_z),
+        "rotation_center": np.array([center.x, center.y, center.z]),
+        "ama_ref_body": np.array([hull.ama_ref_body[a] for a in "xyz"], dtype=float),
+        "vaka_ref_body": np.array([hull.vaka_ref_body[a] for a in "xyz"], dtype=float),
+        "total_volumes_mm3": np.array([hull.total_ama_volume_mm3, hull.total_vaka_volume_mm3],
+                                      dtype=float),
+        "engine": np.array(hull.engine),
+        "design": np.array(hull.fcstd_path)
+    }
+
+
+def save_lookup_table(table: dict, path: str):
+    """Write a lookup table (from build_lookup_table) as compressed .npz."""
+    np.savez_compressed(path, **table)
+
+
+def _second_differences(values: np.ndarray, axis_values: np.ndarray, axis: int) -> np.ndarray:
+    """
+    Absolute second divided differences of a grid function along one axis.
+
+    Boundary nodes take the value of their interior neighbour; axes with only
+    two nodes have no curvature information and give zeros.
+    """
+    if len(axis_values) < 3:
+        return np.zeros_like(values)
+
+    h = np.diff(axis_values)
+    shape = [1, 1, 1]
+    shape[axis] = -1
+    h0 = h[:-1].reshape(shape)
+    h1 = h[1:].reshape(shape)
+
+    lower = np.take(values, range(0, len(axis_values) - 2), axis=axis)
+    middle = np.take(values, range(1, len(axis_values) - 1), axis=axis)
+    upper = np.take(values, range(2, len(axis_values)), axis=axis)
+
+    d2 = np.abs(2.0 * ((upper - middle) / h1 - (middle - lower) / h0) / (h0 + h1))
+
+    first = np.take(d2, [0], axis=axis)
+    last = np.take(d2, [-1], axis=axis)
+    return np.concatenate([first, d2, last], axis=axis)
+
+
+def _cell_error_bound(values: np.ndarray, axes: list) -> np.ndarray:
+    """
+    Interpolation error bound per grid cell, shape (nz-1, npitch-1, nroll-1).
+
+    Sum over axes of h²/8 times the largest second difference at the cell's
+    eight corners.
+    """
+    bound = np.zeros(tuple(len(a) - 1 for a in axes))
+    for axis, axis_values in enumerate(axes):
+        d2 = _second_differences(values, axis_values, axis)
+
+        # Largest value over the 2x2x2 corners of each cell
+        corner_max = d2
+        for k in range(3):
+            n = corner_max.shape[k]
+            corner_max = np.maximum(np.take(corner_max, range(0, n - 1), axis=k),
+                                    np.take(corner_max, range(1, n), axis=k))
+
+        shape = [1, 1, 1]
+        shape[axis] = -1
+        h = np.diff(axis_values).reshape(shape)
+        bound += h * h / 8.0 * corner_max
+    return bound
+
+
+class HydrostaticTable:
+    """
+    Hydrostatic lookup table loaded from a .npz artifact.
+
+    Provides center_of_buoyancy() and center_of_buoyancy_batch() with the
+    same call signature as HullModel, so the solvers can run on either.
+    Results carry "error_bound" (volume, force and CoB) instead of a
+    waterplane and per-component breakdown.
+
+    Attributes:
+        path: Path of the .npz artifact
+        engine: Engine the table was sampled with
+        axes: [z_mm, pitch_deg, roll_deg] grid axes
+        rotation_center: Rotation center used for the poses (body frame)
+    """
+
+    FIELDS = ("volume_mm3", "moment_x_mm4", "moment_y_mm4", "moment_z_mm4")
+
+    def __init__(self, path: str):
+        self.path = path
+
+        with np.load(path) as data:
+            self.axes = [data["z_mm"], data["pitch_deg"], data["roll_deg"]]
+            self.values = {field: data[field] for field in self.FIELDS}
+            self.water_level_z = float(data["water_level_z"])
+            self.rotation_center = data["rotation_center"]
+            self.ama_ref_body = data["ama_ref_body"]
+            self.vaka_ref_body = data["vaka_ref_body"]
+            self.total_volumes_mm3 = data["total_volumes_mm3"]
+            self.engine = str(data["engine"])
+
+        self.bounds = {field: _cell_error_bound(values, self.axes)
+                       for field, values in self.values.items()}
+
+    def _locate(self, poses: np.ndarray):
+        """Cell indices, fractional positions and inside-grid mask for poses."""
+        indices, fractions = [], []
+        inside = np.ones(len(poses), dtype=bool)
+        for k, axis_values in enumerate(self.axes):
+            x = poses[:, k]
+            i = np.clip(np.searchsorted(axis_values, x, side='right') - 1,
+                        0, len(axis_values) - 2)
+            t = (x - axis_values[i]) / (axis_values[i + 1] - axis_values[i])
+            inside &= (x >= axis_values[0]) & (x <= axis_values[-1])
+            indices.append(i)
+            fractions.append(np.clip(t, 0.0, 1.0))
+        return indices, fractions, inside
+
+    def query(self, poses) -> dict:
+        """
+        Interpolate volume and moments at an array of poses.
+
+        Args:
+            poses: (N, 3) array-like of (z_displacement, pitch_deg, roll_deg)
+
+        Returns:
+            Dictionary with (N,) arrays for each of FIELDS, their error bounds
+            under "error_bound" (inf outside the grid) and "inside"
+        """
+        poses = np.asarray(poses, dtype=float).reshape(-1, 3)
+        (i, j, k), (tz, tp, tr), inside = self._locate(poses)
+
+        result = {field: np.zeros(len(poses)) for field in self.FIELDS}
+        for di in (0, 1):
+            wz = tz if di else 1.0 - tz
+            for dj in (0, 1):
+                wp = tp if dj else 1.0 - tp
+                for dk in (0, 1):
+                    wr = tr if dk else 1.0 - tr
+                    weight = wz * wp * wr
+                    for field, values in self.values.items():
+                        result[field] += weight * values[i + di, j + dj, k + dk]
+
+        result["error_bound"] = {
+            field: np.where(inside, bound[i, j, k], np.inf)
+            for field, bound in self.bounds.items()
+        }
+        result["inside"] = inside
+        return result
+
+    def _check_water_level(self, water_level_z: float):
+        if abs(water_level_z - self.water_level_z) > 1e-9:
+            raise ValueError(f"Lookup table {self.path} was sampled at water level "
+                             f"z={self.water_level_z}, not z={water_level_z}")
+
+    def center_of_buoyancy_batch(self, poses, water_level_z: float = 0.0) -> dict:
+        """
+        Interpolated center of buoyancy at many poses.
+
+        Returns the same keys as HullModel.center_of_buoyancy_batch except
+        "waterplane", plus "error_bound" with (N,) arrays for
+        submerged_volume_mm3, buoyancy_force_N and CoB (distance in mm).
+        """
+        self._check_water_level(water_level_z)
+        poses = np.asarray(poses, dtype=float).reshape(-1, 3)
+        q = self.query(poses)
+
+        volume = q["volume_mm3"]
+        submerged = volume > 1e-6
+        safe_volume = np.where(submerged, volume, 1.0)
+        cob = {axis: np.where(submerged, q[f"moment_{axis}_mm4"] / safe_volume, 0.0)
+               for axis in "xyz"}
+
+        # CoB = M / V, so |dCoB| <= (|dM| + |CoB| |dV|) / V per axis
+        inside = q["inside"]
+        volume_bound = q["error_bound"]["volume_mm3"]
+        cob_bound = np.zeros(len(poses))
+        for axis in "xyz":
+            axis_bound = (np.where(inside, q["error_bound"][f"moment_{axis}_mm4"], 0.0)
+                          + np.abs(cob[axis]) * np.where(inside, volume_bound, 0.0)) / safe_volume
+            cob_bound += axis_bound * axis_bound
+        cob_bound = np.where(inside, np.where(submerged, np.sqrt(cob_bound), 0.0), np.inf)
+
+        displacement_kg = volume / 1e9 * SALTWATER_DENSITY_KG_M3
+        force_per_mm3 = SALTWATER_DENSITY_KG_M3 * GRAVITY_M_S2 / 1e9
+
+        return {
+            "CoB": cob,
+            "submerged_volume_mm3": volume,
+            "buoyancy_force_N": displacement_kg * GRAVITY_M_S2,
+            "displacement_kg": displacement_kg,
+            "engine": "table",
+            "pose": {
+                "z_offset_mm": poses[:, 0],
+                "pitch_deg": poses[:, 1],
+                "roll_deg": poses[:, 2],
+                "water_level_z": water_level_z,
+                "rotation_center": {
+                    "x": round(float(self.rotation_center[0]), 2),
+                    "y": round(float(self.rotation_center[1]), 2),
+                    "z": round(float(self.rotation_center[2]), 2)
+                }
+            },
+            "error_bound": {
+                "submerged_volume_mm3": volume_bound,
+                "buoyancy_force_N": volume_bound * force_per_mm3,
+                "CoB": cob_bound
+            }
+        }
+
+    def center_of_buoyancy(self, z_displacement: float = 0.0,
+                           pitch_deg: float = 0.0, roll_deg: float = 0.0,
+                           water_level_z: float = 0.0) -> dict:
+        """
+        Interpolated center of buoyancy at one pose.
+
+        Returns the summary keys of HullModel.center_of_buoyancy (CoB,
+        volumes, force, displacement, pose, hull_refs, total_volumes) with an
+        empty component list and no waterplane, plus "error_bound".
+        """
+        batch = self.center_of_buoyancy_batch([(z_displacement, pitch_deg, roll_deg)],
+                                              water_level_z)
+        volume = float(batch["submerged_volume_mm3"][0])
+
+        # Hull reference points in world frame
+        refs = transform_vertices(np.array([self.ama_ref_body, self.vaka_ref_body]),
+                                  z_displacement, pitch_deg, roll_deg, self.rotation_center)
+
+        def point(p):
+            return {"x": round(float(p[0]), 2), "y": round(float(p[1]), 2),
+                    "z": round(float(p[2]), 2)}
+
+        return {
+            "CoB": {axis: round(float(value[0]), 2) for axis, value in batch["CoB"].items()},
+            "submerged_volume_mm3": round(volume, 2),
+            "submerged_volume_liters": round(volume / 1e6, 4),
+            "buoyancy_force_N": round(float(batch["buoyancy_force_N"][0]), 2),
+            "displacement_kg": round(float(batch["displacement_kg"][0]), 2),
+            "engine": "table",
+            "pose": {
+                "z_offset_mm": z_displacement,
+                "pitch_deg": pitch_deg,
+                "roll_deg": roll_deg,
+                "water_level_z": water_level_z,
+                "rotation_center": batch["pose"]["rotation_center"]
+            },
+            "hull_refs": {
+                "ama_body": point(self.ama_ref_body),
+                "ama_world": point(refs[0]),
+                "vaka_body": point(self.vaka_ref_body),
+                "vaka_world": point(refs[1])
+            },
+            "total_volumes": {
+                "ama_liters": round(float(self.total_volumes_mm3[0]) / 1e6, 1),
+                "vaka_liters": round(float(self.total_volumes_mm3[1]) / 1e6, 1)
+            },
+            "error_bound": {
+                key: float(value[0]) for key, value in batch["error_bound"].items()
+            },
+            "components": []
+        }
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+Mass properties: mass, center of gravity and inertia tensor in one pass.
+
+Works on the per-object records of the geometry index (see
+geometry_index.py). For every object whose label names a known material:
+
+    mass      = volume × density
+    CoG       = world-frame center of gravity (global_cog of the record)
+    inertia   = density × volume inertia about the object's own CoG,
+                rotated to world axes if the object is positioned by its
+                placement
+
+The boat's inertia tensor about the combined CoG follows from the parallel
+axis theorem. Objects without an inertia matrix (non-solid shapes) count
+as point masses.
+
+Radii of gyration k = sqrt(I / m) are reported about the boat's roll (Y),
+pitch (X) and yaw (Z) axes through the CoG; the natural roll period is
+about T = 2 pi k_roll / sqrt(g GM_T).
+
+Everything is linear in the densities: VolumeTable keeps the geometry
+(volumes, positions, unit-density inertia) so that other material files or
+a whole matrix of density cases are re-aggregated in milliseconds, without
+touching the design.
+
+Usage:
+    from src.physics.geometry_index import design_objects
+    from src.physics.mass_properties import VolumeTable, compute_mass_properties
+
+    result = compute_mass_properties(design_objects(fcstd_path), materials)
+    result["CoG"], result["inertia_tensor_kg_m2"], result["radii_of_gyration_m"]
+
+    table = VolumeTable(design_objects(fcstd_path))
+    keys = table.used_materials(materials)
+    batch = table.evaluate_batch(keys, densities)   # densities: (K, len(keys))
+"""
+
+import numpy as np
+
+
+# Physical constants
+GRAVITY_M_S2 = 9.81  # m/s²
+
+
+def quaternion_matrix(q) -> np.ndarray:
+    """Rotation matrix of a unit quaternion (x, y, z, w), FreeCAD's Rotation.Q order."""
+    x, y, z, w = q
+    return np.array([
+        [1 - 2 * (y * y + z * z), 2 * (x * y - z * w), 2 * (x * z + y * w)],
+        [2 * (x * y + z * w), 1 - 2 * (x * x + z * z), 2 * (y * z - x * w)],
+        [2 * (x * z - y * w), 2 * (y * z + x * w), 1 - 2 * (x * x + y * y)]
+    ])
+
+
+def _vector_dict(v, digits: int = 2) -> dict:
+    return {"x": round(float(v[0]), digits),
+            "y": round(float(v[1]), digits),
+            "z": round(float(v[2]), digits)}
+
+
+def _aggregate(masses: np.ndarray, densities: np.ndarray, positions: np.ndarray,
+               unit_inertia: np.ndarray) -> tuple:
+    """
+    Combine component masses into totals, for K density cases at once.
+
+    Args:
+        masses: (K, N) component masses in kg
+        densities: (K, N) component densities in kg/m³
+        positions: (N, 3) component CoGs in mm
+        unit_inertia: (N, 3, 3) component inertia per unit density (kg m² per kg/m³)
+
+    Returns:
+        (total mass (K,), CoG (K, 3) in mm, inertia tensor about the CoG
+        (K, 3, 3) in kg m², radii of gyration about X, Y, Z (K, 3) in m)
+    """
+    total = masses.sum(axis=1)
+    safe_total = np.where(total > 1e-6, total, 1.0)
+    cog = np.where((total > 1e-6)[:, None], masses @ positions / safe_total[:, None], 0.0)
+
+    # Own inertia plus parallel axis theorem about the combined CoG (offsets in m)
+    offsets = (positions[None, :, :] - cog[:, None, :]) / 1000.0
+    inertia = np.einsum('kn,nij->kij', densities, unit_inertia)
+    inertia += np.einsum('kn,kn->k', masses, np.sum(offsets ** 2, axis=2))[:, None, None] * np.eye(3)
+    inertia -= np.einsum('kn,kni,knj->kij', masses, offsets, offsets)
+
+    diagonal = np.maximum(np.diagonal(inertia, axis1=1, axis2=2), 0.0)
+    radii = np.sqrt(diagonal / safe_total[:, None]) * (total > 1e-6)[:, None]
+    return total, cog, inertia, radii
+
+
+def _radii_dict(radii) -> dict:
+    # Roll is about the longitudinal (Y) axis, pitch about the transverse (X) axis
+    return {"roll": round(float(radii[1]), 4),
+            "pitch": round(float(radii[0]), 4),
+            "yaw": round(float(radii[2]), 4)}
+
+
+class VolumeTable:
+    """
+    Per-component volumes, positions and unit-density inertia of a design.
+
+    Mass properties are linear in the densities, so once the geometry is
+    tabulated any set of material densities is a few array operations
+    (evaluate), and many sets at once a few more (evaluate_batch).
+
+    Attributes:
+        labels: (N,) component labels
+        material_keys: (N,) material key parsed from each label
+        volume_m3: (N,) volumes
+        positions: (N, 3) world-frame CoGs in mm
+        unit_inertia: (N, 3, 3) inertia about each CoG, world axes, per unit
+                      density (kg m² per kg/m³); zero for point masses
+        has_inertia: (N,) whether the component has an inertia matrix
+    """
+
+    def __init__(self, records: list):
+        rows = [record for record in records if record["material"]]
+        self.labels = [record["label"] for record in rows]
+        self.material_keys = [record["material"] for record in rows]
+        self.volume_m3 = np.array([record["volume_mm3"] / 1e9 for record in rows])
+        self.positions = np.array([[record["global_cog"][axis] for axis in ("x", "y", "z")]
+                                   for record in rows]).reshape(-1, 3)
+        self.has_inertia = np.array([record.get("matrix_of_inertia") is not None
+                                     for record in rows], dtype=bool)
+
+        self.unit_inertia = np.zeros((len(rows), 3, 3))
+        for n, record in enumerate(rows):
+            if not self.has_inertia[n]:
+                continue
+            # Volume inertia is in mm^5
+            inertia = np.asarray(record["matrix_of_inertia"]) * 1e-15
+            if record.get("placement_applied"):
+                rotation = quaternion_matrix(record["global_placement"]["rotation"])
+                inertia = rotation @ inertia @ rotation.T
+            self.unit_inertia[n] = inertia
+
+    def used_materials(self, materials: dict) -> list:
+        """Sorted keys of the materials both used by the design and defined in materials."""
+        return sorted(set(self.material_keys) & set(materials))
+
+    def _component_densities(self, material_keys: list, densities: np.ndarray) -> np.ndarray:
+        """(K, N) component densities from (K, M) densities of material_keys (0 if absent)."""
+        column = {key: m for m, key in enumerate(material_keys)}
+        result = np.zeros((densities.shape[0], len(self.labels)))
+        for n, key in enumerate(self.material_keys):
+            if key in column:
+                result[:, n] = densities[:, column[key]]
+        return result
+
+    def evaluate(self, materials: dict) -> dict:
+        """
+        Mass properties for one set of material definitions.
+
+        Args:
+            materials: Material definitions by key, each with name and density_kg_m3
+
+        Returns:
+            Same as compute_mass_properties
+        """
+        keys = self.used_materials(materials)
+        densities = np.array([[materials[key]["density_kg_m3"] for key in keys]])
+        rho = self._component_densities(keys, densities)
+        masses = rho * self.volume_m3
+        total, cog, inertia, radii = _aggregate(masses, rho, self.positions, self.unit_inertia)
+
+        included = [n for n, key in enumerate(self.material_keys) if key in materials]
+        by_material = {}
+        components = []
+        for n in included:
+            key = self.material_keys[n]
+            totals = by_material.setdefault(key, {"mass_kg": 0.0, "volume_liters": 0.0})
+            totals["mass_kg"] += masses[0, n]
+            totals["volume_liters"] += self.volume_m3[n] * 1000
+            components.append({
+                "name": self.labels[n],
+                "material": materials[key]["name"],
+                "mass_kg": round(float(masses[0, n]), 2),
+                "volume_liters": round(float(self.volume_m3[n] * 1000), 2),
+                "CoG": _vector_dict(self.positions[n])
+            })
+
+        return {
+            "total_mass_kg": round(float(total[0]), 2),
+            "weight_N": round(float(total[0]) * GRAVITY_M_S2, 2),
+            "total_volume_liters": round(sum(t["volume_liters"] for t in by_material.values()), 2),
+            "CoG": _vector_dict(cog[0]),
+            "inertia_tensor_kg_m2": [[round(float(v), 3) for v in row] for row in inertia[0]],
+            "radii_of_gyration_m": _radii_dict(radii[0]),
+            "materials": {
+                key: {"mass_kg": round(float(totals["mass_kg"]), 2),
+                      "volume_liters": round(float(totals["volume_liters"]), 2)}
+                for key, totals in sorted(by_material.items())
+            },
+            "components": sorted(components, key=lambda c: c["mass_kg"], reverse=True),
+            "point_mass_components": int(sum(1 for n in included if not self.has_inertia[n]))
+        }
+
+    def evaluate_batch(self, material_keys: list, densities: np.ndarray) -> dict:
+        """
+        Totals for many density cases at once.
+
+        Args:
+            material_keys: (M,) material keys, the columns of densities
+            densities: (K, M) densities in kg/m³, one row per case
+
+        Returns:
+            Dictionary of arrays: total_mass_kg (K,), CoG_mm (K, 3),
+            inertia_tensor_kg_m2 (K, 3, 3) and radii_of_gyration_m (K, 3)
+            as (roll, pitch, yaw)
+        """
+        densities = np.atleast_2d(np.asarray(densities, dtype=float))
+        if densities.shape[1] != len(material_keys):
+            raise ValueError(f"Density matrix has {densities.shape[1]} columns, "
+                             f"expected {len(material_keys)} ({', '.join(material_keys)})")
+        rho = self._component_densities(material_keys, densities)
+        masses = rho * self.volume_m3
+        total, cog, inertia, radii = _aggregate(masses, rho, self.positions, self.unit_inertia)
+        return {
+            "total_mass_kg": total,
+            "CoG_mm": cog,
+            "inertia_tensor_kg_m2": inertia,
+            "radii_of_gyration_m": radii[:, [1, 0, 2]]
+        }
+
+
+def compute_mass_properties(records: list, materials: dict) -> dict:
+    """
+    Mass, center of gravity and inertia tensor of a design.
+
+    Args:
+        records: Geometry index records (see geometry_index.design_objects)
+        materials: Material definitions by key ("materials" of the
+                   material JSON), each with name and density_kg_m3
+
+    Returns:
+        Dictionary with:
+        - total_mass_kg, weight_N, total_volume_liters
+        - CoG: {"x", "y", "z"} center of gravity in mm
+        - inertia_tensor_kg_m2: 3x3 inertia tensor about the CoG (world axes)
+        - radii_of_gyration_m: {"roll", "pitch", "yaw"}
+        - materials: {key: {mass_kg, volume_liters}}
+        - components: Per-component name, material, mass, volume and CoG
+        - point_mass_components: Number of components without inertia
+    """
+    return VolumeTable(records).evaluate(materials)
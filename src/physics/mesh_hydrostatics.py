@@ -0,0 +1,394 @@
+#!/usr/bin/env python3
+"""
+Mesh-based hydrostatics - submerged volume and centroid from triangle meshes.
+
+The exact (BREP) engine in center_of_buoyancy.py intersects every hull shape
+with a box below the water plane (an OCC boolean) at every pose. This module
+is a faster alternative: each hull shape is tessellated once into NumPy
+vertex/face arrays, and each pose only transforms the vertices and clips the
+triangles against the water plane.
+
+The submerged volume and its centroid follow from the divergence theorem.
+With the water plane shifted to z=0, the surface integrals
+
+    V    = ∮ z n_z dA
+    ∫x dV = ∮ x z n_z dA
+    ∫y dV = ∮ y z n_z dA
+    ∫z dV = ∮ z²/2 n_z dA
+
+all vanish on the water plane itself, so the cap that closes the submerged
+part of the mesh never has to be built: summing over the clipped triangles
+is enough.
+
+The clipped triangle edges that lie on the water plane form the boundary of
+that cap (the waterplane area). Its area, first and second moments follow
+from Green's theorem over those edges and are returned alongside the volume;
+they give the hydrostatic derivatives (see hydrostatic_derivatives.py).
+
+submerged_properties_batch() evaluates many poses of the same mesh at once:
+the triangles of all poses are clipped together and the per-pose sums are
+gathered with np.bincount.
+
+Accuracy depends on the tessellation tolerance (maximum deviation of the
+mesh from the true surface); see compare_engines() in
+src/physics/__main__.py for a tolerance report against the BREP engine.
+
+Usage:
+    from src.physics.mesh_hydrostatics import tessellate_shape, submerged_properties
+
+    vertices, faces = tessellate_shape(shape, tolerance=0.1)
+    world = transform_vertices(vertices, z_displacement=-300, pitch_deg=0,
+                               roll_deg=5, rotation_center=(0, 0, 0))
+    result = submerged_properties(world, faces)
+"""
+
+import math
+import numpy as np
+
+
+# Default tessellation tolerance (maximum surface deviation in mm)
+DEFAULT_MESH_TOLERANCE = 0.1
+
+# Largest accepted error of the mesh engine against the BREP engine at the
+# default tessellation tolerance (see compare_engines in src/physics/__main__.py):
+# relative submerged volume and waterplane area, and CoB position in mm
+MESH_VOLUME_REL_TOLERANCE = 0.001
+MESH_WATERPLANE_REL_TOLERANCE = 0.005
+MESH_COB_TOLERANCE_MM = 1.0
+
+
+def tessellate_shape(shape, tolerance: float = DEFAULT_MESH_TOLERANCE):
+    """
+    Tessellate a FreeCAD shape into NumPy vertex and face arrays.
+
+    The triangles are oriented so that their normals point out of the
+    solid (checked via the sign of the enclosed volume).
+
+    Args:
+        shape: The FreeCAD shape (solid) to tessellate
+        tolerance: Maximum deviation of the mesh from the surface in mm
+
+    Returns:
+        Tuple (vertices, faces):
+        - vertices: (N, 3) float array of points in mm
+        - faces: (M, 3) int array of vertex indices
+    """
+    points, facets = shape.tessellate(tolerance)
+
+    vertices = np.array([(p.x, p.y, p.z) for p in points], dtype=float).reshape(-1, 3)
+    faces = np.array(facets, dtype=np.int64).reshape(-1, 3)
+
+    # Ensure outward orientation (enclosed volume must be positive)
+    if len(faces) > 0 and mesh_volume(vertices, faces) < 0:
+        faces = faces[:, ::-1].copy()
+
+    return vertices, faces
+
+
+def merge_meshes(meshes: list) -> tuple:
+    """
+    Concatenate triangle meshes into one (vertices, faces) pair.
+
+    The meshes are not stitched together; clipping and integrating the
+    merged mesh gives the sum of the individual meshes in one pass.
+    """
+    vertices = np.concatenate([v for v, _ in meshes]) if meshes else np.zeros((0, 3))
+    offsets = np.cumsum([0] + [len(v) for v, _ in meshes[:-1]])
+    faces = (np.concatenate([f + offset for (_, f), offset in zip(meshes, offsets)])
+             if meshes else np.zeros((0, 3), dtype=np.int64))
+    return vertices, faces
+
+
+def mesh_volume(vertices: np.ndarray, faces: np.ndarray) -> float:
+    """Signed volume enclosed by a closed triangle mesh in mm³."""
+    tri = vertices[faces]
+    return float(np.einsum('ij,ij->i', tri[:, 0], np.cross(tri[:, 1], tri[:, 2])).sum() / 6.0)
+
+
+def rotation_matrix(pitch_deg: float, roll_deg: float) -> np.ndarray:
+    """
+    Rotation matrix R = Ry(roll) * Rx(pitch) as a NumPy array.
+
+    Same convention as _make_rotation_matrix in center_of_buoyancy.py:
+    pitch about X (positive = bow up), roll about Y (positive = starboard down).
+    """
+    pitch_rad = math.radians(pitch_deg)
+    roll_rad = math.radians(roll_deg)
+
+    cos_p, sin_p = math.cos(pitch_rad), math.sin(pitch_rad)
+    cos_r, sin_r = math.cos(roll_rad), math.sin(roll_rad)
+
+    return np.array([
+        [cos_r,  sin_r * sin_p, sin_r * cos_p],
+        [0.0,    cos_p,         -sin_p],
+        [-sin_r, cos_r * sin_p, cos_r * cos_p]
+    ])
+
+
+def rotation_matrices(pitch_deg: np.ndarray, roll_deg: np.ndarray) -> np.ndarray:
+    """Stack of rotation matrices R = Ry(roll) * Rx(pitch), shape (P, 3, 3)."""
+    pitch_rad = np.radians(np.asarray(pitch_deg, dtype=float))
+    roll_rad = np.radians(np.asarray(roll_deg, dtype=float))
+
+    cos_p, sin_p = np.cos(pitch_rad), np.sin(pitch_rad)
+    cos_r, sin_r = np.cos(roll_rad), np.sin(roll_rad)
+
+    R = np.zeros((len(pitch_rad), 3, 3))
+    R[:, 0, 0] = cos_r
+    R[:, 0, 1] = sin_r * sin_p
+    R[:, 0, 2] = sin_r * cos_p
+    R[:, 1, 1] = cos_p
+    R[:, 1, 2] = -sin_p
+    R[:, 2, 0] = -sin_r
+    R[:, 2, 1] = cos_r * sin_p
+    R[:, 2, 2] = cos_r * cos_p
+    return R
+
+
+def transform_vertices(vertices: np.ndarray, z_displacement: float,
+                       pitch_deg: float, roll_deg: float,
+                       rotation_center) -> np.ndarray:
+    """
+    Apply pitch/roll about rotation_center, then z displacement, to vertices.
+
+    Args:
+        vertices: (N, 3) array of body-frame points in mm
+        z_displacement: Vertical displacement in mm (negative = sink)
+        pitch_deg: Pitch angle in degrees (positive = bow up)
+        roll_deg: Roll angle in degrees (positive = starboard down)
+        rotation_center: (x, y, z) center of rotation in mm
+
+    Returns:
+        (N, 3) array of world-frame points
+    """
+    center = np.asarray(rotation_center, dtype=float)
+    if abs(pitch_deg) > 1e-6 or abs(roll_deg) > 1e-6:
+        world = (vertices - center) @ rotation_matrix(pitch_deg, roll_deg).T + center
+    else:
+        world = vertices.copy()
+    world[:, 2] += z_displacement
+    return world
+
+
+def transform_vertices_batch(vertices: np.ndarray, poses: np.ndarray,
+                             rotation_center) -> np.ndarray:
+    """
+    Transform vertices to world frame for several poses at once.
+
+    Args:
+        vertices: (N, 3) array of body-frame points in mm
+        poses: (P, 3) array of (z_displacement, pitch_deg, roll_deg)
+        rotation_center: (x, y, z) center of rotation in mm
+
+    Returns:
+        (P, N, 3) array of world-frame points
+    """
+    center = np.asarray(rotation_center, dtype=float)
+    R = rotation_matrices(poses[:, 1], poses[:, 2])
+    world = np.einsum('pij,nj->pni', R, vertices - center) + center
+    world[:, :, 2] += poses[:, 0, None]
+    return world
+
+
+def _roll_vertices(tri: np.ndarray, first: np.ndarray) -> np.ndarray:
+    """Cyclically reorder triangle vertices so index `first` comes first."""
+    order = (first[:, None] + np.arange(3)) % 3
+    return np.take_along_axis(tri, order[:, :, None], axis=1)
+
+
+def clip_below_plane(tri: np.ndarray, owner: np.ndarray = None):
+    """
+    Clip triangles to the half-space z < 0, preserving orientation.
+
+    Args:
+        tri: (M, 3, 3) array of triangles (water plane already at z=0)
+        owner: Optional (M,) int array tagging each triangle (e.g. with the
+               pose it belongs to); the tags are carried over to the output
+
+    Returns:
+        Tuple (pieces, segments, piece_owner, segment_owner):
+        - pieces: (K, 3, 3) array of the submerged triangle pieces
+        - segments: (L, 2, 3) array of cut edges on the water plane, oriented
+          counter-clockwise as seen from above (boundary of the waterplane area)
+        - piece_owner, segment_owner: (K,) and (L,) owner tags
+    """
+    if owner is None:
+        owner = np.zeros(len(tri), dtype=np.int64)
+
+    below = tri[:, :, 2] < 0.0
+    n_below = below.sum(axis=1)
+
+    pieces = [tri[n_below == 3]]
+    piece_owner = [owner[n_below == 3]]
+    segments = [np.empty((0, 2, 3))]
+    segment_owner = [np.empty(0, dtype=np.int64)]
+
+    # One vertex below: keep the small triangle at that vertex
+    one = tri[n_below == 1]
+    if len(one):
+        one_owner = owner[n_below == 1]
+        one = _roll_vertices(one, np.argmax(below[n_below == 1], axis=1))
+        a, b, c = one[:, 0], one[:, 1], one[:, 2]
+        ab = a + (b - a) * (a[:, 2] / (a[:, 2] - b[:, 2]))[:, None]
+        ac = a + (c - a) * (a[:, 2] / (a[:, 2] - c[:, 2]))[:, None]
+        pieces.append(np.stack([a, ab, ac], axis=1))
+        piece_owner.append(one_owner)
+        segments.append(np.stack([ac, ab], axis=1))
+        segment_owner.append(one_owner)
+
+    # Two vertices below: keep the quad, split into two triangles
+    two = tri[n_below == 2]
+    if len(two):
+        two_owner = owner[n_below == 2]
+        above_index = np.argmin(below[n_below == 2], axis=1)
+        two = _roll_vertices(two, (above_index + 1) % 3)
+        a, b, c = two[:, 0], two[:, 1], two[:, 2]
+        bc = b + (c - b) * (b[:, 2] / (b[:, 2] - c[:, 2]))[:, None]
+        ca = a + (c - a) * (a[:, 2] / (a[:, 2] - c[:, 2]))[:, None]
+        pieces.append(np.stack([a, b, bc], axis=1))
+        pieces.append(np.stack([a, bc, ca], axis=1))
+        piece_owner.extend([two_owner, two_owner])
+        segments.append(np.stack([ca, bc], axis=1))
+        segment_owner.append(two_owner)
+
+    return (np.concatenate(pieces, axis=0), np.concatenate(segments, axis=0),
+            np.concatenate(piece_owner), np.concatenate(segment_owner))
+
+
+def _waterplane_sums(segments: np.ndarray, owner: np.ndarray, n: int) -> dict:
+    """Per-owner waterplane integrals as (n,) arrays (see waterplane_integrals)."""
+    x0, y0 = segments[:, 0, 0], segments[:, 0, 1]
+    x1, y1 = segments[:, 1, 0], segments[:, 1, 1]
+    cross = x0 * y1 - x1 * y0
+
+    def total(weights, divisor):
+        return np.bincount(owner, weights=weights * cross, minlength=n) / divisor
+
+    return {
+        "area_mm2": total(np.ones_like(cross), 2.0),
+        "moment_x_mm3": total(x0 + x1, 6.0),
+        "moment_y_mm3": total(y0 + y1, 6.0),
+        "xx_mm4": total(x0 * x0 + x0 * x1 + x1 * x1, 12.0),
+        "yy_mm4": total(y0 * y0 + y0 * y1 + y1 * y1, 12.0),
+        "xy_mm4": total(x0 * y1 + 2 * x0 * y0 + 2 * x1 * y1 + x1 * y0, 24.0)
+    }
+
+
+def waterplane_integrals(segments: np.ndarray) -> dict:
+    """
+    Area integrals of the waterplane from its boundary edges (Green's theorem).
+
+    Args:
+        segments: (L, 2, 3) array of counter-clockwise boundary edges
+
+    Returns:
+        Dictionary with (all about the world origin, in mm):
+        - area_mm2: ∫ dA
+        - moment_x_mm3, moment_y_mm3: ∫ x dA, ∫ y dA
+        - xx_mm4, yy_mm4, xy_mm4: ∫ x² dA, ∫ y² dA, ∫ xy dA
+    """
+    sums = _waterplane_sums(segments, np.zeros(len(segments), dtype=np.int64), 1)
+    return {key: float(value[0]) for key, value in sums.items()}
+
+
+def empty_waterplane() -> dict:
+    """Waterplane integrals of a shape that does not cross the water plane."""
+    return {
+        "area_mm2": 0.0,
+        "moment_x_mm3": 0.0,
+        "moment_y_mm3": 0.0,
+        "xx_mm4": 0.0,
+        "yy_mm4": 0.0,
+        "xy_mm4": 0.0
+    }
+
+
+def submerged_properties_batch(vertices: np.ndarray, faces: np.ndarray,
+                               water_level_z: float = 0.0) -> dict:
+    """
+    Compute submerged volume and centroid of a closed mesh at several poses.
+
+    Args:
+        vertices: (P, N, 3) array of world-frame points in mm, one set per pose
+        faces: (M, 3) array of outward-oriented triangles
+        water_level_z: Z coordinate of the water surface (default: 0)
+
+    Returns:
+        Dictionary with (P,) arrays:
+        - volume_mm3: Submerged volume in mm³
+        - CoB: {"x", "y", "z"} centroid of the submerged volume in mm
+               (0 where nothing is submerged)
+        - waterplane: Waterplane integrals (see waterplane_integrals)
+    """
+    n_poses = len(vertices)
+
+    tri = vertices[:, faces].reshape(-1, 3, 3)
+    owner = np.repeat(np.arange(n_poses), len(faces))
+    tri[:, :, 2] -= water_level_z
+
+    # Dry triangles contribute nothing; drop them before clipping
+    wet = tri[:, :, 2].min(axis=1) < 0.0
+    tri, segments, owner, segment_owner = clip_below_plane(tri[wet], owner[wet])
+
+    # z component of the (area-weighted) triangle normal
+    n_z = 0.5 * ((tri[:, 1, 0] - tri[:, 0, 0]) * (tri[:, 2, 1] - tri[:, 0, 1])
+                 - (tri[:, 1, 1] - tri[:, 0, 1]) * (tri[:, 2, 0] - tri[:, 0, 0]))
+
+    x, y, z = tri[:, :, 0], tri[:, :, 1], tri[:, :, 2]
+    sum_x, sum_y, sum_z = x.sum(axis=1), y.sum(axis=1), z.sum(axis=1)
+
+    def total(weights, divisor):
+        return np.bincount(owner, weights=n_z * weights, minlength=n_poses) / divisor
+
+    volume = total(sum_z, 3.0)
+
+    # Exact integrals of bilinear functions over each triangle
+    moment_x = total((x * z).sum(axis=1) + sum_x * sum_z, 12.0)
+    moment_y = total((y * z).sum(axis=1) + sum_y * sum_z, 12.0)
+    moment_z = total((z * z).sum(axis=1) + sum_z * sum_z, 24.0)
+
+    waterplane = _waterplane_sums(segments, segment_owner, n_poses)
+
+    # Poses with (numerically) nothing submerged are reported as empty
+    submerged = volume >= 1e-6
+    safe_volume = np.where(submerged, volume, 1.0)
+    for key in waterplane:
+        waterplane[key] = np.where(submerged, waterplane[key], 0.0)
+
+    return {
+        "volume_mm3": np.where(submerged, volume, 0.0),
+        "CoB": {
+            "x": np.where(submerged, moment_x / safe_volume, 0.0),
+            "y": np.where(submerged, moment_y / safe_volume, 0.0),
+            "z": np.where(submerged, moment_z / safe_volume + water_level_z, 0.0)
+        },
+        "waterplane": waterplane
+    }
+
+
+def submerged_properties(vertices: np.ndarray, faces: np.ndarray,
+                         water_level_z: float = 0.0) -> dict:
+    """
+    Compute the submerged volume and centroid of a closed triangle mesh.
+
+    Args:
+        vertices: (N, 3) array of world-frame points in mm
+        faces: (M, 3) array of outward-oriented triangles
+        water_level_z: Z coordinate of the water surface (default: 0)
+
+    Returns:
+        Dictionary with:
+        - volume_mm3: Submerged volume in mm³
+        - CoB: Centroid of the submerged volume as {"x", "y", "z"} in mm
+        - waterplane: Waterplane integrals (see waterplane_integrals)
+    """
+    if len(faces) == 0 or vertices[:, 2].min() >= water_level_z:
+        return {"volume_mm3": 0.0, "CoB": {"x": 0.0, "y": 0.0, "z": 0.0},
+                "waterplane": empty_waterplane()}
+
+    result = submerged_properties_batch(vertices[None], faces, water_level_z)
+    return {
+        "volume_mm3": float(result["volume_mm3"][0]),
+        "CoB": {axis: float(value[0]) for axis, value in result["CoB"].items()},
+        "waterplane": {key: float(value[0]) for key, value in result["waterplane"].items()}
+    }
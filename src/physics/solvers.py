@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Scalar root finding for the hydrostatic equilibrium searches.
+
+Each function evaluation is a CoB evaluation (an OCC boolean or a mesh clip),
+so the solvers here are built to use as few as possible:
+
+- find_root steps from a good starting point (e.g. the solution at the
+  neighbouring heel angle) until the function changes sign, doubling the
+  step each time, and then hands the bracket to Brent's method.
+- brent combines bisection, secant and inverse quadratic interpolation;
+  for smooth functions it converges superlinearly while never doing worse
+  than bisection.
+
+Usage:
+    from src.physics.solvers import find_root
+
+    root = find_root(f, x0, f(x0), step=50.0, bounds=(-5000, 500), ftol=1.0)
+    # root["x"], root["converged"], root["evaluations"], ...
+"""
+
+import sys
+
+
+# Root location tolerance in the units of x (mm for z displacements)
+DEFAULT_XTOL = 0.01
+
+
+def brent(f, a: float, b: float, fa: float, fb: float,
+          xtol: float = DEFAULT_XTOL, ftol: float = 0.0,
+          max_evaluations: int = 30) -> dict:
+    """
+    Brent's method for a root of f inside a sign-changing bracket [a, b].
+
+    Args:
+        f: Function of one variable
+        a, b: Bracket ends; fa = f(a) and fb = f(b) must differ in sign
+        xtol: Stop when the bracket is narrower than this
+        ftol: Stop when |f(x)| is at most this
+        max_evaluations: Maximum number of calls to f
+
+    Returns:
+        Dictionary with converged, x, fx (f at x) and evaluations (calls to f)
+    """
+    if (fa > 0) == (fb > 0):
+        raise ValueError("brent: f(a) and f(b) must have opposite signs")
+
+    eps = sys.float_info.epsilon
+    c, fc = a, fa
+    d = e = b - a
+    evaluations = 0
+
+    while True:
+        if (fb > 0) == (fc > 0):
+            # Keep the root between b and c
+            c, fc = a, fa
+            d = e = b - a
+        if abs(fc) < abs(fb):
+            # b is the best estimate so far
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+
+        tol = 2.0 * eps * abs(b) + 0.5 * xtol
+        m = 0.5 * (c - b)
+        if abs(m) <= tol or abs(fb) <= ftol:
+            return {"converged": True, "x": b, "fx": fb, "evaluations": evaluations}
+        if evaluations >= max_evaluations:
+            return {"converged": False, "x": b, "fx": fb, "evaluations": evaluations}
+
+        if abs(e) >= tol and abs(fa) > abs(fb):
+            s = fb / fa
+            if a == c:
+                # Secant step
+                p = 2.0 * m * s
+                q = 1.0 - s
+            else:
+                # Inverse quadratic interpolation
+                q = fa / fc
+                r = fb / fc
+                p = s * (2.0 * m * q * (q - r) - (b - a) * (r - 1.0))
+                q = (q - 1.0) * (r - 1.0) * (s - 1.0)
+            if p > 0:
+                q = -q
+            else:
+                p = -p
+            if 2.0 * p < min(3.0 * m * q - abs(tol * q), abs(e * q)):
+                # Interpolation accepted
+                e = d
+                d = p / q
+            else:
+                # Interpolation too slow, bisect
+                d = e = m
+        else:
+            d = e = m
+
+        a, fa = b, fb
+        b += d if abs(d) > tol else (tol if m > 0 else -tol)
+        fb = f(b)
+        evaluations += 1
+
+
+def find_root(f, x0: float, f0: float, step: float, bounds: tuple,
+              ftol: float, xtol: float = DEFAULT_XTOL,
+              max_evaluations: int = 30) -> dict:
+    """
+    Root of a monotonic function near a starting point.
+
+    Steps from x0 by step, doubling it, until f changes sign or a bound is
+    reached, then refines the bracket with Brent's method.
+
+    Args:
+        f: Monotonic function of one variable
+        x0: Starting point, f0 = f(x0)
+        step: First step; its sign must point from x0 towards the root
+        bounds: (low, high) limits of the search
+        ftol: Stop when |f(x)| is at most this
+        xtol: Stop when the root is bracketed this tightly
+        max_evaluations: Maximum number of calls to f, including f(x0)
+
+    Returns:
+        Dictionary with converged, x, fx, evaluations and bracketed (False
+        if f kept its sign up to the bound or the evaluation limit; x is then
+        the last point tried)
+    """
+    low, high = bounds
+    evaluations = 1
+
+    if abs(f0) <= ftol:
+        return {"converged": True, "x": x0, "fx": f0, "evaluations": evaluations,
+                "bracketed": True}
+
+    x_previous, f_previous = x0, f0
+    while True:
+        x = min(max(x_previous + step, low), high)
+        if x == x_previous or evaluations >= max_evaluations:
+            # Stuck at a bound (or out of evaluations) without a sign change
+            return {"converged": False, "x": x_previous, "fx": f_previous,
+                    "evaluations": evaluations, "bracketed": False}
+
+        fx = f(x)
+        evaluations += 1
+        if abs(fx) <= ftol:
+            return {"converged": True, "x": x, "fx": fx, "evaluations": evaluations,
+                    "bracketed": True}
+        if (fx > 0) != (f_previous > 0):
+            break
+
+        x_previous, f_previous = x, fx
+        step *= 2.0
+
+    root = brent(f, x_previous, x, f_previous, fx, xtol, ftol,
+                 max_evaluations - evaluations)
+    root["evaluations"] += evaluations
+    root["bracketed"] = True
+    return root
@@ -0,0 +1 @@
+# Parallel pipeline runner for the required stages of all boats and configurations
@@ -0,0 +1,452 @@
+#!/usr/bin/env python3
+"""
+Pipeline runner - required stages of all boats and configurations in parallel.
+
+Builds the boat x configuration x stage graph from the "required" list of
+every configuration file plus the stages they depend on, and runs it on a
+bounded pool of workers. The stage dependencies are read from the artifact
+rules of the Makefile itself (`make -pn`, see makefile_stages), so the graph
+cannot drift from what make builds. Each job is one `make <stage>` for
+its boat and configuration; a job only starts once the jobs it depends
+on have finished, so make finds every prerequisite up to date and
+concurrent jobs never build the same artifact twice.
+
+A failed job skips the jobs that depend on it and the run keeps going
+with everything else. The output of each job goes to a log file under
+artifact/log/, the tail of which is printed when the job fails. A timing
+summary per job and per stage is printed at the end.
+
+With --memory-limit, jobs are only started while the sum of the
+estimated peak memory of the running jobs (STAGE_MEMORY_MB) stays within
+the limit; a job larger than the whole limit runs alone.
+
+Make variables (ENGINE=mesh, USE_KN=yes, ...) given after the options are
+passed to every job and to `make -pn`, so USE_LOOKUP, USE_HYDROSTATICS and
+USE_KN add the lookup, hydrostatics and kn stages to the graph as make would.
+
+Usage:
+    python3 -m src.pipeline --jobs 4
+    python3 -m src.pipeline --jobs 8 --memory-limit 16000 --boat rp2 ENGINE=mesh
+"""
+
+import sys
+import os
+import re
+import json
+import time
+import argparse
+import subprocess
+import threading
+
+ROOT_DIR = os.path.normpath(os.path.join(os.path.dirname(__file__), '../..'))
+BOAT_DIR = os.path.join(ROOT_DIR, 'constant', 'boat')
+CONFIGURATION_DIR = os.path.join(ROOT_DIR, 'constant', 'configuration')
+LOG_DIR = os.path.join(ROOT_DIR, 'artifact', 'log')
+
+# A rule line of make's database: "targets: prerequisites | order-only"
+RULE_PATTERN = re.compile(r'^([^#\s][^:=]*):(?![:=])\s*(.*)$')
+
+# Rough peak memory per stage in MB, for --memory-limit
+STAGE_MEMORY_MB = {
+    'parameter': 50,
+    'base': 1500,
+    'design': 1500,
+    'color': 800,
+    'mass': 800,
+    'render': 1500,
+    'step': 800,
+    'lookup': 1200,
+    'hydrostatics': 1000,
+    'kn': 1200,
+    'buoyancy': 1000,
+    'gz': 1200,
+    'gzplot': 200,
+}
+
+# Lines of a failed job's log to print
+LOG_TAIL_LINES = 20
+
+
+def discover(directory: str) -> list:
+    """Names of the JSON files of a constant directory, without backups."""
+    return sorted(name[:-len('.json')] for name in os.listdir(directory)
+                  if name.endswith('.json') and not name.startswith('#'))
+
+
+def required_stages(configuration: str) -> list:
+    """The "required" list of a configuration file."""
+    with open(os.path.join(CONFIGURATION_DIR, configuration + '.json')) as f:
+        return json.load(f).get('required', [])
+
+
+def make_rules(boat: str, configuration: str, make_variables: dict) -> dict:
+    """
+    Rules of the Makefile for one boat and configuration, from `make -pn`.
+
+    Returns:
+        Dictionary mapping each target to its normal (not order-only)
+        prerequisites
+
+    Raises:
+        ValueError: make could not read the Makefile
+    """
+    command = ['make', '-pn', '--no-print-directory',
+               f'BOAT={boat}', f'CONFIGURATION={configuration}']
+    command += [f'{name}={value}' for name, value in make_variables.items()]
+    command.append('help')
+    try:
+        process = subprocess.run(command, cwd=ROOT_DIR, capture_output=True, text=True)
+    except OSError as e:
+        raise ValueError(f"cannot run make: {e}")
+    if process.returncode != 0:
+        raise ValueError(f"make -pn failed:\n{process.stderr.strip()}")
+
+    rules = {}
+    for line in process.stdout.splitlines():
+        match = RULE_PATTERN.match(line)
+        if not match or '=' in match.group(2):
+            continue
+        prerequisites = match.group(2).split('|')[0].split()
+        for target in match.group(1).split():
+            rules.setdefault(target, []).extend(prerequisites)
+    return rules
+
+
+def makefile_stages(boat: str, configuration: str, make_variables: dict) -> tuple:
+    """
+    Stage dependencies and boat-level stages as the Makefile defines them.
+
+    A stage is a phony target with prerequisites in the artifact directory.
+    Each artifact belongs to the stage named in its file name
+    (boat[.configuration].stage.ext), or else to the only stage that lists
+    it (the gz.png of gzplot). A stage depends on the owners of the
+    artifacts its own artifacts are built from, following intermediate
+    files that belong to no stage; a stage that only lists the artifact of
+    another stage (render) depends on that stage. A stage is boat-level
+    when none of its artifacts carry the configuration name.
+
+    Args:
+        boat: Any boat, to expand the rules
+        configuration: Any configuration, to expand the rules
+        make_variables: Make variables passed to every job
+
+    Returns:
+        (dependencies, boat_stages): dictionary mapping each stage to the
+        stages it needs first, and the set of boat-level stages
+
+    Raises:
+        ValueError: make could not read the Makefile
+    """
+    rules = make_rules(boat, configuration, make_variables)
+    artifact_dir = make_variables.get('ARTIFACT_DIR', 'artifact').rstrip('/') + '/'
+
+    stage_artifacts = {}
+    for stage in rules.get('.PHONY', []):
+        artifacts = [p for p in rules.get(stage, []) if p.startswith(artifact_dir)]
+        if artifacts:
+            stage_artifacts[stage] = artifacts
+
+    owners = {}
+    for stage, artifacts in stage_artifacts.items():
+        for artifact in artifacts:
+            owners.setdefault(artifact, []).append(stage)
+    for artifact, stages in owners.items():
+        named = [s for s in stages if f'.{s}.' in os.path.basename(artifact)]
+        owners[artifact] = named[0] if named else stages[0]
+
+    def owners_upstream(artifact, stage, seen):
+        found = []
+        for prerequisite in rules.get(artifact, []):
+            if prerequisite in seen or not prerequisite.startswith(artifact_dir):
+                continue
+            seen.add(prerequisite)
+            owner = owners.get(prerequisite)
+            if owner is None:
+                found += owners_upstream(prerequisite, stage, seen)
+            elif owner != stage:
+                found.append(owner)
+        return found
+
+    dependencies = {}
+    for stage, artifacts in stage_artifacts.items():
+        needed = []
+        for artifact in artifacts:
+            if owners[artifact] != stage:
+                needed.append(owners[artifact])
+            else:
+                needed += owners_upstream(artifact, stage, {artifact})
+        dependencies[stage] = list(dict.fromkeys(needed))
+
+    boat_stages = {stage for stage, artifacts in stage_artifacts.items()
+                   if not any(f'.{configuration}.' in os.path.basename(a) for a in artifacts)}
+    return dependencies, boat_stages
+
+
+def build_graph(boats: list, configurations: list, make_variables: dict) -> dict:
+    """
+    Build the job graph for the required stages of all boats and configurations.
+
+    Args:
+        boats: Boat names
+        configurations: Configuration names
+        make_variables: Make variables passed to every job
+
+    Returns:
+        Dictionary mapping (boat, configuration, stage) to the list of jobs
+        it depends on, in the order the jobs were added; the configuration
+        of boat-level stages is None
+
+    Raises:
+        ValueError: unknown required stage, or make could not read the Makefile
+    """
+    dependencies, boat_stages = makefile_stages(boats[0], configurations[0], make_variables)
+    graph = {}
+
+    def job_for(boat, configuration, stage):
+        return (boat, None if stage in boat_stages else configuration, stage)
+
+    def add(boat, configuration, stage):
+        job = job_for(boat, configuration, stage)
+        if job in graph:
+            return
+        if stage not in dependencies:
+            raise ValueError(f"unknown stage '{stage}' required by {configuration}")
+        for dependency in dependencies[stage]:
+            add(boat, configuration, dependency)
+        graph[job] = [job_for(boat, configuration, d) for d in dependencies[stage]]
+
+    for boat in boats:
+        for configuration in configurations:
+            for stage in required_stages(configuration):
+                add(boat, configuration, stage)
+
+    return graph
+
+
+def job_name(job: tuple) -> str:
+    """boat.configuration.stage, or boat.stage for boat-level stages"""
+    return '.'.join(part for part in job if part is not None)
+
+
+def run_job(job: tuple, make_variables: dict) -> tuple:
+    """
+    Run one make stage with its output in a log file.
+
+    Returns:
+        (success, elapsed seconds, log path)
+    """
+    boat, configuration, stage = job
+    os.makedirs(LOG_DIR, exist_ok=True)
+    log_path = os.path.join(LOG_DIR, job_name(job) + '.log')
+    command = ['make', '--no-print-directory', stage, f'BOAT={boat}']
+    if configuration is not None:
+        command.append(f'CONFIGURATION={configuration}')
+    command += [f'{name}={value}' for name, value in make_variables.items()]
+
+    start = time.time()
+    with open(log_path, 'w') as log:
+        try:
+            returncode = subprocess.call(command, cwd=ROOT_DIR, stdout=log,
+                                         stderr=subprocess.STDOUT)
+        except OSError as e:
+            log.write(f"ERROR: {e}\n")
+            returncode = 1
+    return returncode == 0, time.time() - start, log_path
+
+
+def log_tail(log_path: str, lines: int = LOG_TAIL_LINES) -> str:
+    """Last lines of a job log."""
+    with open(log_path, errors='replace') as f:
+        return ''.join(f.readlines()[-lines:])
+
+
+def run_graph(graph: dict, jobs: int, make_variables: dict,
+              memory_limit_mb: float = None, verbose: bool = True) -> dict:
+    """
+    Run the job graph on up to `jobs` concurrent workers.
+
+    Jobs whose dependencies failed are skipped; all other jobs run.
+
+    Returns:
+        Dictionary mapping each job to {'status': 'ok' | 'failed' | 'skipped',
+        'elapsed_s': seconds}
+    """
+    results = {}
+    pending = list(graph)
+    running = {}
+    condition = threading.Condition()
+
+    def worker(job):
+        # Whatever happens, the job is recorded and the scheduler woken up,
+        # otherwise it would wait for this job forever
+        success, elapsed, log_path = False, 0.0, None
+        start = time.time()
+        try:
+            success, elapsed, log_path = run_job(job, make_variables)
+        except Exception as e:
+            elapsed = time.time() - start
+            print(f"ERROR: {job_name(job)}: {e}", file=sys.stderr, flush=True)
+        finally:
+            with condition:
+                running.pop(job, None)
+                results[job] = {'status': 'ok' if success else 'failed', 'elapsed_s': elapsed}
+                try:
+                    if verbose:
+                        mark = '✓' if success else '✗'
+                        print(f"{mark} {job_name(job)} ({elapsed:.1f} s)", flush=True)
+                        if not success and log_path is not None:
+                            print(log_tail(log_path), end='', flush=True)
+                except OSError as e:
+                    print(f"ERROR: {job_name(job)}: cannot read log: {e}",
+                          file=sys.stderr, flush=True)
+                finally:
+                    condition.notify()
+
+    def can_start(job):
+        stage = job[2]
+        if len(running) >= jobs:
+            return False
+        if memory_limit_mb is not None and running:
+            used = sum(STAGE_MEMORY_MB.get(r[2], 0) for r in running)
+            if used + STAGE_MEMORY_MB.get(stage, 0) > memory_limit_mb:
+                return False
+        return True
+
+    with condition:
+        while pending or running:
+            progressed = True
+            while progressed:
+                progressed = False
+                for job in list(pending):
+                    states = [results.get(d, {}).get('status') for d in graph[job]]
+                    if any(s in ('failed', 'skipped') for s in states):
+                        pending.remove(job)
+                        results[job] = {'status': 'skipped', 'elapsed_s': 0.0}
+                        if verbose:
+                            print(f"- {job_name(job)} skipped", flush=True)
+                        progressed = True
+                    elif all(s == 'ok' for s in states) and can_start(job):
+                        pending.remove(job)
+                        running[job] = threading.Thread(target=worker, args=(job,), daemon=True)
+                        running[job].start()
+                        if verbose:
+                            print(f"  {job_name(job)} started", flush=True)
+                        progressed = True
+            if running:
+                condition.wait()
+
+    return results
+
+
+def print_summary(results: dict, wall_s: float):
+    """Print the time of every job, the total per stage and the failures."""
+    print("")
+    print("Timing summary")
+    print(f"  {'job':<40} {'status':<8} {'time':>9}")
+    for job, result in sorted(results.items(), key=lambda item: -item[1]['elapsed_s']):
+        print(f"  {job_name(job):<40} {result['status']:<8} {result['elapsed_s']:8.1f}s")
+
+    print("")
+    print(f"  {'stage':<16} {'jobs':>5} {'total':>10}")
+    stages = {}
+    for (_, _, stage), result in results.items():
+        count, total = stages.get(stage, (0, 0.0))
+        stages[stage] = (count + 1, total + result['elapsed_s'])
+    for stage, (count, total) in sorted(stages.items(), key=lambda item: -item[1][1]):
+        print(f"  {stage:<16} {count:>5} {total:9.1f}s")
+
+    busy_s = sum(result['elapsed_s'] for result in results.values())
+    counts = {status: sum(1 for r in results.values() if r['status'] == status)
+              for status in ('ok', 'failed', 'skipped')}
+    print("")
+    print(f"  {counts['ok']} ok, {counts['failed']} failed, {counts['skipped']} skipped")
+    print(f"  {wall_s:.1f} s wall time for {busy_s:.1f} s of jobs "
+          f"({busy_s / wall_s if wall_s > 0 else 0.0:.1f}x)")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Run the required stages of all boats and configurations in parallel',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1,
+                        help='Maximum number of concurrent jobs (default: number of CPUs)')
+    parser.add_argument('--memory-limit', type=float,
+                        help='Memory budget in MB for the estimated peak memory of the '
+                             'running jobs (default: no limit)')
+    parser.add_argument('--boat', nargs='+',
+                        help='Boats to run (default: all in constant/boat)')
+    parser.add_argument('--configuration', nargs='+',
+                        help='Configurations to run (default: all in constant/configuration)')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='Print the jobs and their dependencies without running them')
+    parser.add_argument('--quiet', action='store_true',
+                        help='Suppress progress output')
+    parser.add_argument('variables', nargs='*', metavar='NAME=VALUE',
+                        help='Make variables passed to every job')
+
+    args = parser.parse_args()
+
+    # --boat and --configuration also take the make variables that follow them
+    for option in ('boat', 'configuration'):
+        names = getattr(args, option)
+        if names:
+            args.variables = [n for n in names if '=' in n] + args.variables
+            setattr(args, option, [n for n in names if '=' not in n] or None)
+
+    if args.jobs < 1:
+        print("ERROR: --jobs must be at least 1", file=sys.stderr)
+        sys.exit(1)
+
+    make_variables = {}
+    for variable in args.variables:
+        name, sep, value = variable.partition('=')
+        if not sep or not name:
+            print(f"ERROR: Make variables must be NAME=VALUE: {variable}", file=sys.stderr)
+            sys.exit(1)
+        if name in ('BOAT', 'CONFIGURATION'):
+            print(f"ERROR: Use --{name.lower()} instead of {name}=", file=sys.stderr)
+            sys.exit(1)
+        make_variables[name] = value
+
+    boats = args.boat or discover(BOAT_DIR)
+    configurations = args.configuration or discover(CONFIGURATION_DIR)
+    for name, directory in [(b, BOAT_DIR) for b in boats] + \
+                           [(c, CONFIGURATION_DIR) for c in configurations]:
+        if not os.path.exists(os.path.join(directory, name + '.json')):
+            print(f"ERROR: Not found: {os.path.join(directory, name + '.json')}", file=sys.stderr)
+            sys.exit(1)
+
+    try:
+        graph = build_graph(boats, configurations, make_variables)
+    except ValueError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    verbose = not args.quiet
+
+    if args.dry_run:
+        for job, dependencies in graph.items():
+            after = ', '.join(job_name(d) for d in dependencies)
+            print(f"{job_name(job)}" + (f" <- {after}" if after else ""))
+        return
+
+    if verbose:
+        print(f"Running {len(graph)} jobs for {len(boats)} boats x "
+              f"{len(configurations)} configurations on {args.jobs} workers"
+              + (f" within {args.memory_limit:.0f} MB" if args.memory_limit else ""))
+
+    start = time.time()
+    results = run_graph(graph, args.jobs, make_variables, args.memory_limit, verbose)
+    wall_s = time.time() - start
+
+    if verbose:
+        print_summary(results, wall_s)
+
+    if any(result['status'] != 'ok' for result in results.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()